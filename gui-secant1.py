@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import sympy as sp
+from secant import ENGINES, ZERO_DIVISOR, make_function, profiling
+from secant.plotting import ConvergencePlot
+from secant.live import LiveSolver
+from secant.precision import format_precise, needs_escalation, solve_precise
+from secant.scheduler import SolveScheduler
+from secant.widgets import (Debouncer, VirtualTable, prewarm, report_startup,
+                            show_stats_panel)
 
 class SecantMethodApp:
+    # Jumlah iterate terakhir yang ditandai di atas kurva f(x)
+    FUNCTION_POINTS = 500
+
     def __init__(self, master):
         self.master = master
         master.title("Metode Secant - Pencarian Akar Persamaan")
@@ -50,166 +56,236 @@ class SecantMethodApp:
         self.max_iter_entry.grid(row=4, column=1, sticky='ew', pady=5)
         self.max_iter_entry.insert(0, "100")
 
+        # Pilihan metode: secant, hybrid (secant + bracket/bisection), newton/halley (turunan simbolik)
+        ttk.Label(main_frame, text="Metode:").grid(row=5, column=0, sticky='w', pady=5)
+        self.method_combo = ttk.Combobox(main_frame, width=17, state='readonly',
+                                         values=tuple(ENGINES))
+        self.method_combo.grid(row=5, column=1, sticky='w', pady=5)
+        self.method_combo.set('secant')
+
+        # Mode hitung otomatis: hitung ulang setiap kali masukan berubah
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(main_frame, text="Hitung Otomatis", variable=self.live_var,
+                        command=self.live_update).grid(row=5, column=2, sticky='w', pady=5)
+
+        # Error pada sumbu log: ekor konvergensi superlinear tetap terlihat
+        self.log_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(main_frame, text="Error Skala Log", variable=self.log_var,
+                        command=self.update_error_scale).grid(row=4, column=2, sticky='w', pady=5)
+
         # Tombol hitung
         calculate_button = ttk.Button(main_frame, text="Hitung", command=self.calculate_secant)
-        calculate_button.grid(row=5, column=0, columnspan=2, pady=10)
+        calculate_button.grid(row=6, column=0, columnspan=2, pady=10)
+
+        # Cari semua akar di interval [x0, x1] sekaligus
+        scan_button = ttk.Button(main_frame, text="Cari Semua Akar", command=self.scan_roots)
+        scan_button.grid(row=6, column=2, pady=10)
 
         # Frame untuk hasil dan grafik
         self.result_frame = ttk.Frame(main_frame)
-        self.result_frame.grid(row=6, column=0, columnspan=3, sticky='nsew')
+        self.result_frame.grid(row=7, column=0, columnspan=3, sticky='nsew')
 
         # Konfigurasi grid
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(6, weight=1)
-
-    def create_function(self, func_str):
+        main_frame.rowconfigure(7, weight=1)
+
+        # F12: panel statistik profiling (parse, compile, iterate, table, plot)
+        master.bind('<F12>', lambda event: show_stats_panel(master))
+
+        # Widget hasil dibuat saat perhitungan pertama
+        self.table = None
+        self.result_label = None
+        self.plot = None
+
+        # Satu perhitungan di latar belakang; permintaan terakhir yang menang
+        self.scheduler = SolveScheduler(master, interval=10)
+        # Hasil terakhir diingat: toleransi yang diperketat melanjutkan iterasi
+        self.solver = LiveSolver('math')
+
+        # Ketikan di-debounce agar hanya masukan terakhir yang dihitung
+        self.debouncer = Debouncer(master, 30, self.live_update)
+        self.debouncer.bind(self.function_entry, self.x0_entry, self.x1_entry,
+                            self.tolerance_entry, self.max_iter_entry)
+        self.debouncer.bind(self.method_combo, sequence='<<ComboboxSelected>>')
+
+        # sympy dan matplotlib dimuat di latar setelah jendela tampil
+        prewarm(master)
+
+    def live_update(self):
+        if self.live_var.get():
+            self.calculate_secant(live=True)
+
+    def update_error_scale(self):
+        if self.plot is not None:
+            self.plot.set_yscale(1, 'log' if self.log_var.get() else 'linear')
+            self.plot.draw()
+
+    def build_results(self):
+        columns = ('Iterasi', 'x0', 'x1', 'x2', 'f(x2)', 'Error')
+        self.table = VirtualTable(self.result_frame, columns=columns)
+        self.table.pack(expand=True, fill='both', side=tk.TOP)
+
+        self.result_label = ttk.Label(self.result_frame, text="", font=('Arial', 12, 'bold'))
+        self.result_label.pack(pady=10)
+
+        self.plot = ConvergencePlot(self.result_frame, [
+            {'title': 'Perubahan Nilai x', 'xlabel': 'Iterasi', 'ylabel': 'Nilai x',
+             'line': {'marker': 'o'}},
+            {'title': 'Error vs Iterasi', 'xlabel': 'Iterasi', 'ylabel': 'Error',
+             'line': {'marker': 'o', 'color': 'red'},
+             'yscale': 'log' if self.log_var.get() else 'linear'},
+            {'title': 'Fungsi f(x)', 'xlabel': 'x', 'ylabel': 'f(x)',
+             'line': {'marker': 'o', 'linestyle': '', 'color': 'red', 'label': 'Iterasi'},
+             'overlay': {'color': 'tab:blue', 'label': 'f(x)'}, 'legend': True,
+             'decimate': False},
+        ], figsize=(8, 8))
+        self.plot.pack(expand=True, fill='both')
+
+    def create_function(self, func_str, backend='math'):
         """
         Membuat fungsi lambda dari string ekspresi matematis
+        ('math' untuk evaluasi skalar, 'numpy' untuk array)
         """
         try:
-            # Menggunakan sympy untuk parsing yang lebih aman
-            x = sp.Symbol('x')
-            expr = sp.sympify(func_str)
-            # Konversi ke fungsi numerik
-            return sp.lambdify(x, expr, 'numpy')
-        except Exception as e:
-            messagebox.showerror("Error", f"Kesalahan parsing fungsi: {e}")
+            return make_function(func_str, backend)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
             return None
 
-    def calculate_secant(self):
+    def scan_roots(self):
+        # NumPy baru dimuat saat pemindaian pertama
+        from secant.scan import find_roots
+
         try:
-            # Ambil input
             func_str = self.function_entry.get()
-            x0 = float(self.x0_entry.get())
-            x1 = float(self.x1_entry.get())
-            tolerance = float(self.tolerance_entry.get())
-            max_iterations = int(self.max_iter_entry.get())
+            a = float(self.x0_entry.get())
+            b = float(self.x1_entry.get())
 
-            # Buat fungsi
-            f = self.create_function(func_str)
+            f = self.create_function(func_str, 'numpy')
             if f is None:
                 return
 
-            # Bersihkan frame hasil sebelumnya
-            for widget in self.result_frame.winfo_children():
-                widget.destroy()
-
-            # List untuk menyimpan iterasi
-            iterations = []
-            x_values = [x0, x1]
-            error_values = []
-
-            # Proses metode secant
-            iteration = 0
-            while iteration < max_iterations:
-                # Hitung nilai fungsi
-                fx0 = f(x0)
-                fx1 = f(x1)
-
-                # Cek kondisi pembagi nol dengan toleransi
-                if abs(fx1 - fx0) < tolerance:
-                    messagebox.showwarning("Peringatan", "Pembagi mendekati nol!")
-                    break
-
-                # Rumus secant
-                try:
-                    x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Kesalahan perhitungan: {e}")
-                    break
-
-                # Hitung nilai fungsi untuk x2
-                fx2 = f(x2)
-
-                # Hitung error
-                error = abs(x2 - x1)
-                
-                # Simpan data iterasi
-                iterations.append({
-                    'iteration': iteration,
-                    'x0': x0,
-                    'x1': x1,
-                    'x2': x2,
-                    'f(x2)': fx2,
-                    'error': error
-                })
-
-                x_values.append(x2)
-                error_values.append(error)
-
-                # Kriteria konvergensi
-                if error < tolerance or abs(fx2) < tolerance:
-                    break
-
-                # Persiapan iterasi berikutnya
-                x0, x1 = x1, x2
-                iteration += 1
-
-            # Tampilkan tabel hasil
-            columns = ('Iterasi', 'x0', 'x1', 'x2', 'f(x2)', 'Error')
-            tree = ttk.Treeview(self.result_frame, columns=columns, show='headings')
-            
-            for col in columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=100, anchor='center')
-            
-            for row in iterations:
-                tree.insert('', 'end', values=(
-                    row['iteration'], 
-                    f"{row['x0']:.6f}", 
-                    f"{row['x1']:.6f}", 
-                    f"{row['x2']:.6f}", 
-                    f"{row['f(x2)']:.6f}", 
-                    f"{row['error']:.6e}"
-                ))
-            
-            tree.pack(expand=True, fill='both', side=tk.TOP)
-
-            # Tambahkan label hasil akhir
-            if iterations:
-                final_result = iterations[-1]
-                result_label = ttk.Label(
-                    self.result_frame, 
-                    text=f"Akar yang ditemukan: x = {final_result['x2']:.6f}\n"
-                         f"Nilai fungsi: f(x) = {final_result['f(x2)']:.6e}\n"
-                         f"Error: {final_result['error']:.6e}",
-                    font=('Arial', 12, 'bold')
-                )
-                result_label.pack(pady=10)
-
-            # Buat subplot
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6))
-            
-            # Plot x2 vs iterasi
-            ax1.plot(range(len(x_values)), x_values, marker='o')
-            ax1.set_title('Perubahan Nilai x')
-            ax1.set_xlabel('Iterasi')
-            ax1.set_ylabel('Nilai x')
-            ax1.grid(True)
-
-            # Plot error vs iterasi
-            ax2.plot(range(len(error_values)), error_values, marker='o', color='red')
-            ax2.set_title('Error vs Iterasi')
-            ax2.set_xlabel('Iterasi')
-            ax2.set_ylabel('Error')
-            ax2.grid(True)
-
-            plt.tight_layout()
-
-            # Embed plot di Tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.result_frame)
-            canvas_widget = canvas.get_tk_widget()
-            canvas_widget.pack(expand=True, fill='both')
-            canvas.draw()
-
+            result = find_roots(f, min(a, b), max(a, b))
+            if result.roots.size == 0:
+                messagebox.showinfo("Hasil", f"Tidak ada akar yang ditemukan di [{min(a, b)}, {max(a, b)}]")
+                return
+            lines = [f"x = {root:.10f}   f(x) = {fx:.3e}" for root, fx in zip(result.roots, result.fvals)]
+            messagebox.showinfo("Hasil", f"Ditemukan {result.roots.size} akar di "
+                                         f"[{min(a, b)}, {max(a, b)}]:\n\n" + "\n".join(lines))
         except ValueError as e:
             messagebox.showerror("Error", f"Masukan tidak valid: {e}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+
+    def calculate_secant(self, live=False):
+        try:
+            # Ambil input di thread Tk; thread pekerja tidak menyentuh widget
+            func_str = self.function_entry.get()
+            x0 = float(self.x0_entry.get())
+            x1 = float(self.x1_entry.get())
+            tolerance = float(self.tolerance_entry.get())
+            max_iterations = int(self.max_iter_entry.get())
+        except ValueError as e:
+            # Di mode otomatis masukan yang belum lengkap (mis. "1e-") diabaikan
+            if not live:
+                messagebox.showerror("Error", f"Masukan tidak valid: {e}")
+            return
+        method = self.method_combo.get()
+
+        def job(token):
+            # Fungsi (beserta turunannya untuk newton/halley) diambil dari cache;
+            # callback token menghentikan job yang digantikan
+            if needs_escalation(tolerance):
+                # Toleransi di bawah batas float64: iterasi terakhir dilanjutkan di mpmath
+                result = solve_precise(func_str, x0, x1, tolerance, max_iterations,
+                                       ftol=tolerance, divisor_tol=tolerance,
+                                       callback=token.callback, method=method)
+            else:
+                with profiling.stage('iterate'):
+                    result = self.solver.solve(func_str, x0, x1, tolerance, max_iterations,
+                                               method, ftol=tolerance, divisor_tol=tolerance,
+                                               callback=token.callback)
+                profiling.count('evaluations', result.evaluations)
+            # Kurva f(x) (lambdify NumPy) dikompilasi di sini, bukan di thread Tk
+            return result, make_function(func_str, 'numpy')
+
+        # Klik (atau ketikan) berikutnya membatalkan perhitungan yang masih berjalan
+        self.scheduler.submit(job, lambda done: self.show_result(*done, live=live,
+                                                                 tolerance=tolerance),
+                              lambda error: self.show_error(error, live), self.show_progress)
+
+    def show_progress(self, step, x, fx, error):
+        if self.result_label is not None:
+            self.result_label.config(text=f"Menghitung... iterasi {step}, error = {error:.3e}")
+
+    def show_error(self, error, live=False):
+        if live:
+            # Tanpa dialog saat mengetik; pesan cukup ditampilkan di label hasil
+            if self.result_label is not None:
+                self.result_label.config(text=f"Error: {error}")
+            return
+        messagebox.showerror("Error", str(error))
+
+    def show_result(self, result, overlay=None, live=False, tolerance=None):
+        if result.status == ZERO_DIVISOR and not live:
+            messagebox.showwarning("Peringatan", "Pembagi mendekati nol!")
+
+        # Riwayat kolom dibaca langsung tanpa disalin ke list/dict
+        history = result.history
+        x_values = history.x_values()
+        error_values = history.column('error')
+
+        # Tabel, label, dan grafik dibuat sekali lalu diperbarui
+        if self.table is None:
+            self.build_results()
+
+        def table_row(i):
+            step, a, b, c, fc, error = history[i]
+            return (step - 1, f"{a:.6f}", f"{b:.6f}", f"{c:.6f}", f"{fc:.6f}", f"{error:.6e}")
+
+        with profiling.stage('table'):
+            self.table.set_rows(len(history), table_row)
+
+        # Tampilkan hasil akhir
+        if len(history):
+            _, _, _, root, froot, error = history[-1]
+            text = (f"Akar yang ditemukan: x = {root:.6f}\n"
+                    f"Nilai fungsi: f(x) = {froot:.6e}\n"
+                    f"Error: {error:.6e}")
+            if result.converged and tolerance is not None and needs_escalation(tolerance):
+                # Akar mpmath: tampilkan semua digit yang dijamin toleransi
+                text += f"\nAkar presisi tinggi: x = {format_precise(result.root, tolerance)}"
+            self.result_label.config(text=text)
+        else:
+            self.result_label.config(text="")
+
+        # Perbarui data grafik di tempat
+        with profiling.stage('plot'):
+            self.plot.set_data(0, range(len(x_values)), x_values)
+            self.plot.set_data(1, range(len(error_values)), error_values)
+            self.plot_function(overlay, history)
+            self.plot.draw()
+
+    def plot_function(self, overlay, history):
+        # Iterate di atas kurva f(x) pada interval yang mereka jelajahi;
+        # kurva berasal dari satu evaluasi NumPy, berapa pun panjang riwayatnya
+        import numpy as np
+
+        x = np.asarray(history.x_values())
+        finite = np.isfinite(x)
+        if overlay is None or not finite.any():
+            self.plot.set_data(2, [], [])
+            self.plot.set_overlay(2, [], [])
+            return
+        a, b = x[finite].min(), x[finite].max()
+        pad = 0.05 * (b - a) or 0.5
+        # Hanya iterate terakhir yang ditandai; sisanya menumpuk di dekat akar
+        tail = slice(-self.FUNCTION_POINTS, None)
+        self.plot.set_data(2, history.column('x2')[tail], history.column('fx')[tail])
+        self.plot.plot_function(2, overlay, a - pad, b + pad)
 
 def main():
     root = tk.Tk()
     app = SecantMethodApp(root)
+    report_startup(root)
     root.mainloop()
 
 if __name__ == "__main__":
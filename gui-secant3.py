@@ -1,27 +1,26 @@
 import tkinter as tk
 from tkinter import ttk
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import sympy as sp
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-import time
-import threading
+from tkinter import messagebox
+from secant import make_function, profiling, secant
+from secant.live import LiveSolver
+from secant.plotting import ConvergencePlot
+from secant.scheduler import SolveScheduler
+from secant.widgets import (Debouncer, VirtualTable, prewarm, report_startup,
+                            show_stats_panel)
 
-def secant_method(f, x0, x1, tol, max_iter=100):
-    x_values, errors = [x0, x1], []
-    for _ in range(max_iter):
-        fx0, fx1 = f(x0), f(x1)
-        if abs(fx1 - fx0) < tol:
-            break
-        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
-        error = abs(x2 - x1)
-        x_values.append(x2)
-        errors.append(error)
-        if error < tol:
-            break
-        x0, x1 = x1, x2
+def secant_method(f, x0, x1, tol, max_iter=100, callback=None, solver=None):
+    # With a LiveSolver, tightening only the tolerance continues from the last root
+    with profiling.stage('iterate'):
+        if solver is None:
+            result = secant(f, x0, x1, tol, max_iter, divisor_tol=tol, callback=callback)
+        else:
+            result = solver.solve(f, x0, x1, tol, max_iter, divisor_tol=tol, callback=callback)
+    profiling.count('evaluations', result.evaluations)
+    # Compact array views instead of per-step Python lists
+    x_values = result.history.x_values()
+    errors = result.history.column('error')
     return x_values, errors
 
 class SecantApp:
@@ -82,11 +81,23 @@ class SecantApp:
                                     bootstyle="success-outline")
         self.calc_button.pack(side=tk.LEFT, padx=5)
         
+        # Auto mode: recalculate (debounced) whenever a parameter changes
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Hitung Otomatis", variable=self.live_var,
+                        command=self.live_update, bootstyle="round-toggle").pack(side=tk.LEFT, padx=5)
+        
         # Progress bar
         self.progress = ttk.Progressbar(main_frame, orient=tk.HORIZONTAL, 
                                        length=300, mode='determinate', 
                                        bootstyle="info-striped")
         self.progress.pack(pady=10)
+        self.progress_label = ttk.Label(main_frame, text="", font=("Arial", 9))
+        self.progress_label.pack()
+        
+        # Background solver: one job at a time, a new click cancels the old one,
+        # results come back to the Tk thread via after()
+        self.scheduler = SolveScheduler(master, interval=10)
+        self.solver = LiveSolver()
         
         # Result frame
         result_frame = ttk.LabelFrame(main_frame, text="Hasil", bootstyle="info")
@@ -111,90 +122,104 @@ class SecantApp:
         self.table_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.table_tab, text="Tabel Iterasi")
         
-        # Initialize table and graph
+        # The table is cheap; the graph (matplotlib) is built once it has been
+        # imported in the background after the window is shown
         self.init_table()
-        self.init_graph()
+        self.plot = None
+        prewarm(master, done=self.init_graph)
+        
+        # F12: profiling statistics panel (iterate, table, plot)
+        master.bind('<F12>', lambda event: show_stats_panel(master))
+        
+        # Keystrokes are debounced so only the latest input is solved
+        self.debouncer = Debouncer(master, 30, self.live_update)
+        self.debouncer.bind(self.x0_entry, self.x1_entry, self.tol_entry, self.max_iter_entry)
     
     def init_table(self):
-        # Create treeview for table
-        self.tree = ttk.Treeview(self.table_tab, columns=('Iterasi', 'x_i', 'x_i+1', 'Error'), show='headings')
-        
-        # Define headings
-        self.tree.heading('Iterasi', text='Iterasi')
-        self.tree.heading('x_i', text='xᵢ')
-        self.tree.heading('x_i+1', text='xᵢ₊₁')
-        self.tree.heading('Error', text='Error')
-        
-        # Set column widths
-        self.tree.column('Iterasi', width=80, anchor=tk.CENTER)
-        self.tree.column('x_i', width=150, anchor=tk.CENTER)
-        self.tree.column('x_i+1', width=150, anchor=tk.CENTER)
-        self.tree.column('Error', width=150, anchor=tk.CENTER)
-        
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(self.table_tab, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        # Create virtualized treeview for table (only visible rows are materialized)
+        self.table = VirtualTable(self.table_tab,
+                                  columns=('Iterasi', 'x_i', 'x_i+1', 'Error'),
+                                  headings=('Iterasi', 'xᵢ', 'xᵢ₊₁', 'Error'),
+                                  widths=(80, 150, 150, 150),
+                                  anchor=tk.CENTER)
+        self.table.pack(fill=tk.BOTH, expand=True)
     
     def init_graph(self):
-        # Create figure for plotting
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.ax.set_title('Perkembangan Nilai xᵢ₊₁ pada Setiap Iterasi')
-        self.ax.set_xlabel('Iterasi')
-        self.ax.set_ylabel('Nilai xᵢ₊₁')
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        
-        # Create canvas for the figure
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_tab)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        if self.plot is not None:
+            return
+        # Create figure, line and canvas once; later runs only update the data
+        self.plot = ConvergencePlot(self.graph_tab, [
+            {'title': 'Perkembangan Nilai xᵢ₊₁ pada Setiap Iterasi',
+             'xlabel': 'Iterasi', 'ylabel': 'Nilai xᵢ₊₁',
+             'line': {'color': 'b', 'marker': 'o', 'linestyle': '-', 'markersize': 6,
+                      'linewidth': 1.5, 'label': 'xᵢ₊₁'},
+             'grid': {'linestyle': '--', 'alpha': 0.6}, 'legend': True},
+        ], figsize=(8, 4))
+        self.ax = self.plot.axes[0]
+        
+        # Annotation for the last point, moved instead of recreated
+        self.annotation = self.ax.annotate('', xy=(0, 0), xytext=(10, -20),
+                                           textcoords='offset points',
+                                           bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                                           arrowprops=dict(arrowstyle='->'))
+        self.annotation.set_visible(False)
+        self.plot.animate(self.annotation)
+        self.plot.pack(fill=tk.BOTH, expand=True)
     
-    def start_calculation(self):
-        # Disable button during calculation
-        self.calc_button.config(state=tk.DISABLED)
-        self.progress['value'] = 0
-        
-        # Start calculation in a separate thread
-        threading.Thread(target=self.calculate, daemon=True).start()
+    def live_update(self):
+        if self.live_var.get():
+            self.start_calculation(live=True)
     
-    def calculate(self):
+    def start_calculation(self, live=False):
         try:
-            # Get parameters from entries
+            # Read entries on the Tk thread; the worker never touches widgets
             x0 = float(self.x0_entry.get())
             x1 = float(self.x1_entry.get())
             tol = float(self.tol_entry.get())
             max_iter = int(self.max_iter_entry.get())
-            
-            # Define the function
-            x = sp.Symbol('x')
-            f_expr = 2*x**3 - x - sp.exp(-x)
-            f = sp.lambdify(x, f_expr, "numpy")
-            
-            # Simulate progress (for demonstration)
-            for i in range(10):
-                time.sleep(0.1)
-                self.progress['value'] += 10
-                self.master.update()
-            
-            # Run secant method
-            x_values, errors = secant_method(f, x0, x1, tol, max_iter)
-            
-            # Update results in GUI
-            self.master.after(0, self.update_results, x_values, errors)
-            
         except ValueError as e:
-            self.master.after(0, messagebox.showerror, "Error", f"Input tidak valid: {str(e)}")
-        finally:
-            self.master.after(0, lambda: self.calc_button.config(state=tk.NORMAL))
+            # In auto mode, incomplete input (e.g. "1e-") is simply ignored
+            if not live:
+                messagebox.showerror("Error", f"Input tidak valid: {str(e)}")
+            return
+        
+        self.progress.config(maximum=max_iter, value=0)
+        self.progress_label.config(text="")
+        
+        # Clicking again while a calculation runs cancels it and starts over
+        self.scheduler.submit(lambda token: self.calculate(token, x0, x1, tol, max_iter),
+                              self.finish_calculation, lambda error: self.show_error(error, live),
+                              self.show_progress)
+    
+    def calculate(self, token, x0, x1, tol, max_iter):
+        # Define the function (compiled once, then served from cache)
+        f = make_function("2*x**3 - x - exp(-x)", "math")
+        
+        # Run secant method; the token stops the run once it is superseded
+        return secant_method(f, x0, x1, tol, max_iter, callback=token.callback, solver=self.solver)
+    
+    def show_progress(self, step, x, fx, error):
+        self.progress['value'] = step
+        self.progress_label.config(text=f"Iterasi {step}, error = {error:.3e}")
+    
+    def show_error(self, error, live=False):
+        if live:
+            # No dialogs while typing; the message goes to the progress label
+            self.progress_label.config(text=f"Terjadi kesalahan: {error}")
+            return
+        messagebox.showerror("Error", f"Terjadi kesalahan: {error}")
+    
+    def finish_calculation(self, result):
+        self.progress['value'] = self.progress['maximum']
+        self.update_results(*result)
     
     def update_results(self, x_values, errors):
         # Update result label
         self.result_label.config(text=f"Akar ditemukan: x ≈ {x_values[-1]:.8f}")
         
         # Update table
-        self.tree.delete(*self.tree.get_children())
-        for i in range(len(x_values)-1):
-            self.tree.insert('', 'end', values=(
+        with profiling.stage('table'):
+            self.table.set_rows(len(x_values) - 1, lambda i: (
                 i+1, 
                 f"{x_values[i]:.8f}", 
                 f"{x_values[i+1]:.8f}", 
@@ -202,32 +227,25 @@ class SecantApp:
             ))
         
         # Update graph (plot xi+1 values)
-        self.ax.clear()
-        iterations = range(1, len(x_values))
-        xi_plus_1 = x_values[1:]
-        self.ax.plot(iterations, xi_plus_1, 'bo-', markersize=6, linewidth=1.5, label='xᵢ₊₁')
-        
-        # Add annotations for the last point
-        last_iter = iterations[-1]
-        last_val = xi_plus_1[-1]
-        self.ax.annotate(f'{last_val:.6f}', 
-                         xy=(last_iter, last_val), 
-                         xytext=(10, -20),
-                         textcoords='offset points',
-                         bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                         arrowprops=dict(arrowstyle='->'))
-        
-        self.ax.set_title('Perkembangan Nilai xᵢ₊₁ pada Setiap Iterasi')
-        self.ax.set_xlabel('Iterasi')
-        self.ax.set_ylabel('Nilai xᵢ₊₁')
-        self.ax.legend()
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        
-        # Redraw canvas
-        self.canvas.draw()
+        if self.plot is None:
+            self.init_graph()
+        with profiling.stage('plot'):
+            iterations = range(1, len(x_values))
+            xi_plus_1 = x_values[1:]
+            self.plot.set_data(0, iterations, xi_plus_1)
+            
+            # Move the annotation to the last point
+            last_iter = iterations[-1]
+            last_val = xi_plus_1[-1]
+            self.annotation.xy = (last_iter, last_val)
+            self.annotation.set_text(f'{last_val:.6f}')
+            self.annotation.set_visible(True)
+            # Redraw canvas
+            self.plot.draw()
 
 if __name__ == "__main__":
     # Use a blue theme
     root = ttk.Window(themename="minty")
     app = SecantApp(root)
+    report_startup(root)
     root.mainloop()
@@ -1,29 +1,38 @@
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import csv
+from secant import CONVERGED, DIVERGED, ZERO_DIVISOR, make_function, profiling
+from secant.export import export_history
+from secant.live import LiveSolver
+from secant.plotting import ConvergencePlot
+from secant.scheduler import SolveScheduler
+from secant.widgets import (Debouncer, VirtualTable, prewarm, report_startup,
+                            show_stats_panel)
+
+EXPORT_COLUMNS = ("x0", "x1", "x2", "error")
+# Same function as f below, compiled for NumPy arrays for the f(x) overlay
+FUNCTION = "2*x**3 - x - exp(-x)"
+# Only the latest iterates are marked on the f(x) curve
+FUNCTION_POINTS = 500
 
 def f(x):
     return 2 * x**3 - x - math.exp(-x)
 
-def secant_with_iterations(x0, x1, tol, max_iter):
-    iterations = []
-    step = 1
-    while step <= max_iter:
-        if f(x0) == f(x1):
-            raise ValueError("Divide by zero error in Secant method!")
-        x2 = x0 - (x1 - x0) * f(x0) / (f(x1) - f(x0))
-        error = abs(x2 - x1)
-        iterations.append((step, x0, x1, x2, error))
-        if error < tol:
-            return x2, step, iterations
-        x0, x1 = x1, x2
-        step += 1
-    raise ValueError("Method did not converge within the maximum number of iterations!")
-
-def hitung():
+def secant_with_iterations(x0, x1, tol, max_iter, callback=None):
+    # Tightening only the tolerance continues from the previous root
+    with profiling.stage('iterate'):
+        result = live_solver.solve(f, x0, x1, tol, max_iter, callback=callback)
+    profiling.count('evaluations', result.evaluations)
+    if result.status == ZERO_DIVISOR:
+        raise ValueError("Divide by zero error in Secant method!")
+    if result.status == DIVERGED:
+        raise ValueError("Method diverged: f(x) is undefined or not finite at an iterate!")
+    if result.status != CONVERGED:
+        raise ValueError("Method did not converge within the maximum number of iterations!")
+    # The f(x) overlay is compiled here on the worker thread, not in show_result
+    return result.root, result.iterations, result.history, make_function(FUNCTION, "numpy")
+
+def hitung(live=False):
     try:
         # Validasi input
         if not all([x0_entry.get(), x1_entry.get(), tol_entry.get(), max_iter_entry.get()]):
@@ -39,48 +48,75 @@ def hitung():
         if max_iter <= 0:
             raise ValueError("Iterasi maksimum harus lebih besar dari 0!")
         
-        root, iterations_count, iterations = secant_with_iterations(x0, x1, tol, max_iter)
-        result_label.config(text=f"Hasil : x = {root:.10f} (ditemukan dalam {iterations_count} iterasi)", fg="#C85C8E")
-        
-        # Update tabel iterasi
-        update_iteration_table(iterations)
-        
-        # Update visualisasi grafik
-        plot_graph(iterations)
-        
     except ValueError as ve:
-        messagebox.showerror("Input Error", str(ve))
-    except Exception as e:
-        messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
+        # In auto mode, incomplete input (e.g. "1e-") is simply ignored
+        if not live:
+            messagebox.showerror("Input Error", str(ve))
+        return
+    
+    # Solve in the background; a new click (or keystroke) cancels the previous run
+    scheduler.submit(lambda token: secant_with_iterations(x0, x1, tol, max_iter, token.callback),
+                     show_result, lambda error: show_error(error, live), show_progress)
+
+def live_update():
+    if live_var.get():
+        hitung(live=True)
+
+def show_progress(step, x, fx, error):
+    result_label.config(text=f"Menghitung... iterasi {step}, error = {error:.3e}", fg="#C85C8E")
+
+def show_error(error, live=False):
+    if live:
+        # No dialogs while typing; the message goes to the result label
+        result_label.config(text=str(error), fg="#C85C8E")
+    elif isinstance(error, ValueError):
+        messagebox.showerror("Input Error", str(error))
+    else:
+        messagebox.showerror("Error", f"Terjadi kesalahan: {str(error)}")
+
+def show_result(result):
+    root, iterations_count, iterations, overlay = result
+    result_label.config(text=f"Hasil : x = {root:.10f} (ditemukan dalam {iterations_count} iterasi)", fg="#C85C8E")
+    
+    # Update tabel iterasi
+    with profiling.stage('table'):
+        update_iteration_table(iterations)
+    
+    # Update visualisasi grafik
+    with profiling.stage('plot'):
+        plot_graph(iterations, overlay)
+
+def format_row(row):
+    step, x0, x1, x2, _, error = row
+    return (step, f"{x0:.10f}", f"{x1:.10f}", f"{x2:.10f}", f"{error:.10f}")
 
 def update_iteration_table(iterations):
-    # Clear previous content
-    for item in iteration_tree.get_children():
-        iteration_tree.delete(item)
+    global last_iterations
+    last_iterations = iterations
     
-    # Add data to treeview
-    for step, x0, x1, x2, error in iterations:
-        iteration_tree.insert("", tk.END, values=(step, f"{x0:.10f}", f"{x1:.10f}", f"{x2:.10f}", f"{error:.10f}"))
+    # Only the visible rows are materialized in the treeview
+    iteration_table.set_rows(len(iterations), lambda i: format_row(iterations[i]))
 
 def reset():
+    scheduler.cancel()
     x0_entry.delete(0, tk.END)
     x1_entry.delete(0, tk.END)
     tol_entry.delete(0, tk.END)
     max_iter_entry.delete(0, tk.END)
     result_label.config(text="")
-    for item in iteration_tree.get_children():
-        iteration_tree.delete(item)
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
+    update_iteration_table([])
+    if convergence_plot is not None:
+        convergence_plot.clear()
 
 def export_to_csv():
-    if not iteration_tree.get_children():
+    if not last_iterations:
         messagebox.showwarning("Peringatan", "Tidak ada data untuk diekspor!")
         return
     
     file_path = filedialog.asksaveasfilename(
         defaultextension=".csv",
-        filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
+        filetypes=[("CSV Files", "*.csv"), ("NumPy Array", "*.npy"), ("NumPy Archive", "*.npz"),
+                   ("Parquet (pyarrow)", "*.parquet"), ("All Files", "*.*")],
         title="Simpan Hasil Sebagai"
     )
     
@@ -88,59 +124,77 @@ def export_to_csv():
         return
     
     try:
-        with open(file_path, 'w', newline='') as file:
-            writer = csv.writer(file)
-            # Write header
-            writer.writerow(["Iterasi", "X0", "Xi", "Xi+1", "Error"])
-            # Write data
-            for child in iteration_tree.get_children():
-                writer.writerow(iteration_tree.item(child)['values'])
-        messagebox.showinfo("Sukses", "Data berhasil diekspor ke CSV!")
+        # Written straight from the numeric history columns, at full precision
+        export_history(last_iterations, file_path, columns=EXPORT_COLUMNS,
+                       headers=["Iterasi", "X0", "Xi", "Xi+1", "Error"])
+        messagebox.showinfo("Sukses", "Data berhasil diekspor!")
     except Exception as e:
         messagebox.showerror("Error", f"Gagal mengekspor data: {str(e)}")
 
-def plot_graph(iterations):
-    steps = [i[0] for i in iterations]
-    x2_values = [i[3] for i in iterations]
-    errors = [i[4] for i in iterations]
-    
-    fig = plt.figure(figsize=(12, 5), facecolor="#FDE2E4")
-    fig.suptitle(f"Visualisasi Metode Secant", color="#C85C8E")
+def plot_graph(iterations, overlay):
+    global convergence_plot
+    # Zero-copy column views of the iteration history
+    steps = iterations.steps
+    x2_values = iterations.column('x2')
+    errors = iterations.column('error')
     
-    # Plot 1: Nilai Xi+1
-    ax1 = fig.add_subplot(121)
-    ax1.plot(steps, x2_values, marker="o", color="#C85C8E", label="Xi+1", linewidth=2)
-    ax1.set_xlabel("Iterasi", color="#C85C8E")
-    ax1.set_ylabel("Nilai Xi+1", color="#C85C8E")
-    ax1.set_title("Perkembangan Nilai Xi+1", color="#C85C8E")
-    ax1.grid(True, linestyle='--', alpha=0.7)
-    ax1.legend()
+    # Figure and canvas are created once, then only the line data changes
+    if convergence_plot is None:
+        convergence_plot = ConvergencePlot(graph_frame, [
+            # Plot 1: Nilai Xi+1
+            {'title': "Perkembangan Nilai Xi+1", 'xlabel': "Iterasi", 'ylabel': "Nilai Xi+1",
+             'line': {'marker': "o", 'color': "#C85C8E", 'label': "Xi+1", 'linewidth': 2},
+             'grid': {'linestyle': '--', 'alpha': 0.7}, 'legend': True},
+            # Plot 2: Error
+            {'title': "Perkembangan Error", 'xlabel': "Iterasi", 'ylabel': "Error",
+             'line': {'marker': "o", 'color': "#FFB3C6", 'label': "Error", 'linewidth': 2},
+             'yscale': 'log' if log_var.get() else 'linear',
+             'grid': {'linestyle': '--', 'alpha': 0.7}, 'legend': True},
+            # Plot 3: f(x) over the search interval, with the iterates on top
+            {'title': "Fungsi f(x)", 'xlabel': "x", 'ylabel': "f(x)",
+             'line': {'marker': "o", 'linestyle': "", 'color': "#C85C8E", 'label': "Iterasi"},
+             'overlay': {'color': "#FF7BA9", 'label': "f(x)", 'linewidth': 2},
+             'grid': {'linestyle': '--', 'alpha': 0.7}, 'legend': True, 'decimate': False},
+        ], nrows=1, ncols=3, figsize=(14, 5), facecolor="#FDE2E4",
+           suptitle="Visualisasi Metode Secant", text_color="#C85C8E")
+        convergence_plot.pack(fill=tk.BOTH, expand=True)
     
-    # Plot 2: Error
-    ax2 = fig.add_subplot(122)
-    ax2.plot(steps, errors, marker="o", color="#FFB3C6", label="Error", linewidth=2)
-    ax2.set_xlabel("Iterasi", color="#C85C8E")
-    ax2.set_ylabel("Error", color="#C85C8E")
-    ax2.set_title("Perkembangan Error", color="#C85C8E")
-    ax2.grid(True, linestyle='--', alpha=0.7)
-    ax2.legend()
-    
-    plt.tight_layout()
-    
-    # Clear previous graph
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
+    # Long histories are min/max-decimated to the panel width inside set_data
+    convergence_plot.set_data(0, steps, x2_values)
+    convergence_plot.set_data(1, steps, errors)
+    plot_function(iterations, overlay)
+    convergence_plot.draw()
+
+def plot_function(iterations, overlay):
+    import numpy as np
     
-    # Embed graph in Tkinter
-    canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    x = np.asarray(iterations.x_values())
+    finite = np.isfinite(x)
+    if not finite.any():
+        convergence_plot.set_data(2, [], [])
+        convergence_plot.set_overlay(2, [], [])
+        return
+    a, b = x[finite].min(), x[finite].max()
+    pad = 0.05 * (b - a) or 0.5
+    tail = slice(-FUNCTION_POINTS, None)
+    convergence_plot.set_data(2, iterations.column('x2')[tail], iterations.column('fx')[tail])
+    # One vectorized evaluation, one sample per pixel column
+    convergence_plot.plot_function(2, overlay, a - pad, b + pad)
+
+def update_error_scale():
+    if convergence_plot is not None:
+        convergence_plot.set_yscale(1, 'log' if log_var.get() else 'linear')
+        convergence_plot.draw()
 
 root = tk.Tk()
 root.title("Metode Secant")
 root.geometry("1000x700")
 root.resizable(True, True)  
 root.configure(bg="#FDE2E4")
+# F12: panel statistik profiling (iterate, table, plot)
+root.bind('<F12>', lambda event: show_stats_panel(root))
+scheduler = SolveScheduler(root, interval=10)
+live_solver = LiveSolver()
 
 main_frame = tk.Frame(root, bg="#FDE2E4")
 main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -175,9 +229,25 @@ calculate_button.pack(side=tk.LEFT, padx=5)
 reset_button = tk.Button(button_frame, text="Reset", command=reset, fg="#FFFFFF", bg="#FF7BA9", width=10)
 reset_button.pack(side=tk.LEFT, padx=5)
 
-export_button = tk.Button(button_frame, text="Ekspor CSV", command=export_to_csv, fg="#FFFFFF", bg="#FF7BA9", width=10)
+export_button = tk.Button(button_frame, text="Ekspor", command=export_to_csv, fg="#FFFFFF", bg="#FF7BA9", width=10)
 export_button.pack(side=tk.LEFT, padx=5)
 
+# Auto mode: recalculate (debounced) whenever an entry changes
+live_var = tk.BooleanVar(value=False)
+live_check = tk.Checkbutton(button_frame, text="Hitung Otomatis", variable=live_var, command=live_update,
+                            fg="#C85C8E", bg="#FDE2E4", activebackground="#FDE2E4")
+live_check.pack(side=tk.LEFT, padx=5)
+
+# Log-scale error axis keeps the superlinear convergence tail visible
+log_var = tk.BooleanVar(value=True)
+log_check = tk.Checkbutton(button_frame, text="Error Skala Log", variable=log_var,
+                           command=update_error_scale, fg="#C85C8E", bg="#FDE2E4",
+                           activebackground="#FDE2E4")
+log_check.pack(side=tk.LEFT, padx=5)
+
+debouncer = Debouncer(root, 30, live_update)
+debouncer.bind(x0_entry, x1_entry, tol_entry, max_iter_entry)
+
 # Result Label
 result_label = tk.Label(main_frame, text="", font=("Arial", 10, "bold"), fg="#C85C8E", bg="#FDE2E4")
 result_label.pack(fill=tk.X, pady=5)
@@ -186,40 +256,15 @@ result_label.pack(fill=tk.X, pady=5)
 table_frame = tk.LabelFrame(main_frame, text="Tabel Iterasi", fg="#C85C8E", bg="#FDE2E4")
 table_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-# Create Treeview with scrollbars
-tree_scroll_y = ttk.Scrollbar(table_frame, orient="vertical")
-tree_scroll_x = ttk.Scrollbar(table_frame, orient="horizontal")
-
-iteration_tree = ttk.Treeview(
+# Create virtualized Treeview with scrollbars
+iteration_table = VirtualTable(
     table_frame,
     columns=("Iterasi", "X0", "Xi", "Xi+1", "Error"),
-    show="headings",
-    yscrollcommand=tree_scroll_y.set,
-    xscrollcommand=tree_scroll_x.set
+    widths=(80, 200, 200, 200, 200),
+    xscroll=True
 )
-
-# Configure scrollbars
-tree_scroll_y.config(command=iteration_tree.yview)
-tree_scroll_x.config(command=iteration_tree.xview)
-
-# Define headings
-iteration_tree.heading("Iterasi", text="Iterasi")
-iteration_tree.heading("X0", text="X0")
-iteration_tree.heading("Xi", text="Xi")
-iteration_tree.heading("Xi+1", text="Xi+1")
-iteration_tree.heading("Error", text="Error")
-
-# Set column widths
-iteration_tree.column("Iterasi", width=80, anchor="center")
-iteration_tree.column("X0", width=200, anchor="center")
-iteration_tree.column("Xi", width=200, anchor="center")
-iteration_tree.column("Xi+1", width=200, anchor="center")
-iteration_tree.column("Error", width=200, anchor="center")
-
-# Pack everything
-iteration_tree.pack(side="left", fill="both", expand=True)
-tree_scroll_y.pack(side="right", fill="y")
-tree_scroll_x.pack(side="bottom", fill="x")
+iteration_table.pack(fill="both", expand=True)
+last_iterations = []
 
 # Configure style for alternating row colors
 style = ttk.Style()
@@ -234,5 +279,10 @@ style.map("Treeview",
 # Graph Section
 graph_frame = tk.LabelFrame(main_frame, text="Visualisasi Grafik", fg="#C85C8E", bg="#FDE2E4")
 graph_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+convergence_plot = None
 
+# The figure (matplotlib) and the f(x) overlay (sympy) load on the first plot;
+# warm them up after the window shows
+prewarm(root)
+report_startup(root)
 root.mainloop()
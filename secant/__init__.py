@@ -0,0 +1,42 @@
+"""
+Engine metode secant yang dipakai bersama oleh aplikasi GUI dan CLI.
+
+Paket ini sengaja tidak mengimpor tkinter, matplotlib, sympy, atau NumPy
+saat diimpor: modul yang membutuhkan NumPy (batch) dimuat saat pertama
+kali dipakai, sehingga penyelesaian skalar headless tetap cepat.
+"""
+
+from .backends import available_backends
+from .engine import (ENGINES, SecantResult, get_engine, halley, hybrid, newton,
+                     prepare, secant, solve)
+from .expression import (FunctionCache, cache_info, canonicalize, clear_cache,
+                         make_derivative_function, make_function,
+                         make_parametric_function)
+from .precision import solve_precise
+from .status import (CONVERGED, DIVERGED, MAX_ITER, STATUS_NAMES,
+                     ZERO_DIVISOR, status_name)
+
+_LAZY = {
+    "BatchResult": "batch",
+    "secant_batch": "batch",
+}
+
+__all__ = [
+    "SecantResult", "secant", "hybrid", "newton", "halley", "solve", "solve_precise",
+    "prepare",
+    "ENGINES", "get_engine", "BatchResult", "secant_batch",
+    "make_function", "make_derivative_function", "make_parametric_function",
+    "available_backends",
+    "FunctionCache", "cache_info", "canonicalize", "clear_cache",
+    "CONVERGED", "DIVERGED", "MAX_ITER", "ZERO_DIVISOR",
+    "STATUS_NAMES", "status_name",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
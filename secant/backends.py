@@ -0,0 +1,382 @@
+"""
+Backend numerik untuk fungsi hasil kompilasi.
+
+Setiap backend mengubah teks ekspresi kanonik menjadi fungsi f(x):
+
+- 'math'    : fungsi skalar berbasis modul `math` (jalur tercepat untuk
+              satu float; ekspresi sederhana dikompilasi tanpa sympy)
+- 'numpy'   : lambdify ke NumPy, menerima array (untuk batch/scan)
+- 'numexpr' : lambdify ke numexpr untuk array besar (opsional)
+- 'numba'   : fungsi 'math' yang di-JIT dengan numba.njit (opsional)
+- 'mpmath'  : lambdify ke mpmath untuk presisi sembarang (konstanta
+              desimal dibaca ulang pada presisi kerja mpmath saat dipanggil)
+
+Nama yang diminta diselesaikan lewat rantai fallback (`FALLBACKS`):
+backend yang tidak terpasang atau gagal mengompilasi ekspresi dilewati
+dan backend berikutnya dicoba. `benchmark` mengukur biaya per evaluasi
+setiap backend (`python -m secant "ekspresi" --benchmark-backends`).
+"""
+
+import ast
+import importlib.util
+import math
+import time
+
+from . import profiling
+
+
+class BackendError(Exception):
+    """Backend tidak bisa mengompilasi ekspresi (bukan kesalahan parsing)."""
+
+
+# Nama yang boleh dipakai di jalur cepat 'math' (tanpa sympy), dipetakan
+# ke padanan yang sama dengan hasil sympify + lambdify(..., 'math').
+_MATH_NAMES = {
+    'E': math.e, 'pi': math.pi,
+    'exp': math.exp, 'log': math.log, 'ln': math.log, 'sqrt': math.sqrt,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
+    'sinh': math.sinh, 'cosh': math.cosh, 'tanh': math.tanh,
+    'abs': abs, 'Abs': abs,
+}
+_MATH_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow,
+    ast.USub, ast.UAdd,
+)
+
+
+def _is_integer(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        node = node.operand
+    return isinstance(node, ast.Constant) and type(node.value) is int
+
+
+class _RealPow(ast.NodeTransformer):
+    """
+    Ganti a**b dengan eksponen bukan bilangan bulat menjadi math.pow(a, b).
+
+    Untuk a < 0, a**0.5 pada float Python menghasilkan complex, yang tidak
+    bisa dipakai engine; math.pow melempar ValueError ("math domain
+    error"), yang oleh engine diperlakukan sebagai divergen seperti nan
+    dari backend numpy.
+    """
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow) and not _is_integer(node.right):
+            return ast.copy_location(
+                ast.Call(ast.Name('_pow', ast.Load()), [node.left, node.right], []), node)
+        return node
+
+
+def _compile_math(canonical):
+    """
+    Kompilasi langsung ke fungsi berbasis `math` untuk ekspresi sederhana.
+
+    Hanya node AST dan nama dari daftar putih yang diterima; selain itu
+    mengembalikan None agar pemanggil kembali ke jalur sympy.
+    """
+    try:
+        tree = ast.parse(canonical, mode='eval')
+    except SyntaxError:
+        return None
+    for node in ast.walk(tree):
+        if not isinstance(node, _MATH_NODES):
+            return None
+        if isinstance(node, ast.Name) and node.id != 'x' and node.id not in _MATH_NAMES:
+            return None
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            return None
+        if isinstance(node, ast.Call) and (node.keywords or not isinstance(node.func, ast.Name)
+                                           or node.func.id not in _MATH_NAMES):
+            return None
+    body = ast.unparse(_RealPow().visit(tree))
+    code = compile(f"lambda x: {body}", '<secant>', 'eval')
+    return eval(code, {'__builtins__': {}, '_pow': math.pow, **_MATH_NAMES})
+
+
+def parse(canonical, params=()):
+    """
+    Parsing teks kanonik dengan sympy; mengembalikan (x, expr).
+
+    Selain x, ekspresi hanya boleh memuat simbol parameter `params`.
+    """
+    import sympy as sp
+
+    x = sp.Symbol('x')
+    allowed = {x} | {sp.Symbol(name) for name in params}
+    # Nama parameter (mis. 'beta', 'gamma') tidak boleh diparsing sebagai fungsi sympy
+    local = {name: sp.Symbol(name) for name in params}
+    try:
+        with profiling.stage('parse'):
+            expr = sp.sympify(canonical, locals=local)
+    except Exception as e:
+        raise ValueError(f"Kesalahan parsing fungsi: {e}") from e
+    extra = expr.free_symbols - allowed
+    if extra:
+        names = ', '.join(sorted(str(s) for s in extra))
+        expected = ', '.join(('x',) + tuple(params))
+        raise ValueError(f"Fungsi hanya boleh bergantung pada {expected} (ditemukan: {names})")
+    return x, expr
+
+
+def _lambdify(canonical, module, printer=None):
+    import sympy as sp
+
+    x, expr = parse(canonical)
+    return sp.lambdify(x, expr, module, printer=printer)
+
+
+def _float_printer():
+    """
+    Printer mpmath yang menulis konstanta sebagai float biasa.
+
+    Dengan modul ['math', 'mpmath'] sympy menulis setiap Float sebagai
+    mpf(...), sehingga seluruh aritmetika jalur skalar ikut berjalan di
+    mpmath (puluhan kali lebih lambat) walau hanya fungsi khusus yang
+    membutuhkannya.
+    """
+    from sympy import S
+    from sympy.printing.pycode import MpmathPrinter
+
+    class FloatPrinter(MpmathPrinter):
+        def _print_Float(self, e):
+            return repr(float(e))
+
+        def _print_Pow(self, expr, rational=False):
+            # Seperti _RealPow: pangkat pecahan dari bilangan negatif
+            # menjadi ValueError, bukan complex (atau mpc)
+            if expr.exp.is_integer or expr.exp in (S.Half, -S.Half):
+                return super()._print_Pow(expr, rational)
+            return (f"{self._module_format('math.pow')}"
+                    f"({self._print(expr.base)}, {self._print(expr.exp)})")
+
+    return FloatPrinter({'fully_qualified_modules': False, 'inline': True,
+                         'allow_unknown_functions': True})
+
+
+def _decimal_printer():
+    """
+    Printer mpmath yang menulis konstanta sebagai string desimal mpf('0.9').
+
+    Printer bawaan menulis Float sebagai mpf dengan presisi Float-nya
+    (53 bit), sehingga pada presisi tinggi 0.9 tetap bernilai
+    0.90000000000000002220... String desimal dibaca ulang oleh mpmath pada
+    presisi kerja (`mp.dps`) saat fungsi dipanggil, jadi akar yang dihitung
+    adalah akar dari ekspresi yang diketik. Pada presisi bawaan hasilnya
+    sama dengan printer bawaan.
+    """
+    from sympy.printing.pycode import MpmathPrinter
+
+    class DecimalPrinter(MpmathPrinter):
+        def _print_Float(self, e):
+            return f"{self._module_format('mpmath.mpf')}({str(e)!r})"
+
+    return DecimalPrinter({'fully_qualified_modules': False, 'inline': True,
+                           'allow_unknown_functions': True})
+
+
+def _build_math(canonical):
+    f = _compile_math(canonical)
+    if f is not None:
+        return f
+    # Fungsi khusus yang tidak ada di math dievaluasi lewat mpmath
+    return _lambdify(canonical, ['math', 'mpmath'], _float_printer())
+
+
+def _build_numpy(canonical):
+    return _lambdify(canonical, 'numpy')
+
+
+def _build_numexpr(canonical):
+    try:
+        return _lambdify(canonical, 'numexpr')
+    except (TypeError, NotImplementedError) as e:
+        raise BackendError(str(e)) from e
+
+
+def _build_numba(canonical):
+    import numba
+
+    f = _build_math(canonical)
+    try:
+        # Kompilasi eager dengan signature tetap, agar kegagalan muncul di sini
+        return numba.njit('float64(float64)', cache=False)(f)
+    except Exception as e:
+        raise BackendError(str(e)) from e
+
+
+def _build_mpmath(canonical):
+    return _lambdify(canonical, 'mpmath', _decimal_printer())
+
+
+BACKENDS = {
+    'math': _build_math,
+    'numpy': _build_numpy,
+    'numexpr': _build_numexpr,
+    'numba': _build_numba,
+    'mpmath': _build_mpmath,
+}
+
+# Modul Python yang harus terpasang untuk setiap backend
+_REQUIRES = {
+    'math': None,
+    'numpy': 'numpy',
+    'numexpr': 'numexpr',
+    'numba': 'numba',
+    'mpmath': 'mpmath',
+}
+
+# Urutan backend yang dicoba untuk setiap nama yang diminta
+FALLBACKS = {
+    'math': ('math',),
+    'numpy': ('numpy',),
+    'numexpr': ('numexpr', 'numpy'),
+    'numba': ('numba', 'math'),
+    'mpmath': ('mpmath',),
+    # Alias: jalur skalar, jalur array, dan JIT bila tersedia
+    'scalar': ('math',),
+    'array': ('numpy',),
+    'jit': ('numba', 'math'),
+}
+
+
+def is_available(name):
+    module = _REQUIRES[name]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def available_backends():
+    return [name for name in BACKENDS if is_available(name)]
+
+
+def build(canonical, name):
+    """
+    Kompilasi `canonical` dengan backend `name` mengikuti rantai fallback.
+
+    Selain nama backend, `name` boleh berupa list/dict yang diteruskan apa
+    adanya ke `sp.lambdify` sebagai argumen modules. ValueError (ekspresi
+    atau backend tidak valid) tidak ditangkap.
+    """
+    if not isinstance(name, str):
+        return _lambdify(canonical, name)
+    if name not in FALLBACKS:
+        raise ValueError(f"Backend tidak dikenal: {name!r} (pilihan: {', '.join(FALLBACKS)})")
+    errors = []
+    for candidate in FALLBACKS[name]:
+        if not is_available(candidate):
+            errors.append(f"{candidate}: tidak terpasang")
+            continue
+        try:
+            return BACKENDS[candidate](canonical)
+        except BackendError as e:
+            errors.append(f"{candidate}: {e}")
+    raise ValueError(f"Tidak ada backend yang bisa dipakai untuk {name!r} ({'; '.join(errors)})")
+
+
+def benchmark(func_str, backends=None, x=0.5, scalar_calls=20000, array_size=100000, repeat=5):
+    """
+    Ukur biaya per evaluasi (nanodetik) setiap backend.
+
+    Mengembalikan list dict: backend, scalar_ns (satu float per panggilan)
+    dan array_ns (per elemen array berukuran `array_size`; None jika
+    backend tidak menerima array).
+    """
+    from .expression import canonicalize
+
+    canonical = canonicalize(func_str)
+    rows = []
+    for name in backends or available_backends():
+        try:
+            f = BACKENDS[name](canonical)
+        except BackendError as e:
+            rows.append({'backend': name, 'scalar_ns': None, 'array_ns': None, 'error': str(e)})
+            continue
+
+        f(x)  # pemanasan (JIT, cache impor)
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(scalar_calls):
+                f(x)
+            best = min(best, time.perf_counter() - start)
+        scalar_ns = best / scalar_calls * 1e9
+
+        array_ns = None
+        if name in ('numpy', 'numexpr'):
+            import numpy as np
+
+            xs = np.linspace(x - 0.25, x + 0.25, array_size)
+            f(xs)
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                f(xs)
+                best = min(best, time.perf_counter() - start)
+            array_ns = best / array_size * 1e9
+        rows.append({'backend': name, 'scalar_ns': scalar_ns, 'array_ns': array_ns, 'error': ''})
+    return rows
+
+
+def build_parametric(canonical, params, name='numpy'):
+    """
+    Kompilasi ekspresi dengan parameter tambahan menjadi f(x, *params).
+
+    `params` adalah nama simbol selain x (urutan = urutan argumen). `name`
+    adalah 'numpy' (default, tervektorisasi), 'math' atau 'mpmath'.
+    """
+    import sympy as sp
+
+    for param in params:
+        if not param.isidentifier() or param == 'x':
+            raise ValueError(f"Nama parameter tidak valid: {param!r}")
+    x, expr = parse(canonical, params)
+    symbols = [x] + [sp.Symbol(param) for param in params]
+    if name in ('numpy', 'array'):
+        return sp.lambdify(symbols, expr, 'numpy')
+    if name == 'mpmath':
+        return sp.lambdify(symbols, expr, 'mpmath', printer=_decimal_printer())
+    if name in ('math', 'scalar'):
+        return sp.lambdify(symbols, expr, ['math', 'mpmath'], printer=_float_printer())
+    raise ValueError(f"Backend parametrik tidak dikenal: {name!r} (pilihan: numpy, math, mpmath)")
+
+
+def build_derivatives(canonical, order=1, name='math'):
+    """
+    Kompilasi f dan turunannya sampai orde `order` (1 atau 2) menjadi satu
+    fungsi x -> [f, f', (f'')] dengan eliminasi subekspresi bersama (CSE).
+
+    Melempar ValueError jika ekspresi tidak bisa diturunkan secara simbolik
+    (mis. hasil turunannya masih berisi Derivative yang tidak terevaluasi).
+    """
+    import sympy as sp
+
+    x, expr = parse(canonical)
+    # Simbol real agar mis. Abs(x) diturunkan menjadi sign(x)
+    xr = sp.Symbol('x', real=True)
+    expr = expr.subs(x, xr)
+    exprs = [expr]
+    for _ in range(order):
+        exprs.append(sp.diff(exprs[-1], xr))
+    if any(e.has(sp.Derivative, sp.Subs, sp.DiracDelta) for e in exprs):
+        raise ValueError("Fungsi tidak bisa diturunkan secara simbolik")
+
+    printer = None
+    if name in ('numpy', 'array'):
+        module = 'numpy'
+    elif name == 'mpmath':
+        module = 'mpmath'
+        printer = _decimal_printer()
+    else:
+        module = ['math', 'mpmath']
+        printer = _float_printer()
+    fdf = sp.lambdify(xr, exprs, module, cse=True, printer=printer)
+    try:
+        fdf(1.0)
+    except NameError as e:
+        # Turunan memakai fungsi yang tidak ada di modul numerik
+        raise ValueError(f"Turunan tidak bisa dievaluasi secara numerik: {e}") from e
+    except Exception:
+        pass
+    return fdf
@@ -0,0 +1,121 @@
+"""
+Solver secant tervektorisasi: banyak pasangan tebakan awal (x0, x1)
+diselesaikan sekaligus dengan NumPy.
+
+Semua lane maju bersamaan (lockstep). Lane yang sudah konvergen, yang
+pembaginya nol, atau yang nilainya tidak lagi finite dikeluarkan dari
+himpunan aktif, sehingga f hanya dievaluasi pada lane yang masih berjalan.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .status import CONVERGED, DIVERGED, MAX_ITER, ZERO_DIVISOR
+
+
+class BatchResult(NamedTuple):
+    roots: np.ndarray        # akar (atau iterate terakhir) per lane
+    fvals: np.ndarray        # f(root) per lane
+    iterations: np.ndarray   # jumlah iterasi per lane
+    status: np.ndarray       # kode status per lane (lihat secant.status)
+    evaluations: int         # total evaluasi f (dijumlah atas semua lane)
+
+
+def _evaluate(f, x, args=()):
+    # lambdify untuk ekspresi konstan mengembalikan skalar, bukan array
+    y = np.asarray(f(x, *args), dtype=float)
+    if y.shape != x.shape:
+        y = np.broadcast_to(y, x.shape).copy()
+    return y
+
+
+def secant_batch(f, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0, args=()):
+    """
+    Menjalankan metode secant untuk setiap pasangan (x0[i], x1[i]).
+
+    `f` harus menerima array NumPy (mis. hasil `make_function(..., 'numpy')`).
+    `x0` dan `x1` di-broadcast satu sama lain; hasil memiliki bentuk yang sama.
+    Jika `args` diberikan (array parameter per lane, lihat
+    `make_parametric_function`), f dipanggil sebagai f(x, *args); array
+    parameter di-broadcast ke bentuk lane dan ikut dipadatkan bersama lane.
+    Sebuah lane konvergen jika |x2 - x1| < tol atau (bila `ftol` diberikan)
+    |f(x2)| < ftol, dan berhenti dengan ZERO_DIVISOR jika
+    |f(x1) - f(x0)| <= divisor_tol.
+    """
+    x0, x1, *args = np.broadcast_arrays(np.asarray(x0, dtype=float),
+                                        np.asarray(x1, dtype=float),
+                                        *(np.asarray(a, dtype=float) for a in args))
+    shape = x0.shape
+    xa = x0.ravel().copy()
+    xb = x1.ravel().copy()
+    args = [a.ravel() for a in args]
+    n = xa.size
+
+    roots = xb.copy()
+    iterations = np.zeros(n, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+
+    # Indeks asli dari lane yang masih aktif; array kerja selalu dipadatkan
+    lanes = np.arange(n)
+    with np.errstate(all='ignore'):
+        fa = _evaluate(f, xa, args)
+        fb = _evaluate(f, xb, args)
+        fvals = fb.copy()
+        evaluations = 2 * n
+
+        for step in range(1, max_iter + 1):
+            if lanes.size == 0:
+                break
+
+            denom = fb - fa
+            zero = np.abs(denom) <= divisor_tol
+            if zero.any():
+                # Seperti `secant`: hasilnya iterate terakhir, bukan x1 awal
+                stalled = lanes[zero]
+                roots[stalled] = xb[zero]
+                fvals[stalled] = fb[zero]
+                status[stalled] = ZERO_DIVISOR
+                iterations[stalled] = step - 1
+                keep = ~zero
+                lanes, xa, xb, fa, fb, denom = (
+                    lanes[keep], xa[keep], xb[keep], fa[keep], fb[keep], denom[keep])
+                args = [a[keep] for a in args]
+                if lanes.size == 0:
+                    break
+
+            x2 = xb - fb * (xb - xa) / denom
+            f2 = _evaluate(f, x2, args)
+            evaluations += x2.size
+            error = np.abs(x2 - xb)
+
+            bad = ~np.isfinite(x2)
+            done = error < tol
+            if ftol is not None:
+                done |= np.abs(f2) < ftol
+            done &= ~bad
+            stop = done | bad
+            if stop.any():
+                # Hasil hanya ditulis balik untuk lane yang keluar
+                finished = lanes[stop]
+                roots[finished] = x2[stop]
+                fvals[finished] = f2[stop]
+                iterations[finished] = step
+                status[lanes[done]] = CONVERGED
+                status[lanes[bad]] = DIVERGED
+                keep = ~stop
+                lanes = lanes[keep]
+                args = [a[keep] for a in args]
+                xa, fa = xb[keep], fb[keep]
+                xb, fb = x2[keep], f2[keep]
+            else:
+                xa, fa, xb, fb = xb, fb, x2, f2
+
+        # Lane yang tersisa kehabisan iterasi (status MAX_ITER)
+        roots[lanes] = xb
+        fvals[lanes] = fb
+        iterations[lanes] = max_iter
+
+    return BatchResult(roots.reshape(shape), fvals.reshape(shape),
+                       iterations.reshape(shape), status.reshape(shape),
+                       evaluations)
@@ -0,0 +1,293 @@
+"""
+Benchmark engine secant yang dapat diulang, dengan pelacakan regresi.
+
+Korpus tetap (polinomial, transendental, dan kasus yang sulit/ill-
+conditioned) dijalankan lewat setiap engine. Untuk setiap pasangan
+(kasus, engine) dicatat waktu wall (minimum dari beberapa pengulangan),
+evaluasi f, iterasi, memori puncak, status, akar, dan residual |f(akar)|.
+Hasil yang dilaporkan konvergen oleh engine tetapi residualnya lebih
+besar dari `RESIDUAL_TOL` (mis. secant yang berhenti karena langkahnya
+mengecil di daerah datar) diberi status 'false_root', sehingga evaluasi
+yang lebih sedikit tidak dihitung sebagai kemenangan. Hasil disimpan
+sebagai JSON; perintah `compare` menandai regresi terhadap baseline.
+
+    python -m secant.bench run -o baseline.json
+    python -m secant.bench run -o sekarang.json
+    python -m secant.bench compare baseline.json sekarang.json --threshold 0.2
+
+Perintah `startup` mengukur waktu cold start setiap aplikasi GUI, dari
+peluncuran proses Python sampai frame interaktif pertama (lihat
+`secant.widgets.report_startup`), dengan target di bawah 300 ms. Perintah
+ini membutuhkan display.
+
+    python -m secant.bench startup --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .engine import ENGINES, prepare
+from .status import status_name
+
+# (nama, ekspresi, x0, x1, tol, max_iter)
+CORPUS = [
+    # Polinomial
+    ("quadratic", "x**2 - 2", 1.0, 2.0, 1e-12, 100),
+    ("cubic", "x**3 + x**2 - 3*x - 3", 1.0, 2.0, 1e-12, 100),
+    ("quintic", "x**5 - 3*x**4 + 2*x - 1", 2.0, 3.0, 1e-12, 100),
+    # Transendental
+    ("secant_gui", "2*x**3 - x - exp(-x)", 0.1, 2.0, 1e-12, 100),
+    ("kepler", "x - 0.9*sin(x) - 1", 0.0, 2.0, 1e-12, 100),
+    ("cos_fixed_point", "cos(x) - x", 0.0, 1.0, 1e-12, 100),
+    ("exp_log", "exp(x) - 10", 0.0, 1.0, 1e-12, 100),
+    # Ill-conditioned
+    ("triple_root", "(x - 1)**3", 0.0, 3.0, 1e-10, 500),
+    ("near_double_root", "(x - 1)*(x - 1.000001)", 0.0, 3.0, 1e-12, 500),
+    ("steep_tanh", "tanh(10*(x - 0.3))", -1.0, 2.0, 1e-12, 200),
+    ("flat_power", "x**10 - 1", 0.0, 1.5, 1e-12, 200),
+    ("wilkinson5", "(x-1)*(x-2)*(x-3)*(x-4)*(x-5)", 3.4, 3.6, 1e-12, 100),
+]
+
+
+# Residual maksimum agar hasil 'converged' dianggap akar sungguhan
+RESIDUAL_TOL = 1e-8
+
+
+def _time_run(engine, f, case, repeat):
+    _, _, x0, x1, tol, max_iter = case
+    best = float('inf')
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = engine(f, x0, x1, tol, max_iter)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, result
+
+
+def _peak_memory(engine, f, case):
+    _, _, x0, x1, tol, max_iter = case
+    tracemalloc.start()
+    try:
+        engine(f, x0, x1, tol, max_iter)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(engines=None, corpus=None, repeat=20, module='math'):
+    """Jalankan korpus lewat setiap engine; mengembalikan dict siap-JSON."""
+    engines = engines or list(ENGINES)
+    corpus = corpus or CORPUS
+    results = []
+    for case in corpus:
+        name, expression = case[0], case[1]
+        for method in engines:
+            start = time.perf_counter()
+            engine, f = prepare(expression, method, module)
+            compile_s = time.perf_counter() - start
+            try:
+                wall_s, result = _time_run(engine, f, case, repeat)
+                peak = _peak_memory(engine, f, case)
+            except (ArithmeticError, ValueError) as e:
+                results.append({'case': name, 'engine': method, 'status': 'error',
+                                'message': str(e)})
+                continue
+            fx = float(result.fx)
+            status = status_name(result.status)
+            if result.converged and not abs(fx) <= RESIDUAL_TOL:
+                status = 'false_root'
+            results.append({
+                'case': name,
+                'engine': method,
+                'wall_us': wall_s * 1e6,
+                'compile_us': compile_s * 1e6,
+                'evaluations': result.evaluations,
+                'iterations': result.iterations,
+                'peak_bytes': peak,
+                'status': status,
+                'root': float(result.root),
+                'fx': fx,
+            })
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'module': module,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Bandingkan dua hasil benchmark.
+
+    Mengembalikan list regresi: waktu wall yang naik lebih dari
+    `threshold` (relatif), evaluasi atau iterasi yang bertambah, dan
+    status yang berubah dari 'converged' (termasuk menjadi 'false_root').
+    Evaluasi dan iterasi hanya dibandingkan jika baseline konvergen ke
+    akar sungguhan; dari 'false_root' ke 'converged' adalah perbaikan.
+    """
+    base = {(r['case'], r['engine']): r for r in baseline['results']}
+    regressions = []
+    for row in current['results']:
+        key = (row['case'], row['engine'])
+        old = base.get(key)
+        if old is None:
+            continue
+        label = f"{row['case']}/{row['engine']}"
+        if old['status'] == 'converged' and row['status'] != 'converged':
+            regressions.append(f"{label}: status {old['status']} -> {row['status']}")
+        if 'wall_us' not in row or 'wall_us' not in old:
+            continue
+        if row['wall_us'] > old['wall_us'] * (1 + threshold):
+            change = row['wall_us'] / old['wall_us'] - 1
+            regressions.append(f"{label}: waktu {old['wall_us']:.1f} -> {row['wall_us']:.1f} us "
+                               f"(+{change:.0%})")
+        if old['status'] != 'converged':
+            continue
+        for field in ('evaluations', 'iterations'):
+            if row[field] > old[field]:
+                regressions.append(f"{label}: {field} {old[field]} -> {row[field]}")
+    return regressions
+
+
+STARTUP_TARGET_MS = 300
+
+# Aplikasi GUI berada satu tingkat di atas paket
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _gui_scripts():
+    return sorted(os.path.join(GUI_DIR, name) for name in os.listdir(GUI_DIR)
+                  if name.startswith('gui-secant') and name.endswith('.py'))
+
+
+def _launch(script, timeout):
+    from .widgets import STARTUP_ENV
+
+    env = dict(os.environ, **{STARTUP_ENV: repr(time.time())})
+    proc = subprocess.run([sys.executable, script], env=env, cwd=GUI_DIR, timeout=timeout,
+                          capture_output=True, text=True)
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        message = (proc.stderr.strip().splitlines() or ['tidak ada keluaran'])[-1]
+        raise RuntimeError(message)
+    return json.loads(lines[-1])
+
+
+def run_startup(scripts=None, repeat=5, timeout=60):
+    """
+    Luncurkan setiap skrip GUI `repeat` kali dan catat waktu sampai frame
+    interaktif pertama (ms) beserta modul berat yang sudah dimuat saat itu.
+    """
+    results = []
+    for script in scripts or _gui_scripts():
+        name = os.path.basename(script)
+        try:
+            runs = [_launch(script, timeout) for _ in range(repeat)]
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            results.append({'script': name, 'status': 'error', 'message': str(e)})
+            continue
+        times = [run['first_frame_ms'] for run in runs]
+        results.append({
+            'script': name,
+            'min_ms': min(times),
+            'median_ms': statistics.median(times),
+            'loaded': runs[-1]['loaded'],
+            'status': 'ok' if statistics.median(times) < STARTUP_TARGET_MS else 'slow',
+        })
+    return results
+
+
+def _print_startup(results, file=sys.stdout):
+    print(f"{'aplikasi':<18}{'min ms':>9}{'median ms':>11}  status  modul berat", file=file)
+    for r in results:
+        if r['status'] == 'error':
+            print(f"{r['script']:<18}{'-':>9}{'-':>11}  error: {r['message']}", file=file)
+            continue
+        print(f"{r['script']:<18}{r['min_ms']:>9.1f}{r['median_ms']:>11.1f}  {r['status']:<6}  "
+              f"{', '.join(r['loaded']) or '-'}", file=file)
+
+
+def _print_table(report, file=sys.stdout):
+    print(f"{'kasus':<18}{'engine':<8}{'us':>10}{'eval':>6}{'iter':>6}{'bytes':>9}"
+          f"{'|f(akar)|':>11}  status", file=file)
+    for r in report['results']:
+        if 'wall_us' not in r:
+            print(f"{r['case']:<18}{r['engine']:<8}{'-':>10}{'-':>6}{'-':>6}{'-':>9}{'-':>11}  "
+                  f"error: {r['message']}", file=file)
+            continue
+        print(f"{r['case']:<18}{r['engine']:<8}{r['wall_us']:>10.1f}{r['evaluations']:>6}"
+              f"{r['iterations']:>6}{r['peak_bytes']:>9}{abs(r['fx']):>11.1e}  {r['status']}",
+              file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="secant.bench",
+                                     description="Benchmark engine secant.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="jalankan korpus benchmark")
+    run.add_argument("-o", "--output", help="simpan hasil JSON ke file")
+    run.add_argument("--engines", nargs="+", choices=tuple(ENGINES),
+                     help="engine yang diukur (default semua)")
+    run.add_argument("--repeat", type=int, default=20,
+                     help="jumlah pengulangan per pengukuran waktu (default 20)")
+
+    cmp = sub.add_parser("compare", help="bandingkan dua file hasil")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10,
+                     help="kenaikan waktu relatif yang dianggap regresi (default 0.10)")
+
+    start = sub.add_parser("startup", help="ukur waktu cold start aplikasi GUI")
+    start.add_argument("scripts", nargs="*", help="skrip GUI (default semua gui-secant*.py)")
+    start.add_argument("--repeat", type=int, default=5,
+                       help="jumlah peluncuran per aplikasi (default 5)")
+
+    args = parser.parse_args(argv)
+    if args.command == "startup":
+        results = run_startup(args.scripts, args.repeat)
+        _print_startup(results)
+        print(f"Target: median < {STARTUP_TARGET_MS} ms sampai frame interaktif pertama.")
+        return 0 if all(r['status'] == 'ok' for r in results) else 1
+    if args.command == "run":
+        report = run_benchmarks(args.engines, repeat=args.repeat)
+        _print_table(report)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(report, file, indent=2)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print(f"REGRESI {line}")
+    if not regressions:
+        print("Tidak ada regresi.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
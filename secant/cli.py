@@ -0,0 +1,273 @@
+"""
+Antarmuka baris perintah headless untuk solver secant.
+
+Contoh:
+    python -m secant "2*x**3 - x - exp(-x)" --x0 0.1 --x1 2 --tol 1e-4
+    python -m secant --json job.json
+    python -m secant "x**2 - 2" --x0 1 --x1 2 --export riwayat.npz
+    echo '{"function": "x**2 - 2", "x0": 1, "x1": 2}' | python -m secant --json -
+    python -m secant --batch jobs.jsonl --output hasil.csv --flush-every 5000
+    python -m secant --batch jobs.jsonl --output hasil.jsonl --workers 0
+    python -m secant "sin(x)" --scan -10 10
+    python -m secant "2*x**3 - a*x - exp(-b*x)" --x0 0.1 --x1 2 --param a=0.5:3:100 --param b=1,2
+    python -m secant "2*x**3 - x - exp(-x)" --benchmark-backends
+
+Toleransi di bawah batas float64 (< 1e-12) diselesaikan dengan eskalasi ke
+mpmath (lihat secant.precision); akarnya juga ditulis sebagai string
+desimal lengkap di kunci 'root_digits'.
+
+Hasil ditulis sebagai JSON ke stdout. Kode keluar 0 jika konvergen,
+1 jika tidak, dan 2 untuk masukan yang tidak valid. Mode --batch
+memproses file job CSV/JSONL secara streaming (lihat secant.pipeline).
+"""
+
+import argparse
+import json
+import sys
+
+from .backends import FALLBACKS
+from .engine import ENGINES
+from .pipeline import dumps_json
+from .precision import format_precise, needs_escalation, solve_precise
+
+DEFAULTS = {'tol': 1e-6, 'max_iter': 100, 'method': 'secant'}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="secant",
+                                     description="Mencari akar f(x) dengan metode secant.")
+    parser.add_argument("function", nargs="?", help="ekspresi f(x), mis. 'x**3 + x**2 - 3*x - 3'")
+    parser.add_argument("--x0", type=float, help="tebakan awal x0")
+    parser.add_argument("--x1", type=float, help="tebakan awal x1")
+    parser.add_argument("--tol", type=float, help="toleransi error (default 1e-6)")
+    parser.add_argument("--max-iter", type=int, dest="max_iter",
+                        help="iterasi maksimum (default 100)")
+    parser.add_argument("--method", choices=tuple(ENGINES),
+                        help="engine: 'secant' biasa (default) atau 'hybrid' "
+                             "(secant + bracket/bisection gaya Brent)")
+    parser.add_argument("--backend", default="math", choices=tuple(FALLBACKS),
+                        help="backend evaluasi f (default math; numexpr/numba/jit "
+                             "jatuh kembali ke numpy/math jika tidak terpasang)")
+    parser.add_argument("--benchmark-backends", action="store_true",
+                        help="ukur biaya per evaluasi f untuk setiap backend yang terpasang")
+    parser.add_argument("--json", metavar="FILE",
+                        help="baca parameter dari file JSON ('-' untuk stdin); "
+                             "argumen baris perintah menimpa nilai dari file")
+    parser.add_argument("--history", action="store_true",
+                        help="sertakan tabel iterasi di keluaran")
+    parser.add_argument("--export", metavar="FILE",
+                        help="tulis riwayat iterasi ke FILE (.csv, .npy, .npz, "
+                             ".parquet/.arrow dengan pyarrow)")
+    parser.add_argument("--result-cache", metavar="FILE",
+                        help="cache hasil sqlite; solve yang sama dibaca dari cache "
+                             "(juga untuk --batch; tidak dipakai jika --tol < 1e-12)")
+    parser.add_argument("--scan", nargs=2, type=float, metavar=("A", "B"),
+                        help="cari semua akar di interval [A, B] (x0/x1 tidak dipakai)")
+    parser.add_argument("--samples", type=int, default=2001,
+                        help="jumlah titik grid untuk --scan (default 2001)")
+    parser.add_argument("--param", action="append", metavar="NAMA=NILAI",
+                        help="sapuan parameter: NAMA=awal:akhir:jumlah atau NAMA=v1,v2,...; "
+                             "boleh diulang untuk grid beberapa parameter")
+    parser.add_argument("--no-continuation", dest="continuation", action="store_false",
+                        help="sapuan tanpa warm start dari akar titik tetangga")
+    batch = parser.add_argument_group("mode batch")
+    batch.add_argument("--batch", metavar="FILE",
+                       help="file job CSV/JSONL ('-' untuk stdin)")
+    batch.add_argument("-o", "--output", metavar="FILE", default="-",
+                       help="file hasil (default stdout)")
+    batch.add_argument("--input-format", choices=("csv", "jsonl"),
+                       help="format file job (default dari ekstensi)")
+    batch.add_argument("--output-format", choices=("csv", "jsonl"),
+                       help="format file hasil (default dari ekstensi)")
+    batch.add_argument("--flush-every", type=int, default=1000, metavar="N",
+                       help="flush keluaran setiap N hasil (default 1000)")
+    batch.add_argument("--workers", type=int, default=1, metavar="N",
+                       help="jumlah proses worker; 0 = semua CPU (default 1)")
+    batch.add_argument("--chunksize", type=int, default=256, metavar="N",
+                       help="jumlah job per chunk untuk worker (default 256)")
+    return parser
+
+
+def load_job(args):
+    """Gabungkan parameter dari --json dan argumen baris perintah."""
+    job = dict(DEFAULTS)
+    if args.json:
+        if args.json == '-':
+            job.update(json.load(sys.stdin))
+        else:
+            with open(args.json) as file:
+                job.update(json.load(file))
+    for key in ('function', 'x0', 'x1', 'tol', 'max_iter', 'method'):
+        value = getattr(args, key)
+        if value is not None:
+            job[key] = value
+
+    missing = [key for key in ('function', 'x0', 'x1') if key not in job]
+    if missing:
+        raise ValueError(f"Parameter belum diisi: {', '.join(missing)}")
+    if float(job['tol']) <= 0:
+        raise ValueError("Toleransi harus lebih besar dari 0!")
+    if int(job['max_iter']) <= 0:
+        raise ValueError("Iterasi maksimum harus lebih besar dari 0!")
+    return job
+
+
+def result_to_dict(result, history=False):
+    data = {
+        'root': float(result.root),
+        'fx': float(result.fx),
+        'iterations': result.iterations,
+        'evaluations': result.evaluations,
+        'status': result.status_name,
+    }
+    if history:
+        data['history'] = [list(row) for row in result.history]
+    return data
+
+
+def run_batch(args):
+    from .pipeline import run_pipeline
+
+    try:
+        count = run_pipeline(args.batch, args.output, args.input_format,
+                             args.output_format, args.flush_every,
+                             workers=args.workers or None, chunksize=args.chunksize,
+                             method=args.method or 'secant', module=args.backend,
+                             result_cache=args.result_cache)
+    except OSError as e:
+        print(f"secant: {e}", file=sys.stderr)
+        return 2
+    print(f"secant: {count} job diproses", file=sys.stderr)
+    return 0
+
+
+def run_scan(args):
+    from .expression import make_function
+    from .scan import find_roots
+
+    if not args.function:
+        print("secant: Parameter belum diisi: function", file=sys.stderr)
+        return 2
+    try:
+        f = make_function(args.function, 'numpy')
+        result = find_roots(f, args.scan[0], args.scan[1], args.samples,
+                            tol=args.tol or 1e-12, max_iter=args.max_iter or 100)
+    except ValueError as e:
+        print(f"secant: {e}", file=sys.stderr)
+        return 2
+
+    sys.stdout.write(dumps_json({
+        'roots': result.roots.tolist(),
+        'fx': result.fvals.tolist(),
+        'evaluations': result.evaluations,
+    }))
+    sys.stdout.write("\n")
+    return 0 if result.roots.size else 1
+
+
+def parse_param(text):
+    """'a=0.5:3:100' -> ('a', linspace) dan 'b=1,2' -> ('b', [1.0, 2.0])."""
+    name, sep, spec = text.partition('=')
+    if not sep or not name.strip():
+        raise ValueError(f"Parameter harus berbentuk NAMA=NILAI: {text!r}")
+    if ':' in spec:
+        import numpy as np
+
+        start, stop, num = spec.split(':')
+        return name.strip(), np.linspace(float(start), float(stop), int(num))
+    return name.strip(), [float(value) for value in spec.split(',')]
+
+
+def run_sweep(args):
+    from .status import CONVERGED
+    from .sweep import sweep
+
+    try:
+        job = load_job(args)
+        params = dict(parse_param(text) for text in args.param)
+        result = sweep(job['function'], params, float(job['x0']), float(job['x1']),
+                       float(job['tol']), int(job['max_iter']),
+                       continuation=args.continuation)
+    except (ValueError, OSError) as e:
+        print(f"secant: {e}", file=sys.stderr)
+        return 2
+
+    converged = result.status == CONVERGED
+    roots = [None if not ok else root
+             for root, ok in zip(result.roots.ravel().tolist(), converged.ravel().tolist())]
+    sys.stdout.write(dumps_json({
+        'params': {name: list(map(float, values)) for name, values in params.items()},
+        'shape': list(result.roots.shape),
+        'roots': roots,
+        'converged': int(converged.sum()),
+        'evaluations': result.evaluations,
+    }))
+    sys.stdout.write("\n")
+    return 0 if converged.all() else 1
+
+
+def run_backend_benchmark(args):
+    from .backends import benchmark
+
+    def fmt(value):
+        return "-" if value is None else f"{value:.1f}"
+
+    expression = args.function or "2*x**3 - x - exp(-x)"
+    print(f"f(x) = {expression}")
+    print(f"{'backend':<10}{'ns/eval (skalar)':>18}{'ns/elemen (array)':>20}")
+    try:
+        rows = benchmark(expression)
+    except ValueError as e:
+        print(f"secant: {e}", file=sys.stderr)
+        return 2
+    for row in rows:
+        print(f"{row['backend']:<10}{fmt(row['scalar_ns']):>18}{fmt(row['array_ns']):>20}"
+              f"  {row['error']}".rstrip())
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.batch:
+        return run_batch(args)
+    if args.scan:
+        return run_scan(args)
+    if args.param:
+        return run_sweep(args)
+    if args.benchmark_backends:
+        return run_backend_benchmark(args)
+    try:
+        job = load_job(args)
+        params = (job['function'], float(job['x0']), float(job['x1']),
+                  float(job['tol']), int(job['max_iter']))
+        # Cache hasil menyimpan float64; solve presisi tinggi tidak di-cache
+        if args.result_cache and not needs_escalation(params[3]):
+            from .memo import get_store
+
+            result = get_store(args.result_cache).solve(*params, module=args.backend,
+                                                        method=job['method'])
+        else:
+            result = solve_precise(*params, method=job['method'], module=args.backend)
+    except (ValueError, OSError) as e:
+        print(f"secant: {e}", file=sys.stderr)
+        return 2
+    except (ArithmeticError, TypeError) as e:
+        print(f"secant: kesalahan perhitungan: {e}", file=sys.stderr)
+        return 2
+
+    if args.export:
+        from .export import export_history
+
+        try:
+            export_history(result.history, args.export)
+        except (ValueError, OSError) as e:
+            print(f"secant: {e}", file=sys.stderr)
+            return 2
+
+    data = result_to_dict(result, args.history)
+    if result.converged and needs_escalation(params[3]):
+        data['root_digits'] = format_precise(result.root, params[3])
+    sys.stdout.write(dumps_json(data))
+    sys.stdout.write("\n")
+    return 0 if result.converged else 1
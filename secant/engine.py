@@ -0,0 +1,382 @@
+"""
+Solver secant skalar inti.
+
+Setiap iterate baru dievaluasi tepat satu kali: pasangan (x, f(x)) dari
+langkah sebelumnya dibawa ke langkah berikutnya, sehingga satu iterasi
+hanya membutuhkan satu evaluasi f. Jumlah evaluasi dicatat di hasil.
+
+Selain `secant` tersedia `hybrid`, secant dengan pengaman bracket yang
+beralih ke interpolasi kuadratik invers / bisection (gaya Brent), serta
+`newton`/`halley` yang memakai turunan simbolik di dekat akar.
+"""
+
+import math
+import sys
+from dataclasses import dataclass, field
+
+from . import profiling
+from .history import IterationHistory
+from .status import CONVERGED, DIVERGED, MAX_ITER, ZERO_DIVISOR, status_name
+
+_EPS = sys.float_info.epsilon
+
+# Kesalahan evaluasi f yang berarti iterasi divergen. Backend 'math'
+# melempar OverflowError/ValueError/ZeroDivisionError ("math range error",
+# "math domain error") di tempat backend numpy mengembalikan inf/nan.
+_EVAL_ERRORS = (ArithmeticError, ValueError)
+
+
+@dataclass
+class SecantResult:
+    root: float
+    fx: float
+    iterations: int
+    evaluations: int
+    status: int
+    # Satu baris per iterasi: (step, x0, x1, x2, f(x2), error)
+    history: IterationHistory = field(default_factory=IterationHistory)
+
+    @property
+    def converged(self):
+        return self.status == CONVERGED
+
+    @property
+    def status_name(self):
+        return status_name(self.status)
+
+
+def secant(f, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+           callback=None):
+    """
+    Mencari akar f dengan metode secant mulai dari (x0, x1).
+
+    Iterasi berhenti dengan CONVERGED jika |x2 - x1| < tol atau (bila
+    `ftol` diberikan) |f(x2)| < ftol, dengan ZERO_DIVISOR jika
+    |f(x1) - f(x0)| <= divisor_tol, dengan DIVERGED jika iterate tidak
+    lagi finite atau f tidak bisa dievaluasi (overflow/domain), dan
+    dengan MAX_ITER jika batas iterasi tercapai.
+
+    Jika `callback` diberikan, fungsi itu dipanggil setelah setiap iterasi
+    sebagai callback(step, x2, f(x2), error) untuk melaporkan progres.
+    """
+    history = IterationHistory(x0, x1)
+    try:
+        fx0 = f(x0)
+        fx1 = f(x1)
+    except _EVAL_ERRORS:
+        return SecantResult(x1, float('nan'), 0, 2, DIVERGED, history)
+    evaluations = 2
+    root, froot = x1, fx1
+    status = MAX_ITER
+
+    for step in range(1, max_iter + 1):
+        denom = fx1 - fx0
+        if abs(denom) <= divisor_tol:
+            status = ZERO_DIVISOR
+            break
+
+        x2 = x1 - fx1 * (x1 - x0) / denom
+        if not math.isfinite(x2):
+            root, froot = x2, float('nan')
+            status = DIVERGED
+            break
+
+        evaluations += 1
+        try:
+            fx2 = f(x2)
+        except _EVAL_ERRORS:
+            root, froot = x2, float('nan')
+            status = DIVERGED
+            break
+        error = abs(x2 - x1)
+        history.append(x0, x1, x2, fx2, error)
+        root, froot = x2, fx2
+        if callback is not None:
+            callback(step, x2, fx2, error)
+
+        if error < tol or (ftol is not None and abs(fx2) < ftol):
+            status = CONVERGED
+            break
+
+        # Nilai fungsi dibawa ke langkah berikutnya, tidak dihitung ulang
+        x0, fx0 = x1, fx1
+        x1, fx1 = x2, fx2
+
+    return SecantResult(root, froot, len(history), evaluations, status, history)
+
+
+def _sign(value):
+    value = float(value)
+    return (value > 0) - (value < 0)
+
+
+def hybrid(f, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+           callback=None):
+    """
+    Secant dengan pengaman bracket (gaya Brent).
+
+    Selama f(x0) dan f(x1) bertanda sama, langkah secant biasa dipakai;
+    jika pembagi mendekati nol, interval diperlebar alih-alih berhenti.
+    Begitu ditemukan perubahan tanda, solver beralih ke metode Brent:
+    interpolasi kuadratik invers / secant di dalam bracket, dengan
+    bisection sebagai cadangan, sehingga konvergensi dijamin dan tetap
+    superlinear. Sebelum bracket ditemukan kriteria konvergen sama dengan
+    `secant` (|x2 - x1| < tol); di dalam bracket solver hanya berhenti jika
+    setengah lebar bracket <= tol/2, sehingga akar dijamin berada dalam tol
+    dari hasil. |f| < ftol berlaku di kedua fase.
+    Parameter dan hasil sama dengan `secant`.
+    """
+    history = IterationHistory(x0, x1)
+    try:
+        fa, fb = f(x0), f(x1)
+    except _EVAL_ERRORS:
+        return SecantResult(x1, float('nan'), 0, 2, DIVERGED, history)
+    evaluations = 2
+    a, b = x0, x1
+    step = 0
+
+    def record(x_prev, x_new, f_new, error, other):
+        history.append(other, x_prev, x_new, f_new, error)
+        if callback is not None:
+            callback(step, x_new, f_new, error)
+
+    def done(root, froot, status):
+        return SecantResult(root, froot, len(history), evaluations, status, history)
+
+    if fb == 0:
+        return done(b, fb, CONVERGED)
+    if fa == 0:
+        return done(a, fa, CONVERGED)
+
+    # Fase 1: secant tanpa bracket sampai tanda f berubah
+    while _sign(fa) == _sign(fb):
+        if step >= max_iter:
+            return done(b, fb, MAX_ITER)
+        step += 1
+        denom = fb - fa
+        if abs(denom) <= divisor_tol:
+            if a == b:
+                return done(b, fb, ZERO_DIVISOR)
+            # Kemiringan datar: perlebar interval menjauhi a
+            x2 = b + 1.618 * (b - a)
+        else:
+            x2 = b - fb * (b - a) / denom
+        if not math.isfinite(x2):
+            return done(x2, float('nan'), DIVERGED)
+
+        evaluations += 1
+        try:
+            f2 = f(x2)
+        except _EVAL_ERRORS:
+            return done(x2, float('nan'), DIVERGED)
+        error = abs(x2 - b)
+        record(b, x2, f2, error, a)
+        if f2 == 0 or error < tol or (ftol is not None and abs(f2) < ftol):
+            return done(x2, f2, CONVERGED)
+
+        # Jika tanda f2 berbeda dari fb, [b, x2] menjadi bracket untuk fase 2
+        a, fa, b, fb = b, fb, x2, f2
+
+    # Fase 2: Brent pada bracket [a, b]; c selalu berlawanan tanda dengan b
+    c, fc = a, fa
+    d = e = b - a
+    while True:
+        if _sign(fb) == _sign(fc):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * _EPS * abs(b) + 0.5 * tol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or fb == 0:
+            return done(b, fb, CONVERGED)
+        if step >= max_iter:
+            return done(b, fb, MAX_ITER)
+
+        if abs(e) < tol1 or abs(fa) <= abs(fb):
+            d = e = m
+        else:
+            s = fb / fa
+            if a == c:
+                # Langkah secant
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Interpolasi kuadratik invers
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            # Brent klasik menolak langkah yang tidak lebih kecil dari
+            # setengah langkah sebelumnya; 3/4 masih menjamin langkah menyusut
+            # geometris, tetapi tidak memaksa bisection pada akar ganda, di
+            # mana langkah interpolasi menyusut lebih lambat dari setengah
+            if p < min(1.5 * m * q - 0.5 * abs(tol1 * q), 0.75 * abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+
+        a, fa = b, fb
+        b = b + d if abs(d) > tol1 else b + (tol1 if m > 0 else -tol1)
+        step += 1
+        evaluations += 1
+        try:
+            fb = f(b)
+        except _EVAL_ERRORS:
+            return done(b, float('nan'), DIVERGED)
+        record(a, b, fb, abs(b - a), c)
+        if ftol is not None and abs(fb) < ftol:
+            return done(b, fb, CONVERGED)
+
+
+def accelerated(fdf, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+                callback=None, order=1):
+    """
+    Secant yang dipercepat dengan turunan simbolik.
+
+    `fdf(x)` mengembalikan [f, f'] (atau [f, f', f''] untuk order=2), lihat
+    `make_derivative_function`. Langkah secant dipakai selama iterate masih
+    jauh dari akar; begitu kemiringan secant dan f' sudah konsisten (beda
+    relatif <= 50%), langkah Newton (order=1) atau Halley (order=2) dipakai.
+    Jika f' nol atau tidak finite, langkah kembali ke secant. Satu panggilan
+    fdf dihitung sebagai satu evaluasi. Kriteria berhenti sama dengan `secant`.
+    """
+    history = IterationHistory(x0, x1)
+    try:
+        fx0 = fdf(x0)[0]
+        values = fdf(x1)
+    except _EVAL_ERRORS:
+        return SecantResult(x1, float('nan'), 0, 2, DIVERGED, history)
+    evaluations = 2
+    fx1 = values[0]
+    root, froot = x1, fx1
+    status = MAX_ITER
+
+    for step in range(1, max_iter + 1):
+        denom = fx1 - fx0
+        x2 = None
+        d1 = values[1]
+        if x1 != x0 and math.isfinite(d1) and d1 != 0:
+            slope = denom / (x1 - x0)
+            if abs(d1 - slope) <= 0.5 * abs(d1):
+                if order == 2 and math.isfinite(values[2]):
+                    h = 2 * d1 * d1 - fx1 * values[2]
+                    if h != 0:
+                        x2 = x1 - 2 * fx1 * d1 / h
+                if x2 is None:
+                    x2 = x1 - fx1 / d1
+
+        if x2 is None:
+            if abs(denom) <= divisor_tol:
+                status = ZERO_DIVISOR
+                break
+            x2 = x1 - fx1 * (x1 - x0) / denom
+        if not math.isfinite(x2):
+            root, froot = x2, float('nan')
+            status = DIVERGED
+            break
+
+        evaluations += 1
+        try:
+            values = fdf(x2)
+        except _EVAL_ERRORS:
+            root, froot = x2, float('nan')
+            status = DIVERGED
+            break
+        fx2 = values[0]
+        error = abs(x2 - x1)
+        history.append(x0, x1, x2, fx2, error)
+        root, froot = x2, fx2
+        if callback is not None:
+            callback(step, x2, fx2, error)
+
+        if error < tol or (ftol is not None and abs(fx2) < ftol):
+            status = CONVERGED
+            break
+
+        x0, fx0 = x1, fx1
+        x1, fx1 = x2, fx2
+
+    return SecantResult(root, froot, len(history), evaluations, status, history)
+
+
+def newton(fdf, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0, callback=None):
+    """`accelerated` dengan langkah Newton; `fdf` mengembalikan [f, f']."""
+    return accelerated(fdf, x0, x1, tol, max_iter, ftol, divisor_tol, callback, order=1)
+
+
+def halley(fdf, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0, callback=None):
+    """`accelerated` dengan langkah Halley; `fdf` mengembalikan [f, f', f'']."""
+    return accelerated(fdf, x0, x1, tol, max_iter, ftol, divisor_tol, callback, order=2)
+
+
+# Versi hasil numerik engine. Naikkan setiap kali perubahan engine dapat
+# mengubah root, riwayat, atau status, agar hasil yang tersimpan di cache
+# hasil (secant.memo) tidak dipakai lagi.
+ENGINE_VERSION = 5
+
+# Engine yang bisa dipilih lewat parameter `method`
+ENGINES = {
+    'secant': secant,
+    'hybrid': hybrid,
+    'newton': newton,
+    'halley': halley,
+}
+
+# Engine yang membutuhkan fungsi turunan (nilai = orde turunan tertinggi)
+DERIVATIVE_ORDER = {
+    'newton': 1,
+    'halley': 2,
+}
+
+
+def prepare(func_str, method="secant", module="math"):
+    """
+    Siapkan (engine, fungsi) untuk menyelesaikan `func_str` dengan `method`.
+
+    Untuk 'newton'/'halley' fungsi yang dikembalikan adalah f beserta
+    turunannya. Jika turunan kedua tidak tersedia, 'halley' turun menjadi
+    'newton'; jika ekspresi tidak bisa diturunkan sama sekali, engine jatuh
+    kembali ke 'secant' dengan f biasa.
+    """
+    from .expression import make_derivative_function, make_function
+
+    engine = get_engine(method)
+    order = DERIVATIVE_ORDER.get(method)
+    f = make_function(func_str, module)  # validasi ekspresi lebih dulu
+    if order is None:
+        return engine, f
+    for engine, order in ((engine, order), (newton, 1)):
+        try:
+            return engine, make_derivative_function(func_str, order, module)
+        except ValueError:
+            continue
+    return secant, f
+
+
+def solve(func_str, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+          module="math", callback=None, method="secant"):
+    """
+    Parsing `func_str` (lewat cache fungsi) lalu menjalankan engine
+    `method` ('secant', 'hybrid', 'newton' atau 'halley', lihat ENGINES).
+    """
+    engine, f = prepare(func_str, method, module)
+    with profiling.stage('iterate'):
+        result = engine(f, x0, x1, tol, max_iter, ftol=ftol, divisor_tol=divisor_tol,
+                        callback=callback)
+    profiling.count('evaluations', result.evaluations)
+    return result
+
+
+def get_engine(method):
+    try:
+        return ENGINES[method]
+    except KeyError:
+        raise ValueError(f"Metode tidak dikenal: {method!r} "
+                         f"(pilihan: {', '.join(ENGINES)})") from None
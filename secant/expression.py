@@ -0,0 +1,167 @@
+"""
+Parsing string fungsi f(x) menjadi fungsi numerik.
+
+Hasil kompilasi disimpan di cache LRU berbatas yang dikunci dengan teks
+ekspresi yang sudah dinormalisasi dan backend-nya, sehingga menjalankan
+ulang fungsi yang sama (atau yang hanya berbeda format/spasi) tidak
+memanggil sympy lagi.
+"""
+
+import ast
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from . import profiling
+from .backends import build, build_derivatives, build_parametric
+
+
+@lru_cache(maxsize=1024)
+def canonicalize(func_str):
+    """
+    Bentuk kanonik teks ekspresi untuk kunci cache.
+
+    Spasi dan tanda kurung yang berlebihan dihilangkan lewat modul `ast`
+    (tanpa mengimpor sympy); '^' diperlakukan sebagai '**' seperti sympify.
+    """
+    text = func_str.strip().replace('^', '**')
+    try:
+        return ast.unparse(ast.parse(text, mode='eval'))
+    except SyntaxError:
+        return ' '.join(text.split())
+
+
+class FunctionCache:
+    """Cache LRU berbatas untuk fungsi hasil kompilasi."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Ambil fungsi untuk `key`, atau bangun dengan `build()` jika belum ada."""
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+
+        value = build()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def info(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_cache = FunctionCache()
+
+
+def cache_info():
+    """Statistik cache fungsi default (hits, misses, evictions, size)."""
+    return _cache.info()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def make_function(func_str, module="numpy", cache=None):
+    """
+    Membuat fungsi numerik dari string ekspresi matematis.
+
+    `module` adalah nama backend (lihat secant.backends): 'math' untuk
+    evaluasi skalar, 'numpy' (default) untuk array, 'numexpr'/'numba'/'jit'
+    bila terpasang, atau 'mpmath'. Backend yang tidak tersedia digantikan
+    backend berikutnya di rantai fallback. Melempar ValueError jika
+    ekspresi tidak dapat diparsing.
+    """
+    cache = _cache if cache is None else cache
+    canonical = canonicalize(func_str)
+    f = cache.get((canonical, module), lambda: _compile_or_error(canonical, module))
+    if isinstance(f, ValueError):
+        raise ValueError(str(f))
+    return f
+
+
+def _compile_or_error(canonical, module):
+    # Ekspresi yang gagal diparsing juga di-cache agar tidak diparsing ulang
+    try:
+        with profiling.stage('compile'):
+            return build(canonical, module)
+    except ValueError as e:
+        return e
+
+
+def make_derivative_function(func_str, order=1, module="math", cache=None):
+    """
+    Membuat fungsi x -> [f(x), f'(x)] (atau [f, f', f''] untuk order=2).
+
+    Turunan dibangun secara simbolik satu kali, dikompilasi bersama f
+    dengan CSE, dan di-cache seperti `make_function`. Melempar ValueError
+    jika ekspresi tidak valid atau tidak bisa diturunkan.
+    """
+    cache = _cache if cache is None else cache
+    canonical = canonicalize(func_str)
+    key = (canonical, module, 'derivatives', order)
+    f = cache.get(key, lambda: _derivatives_or_error(canonical, order, module))
+    if isinstance(f, ValueError):
+        raise ValueError(str(f))
+    return f
+
+
+def _derivatives_or_error(canonical, order, module):
+    try:
+        with profiling.stage('compile'):
+            return build_derivatives(canonical, order, module)
+    except ValueError as e:
+        return e
+
+
+def make_parametric_function(func_str, params, module="numpy", cache=None):
+    """
+    Membuat fungsi f(x, *params) dari ekspresi dengan parameter tambahan,
+    mis. make_parametric_function("2*x**3 - a*x - exp(-b*x)", ("a", "b")).
+
+    Dikompilasi sekali dan di-cache seperti `make_function`; dengan
+    backend 'numpy' x dan parameter boleh berupa array (di-broadcast).
+    """
+    cache = _cache if cache is None else cache
+    canonical = canonicalize(func_str)
+    params = tuple(params)
+    key = (canonical, module, 'params', params)
+    f = cache.get(key, lambda: _parametric_or_error(canonical, params, module))
+    if isinstance(f, ValueError):
+        raise ValueError(str(f))
+    return f
+
+
+def _parametric_or_error(canonical, params, module):
+    try:
+        with profiling.stage('compile'):
+            return build_parametric(canonical, params, module)
+    except ValueError as e:
+        return e
@@ -0,0 +1,102 @@
+"""
+Riwayat iterasi berbentuk kolom.
+
+Setiap kolom (x0, x1, x2, f(x2), error) disimpan di `array('d')` yang
+dialokasikan per chunk, sehingga satu iterasi hanya memakan 5 x 8 byte,
+bukan tuple/dict berisi objek float Python. Tabel, grafik, dan ekspor
+dapat membaca kolom lewat `memoryview` tanpa menyalin data.
+"""
+
+from array import array
+
+COLUMNS = ('x0', 'x1', 'x2', 'fx', 'error')
+
+
+class IterationHistory:
+    """
+    Riwayat iterasi secant.
+
+    `history[i]` mengembalikan tuple (step, x0, x1, x2, f(x2), error)
+    dengan step mulai dari 1, sama seperti baris riwayat sebelumnya,
+    sedangkan `column(name)` memberikan view tanpa salinan atas satu kolom.
+    """
+
+    def __init__(self, x0=None, x1=None, chunk=64):
+        self.start = (x0, x1)
+        self._chunk = chunk
+        self._size = 0
+        self._capacity = 0
+        self._columns = [array('d') for _ in COLUMNS]
+
+    def _grow(self):
+        # Kolom diganti dengan array baru (bukan di-resize di tempat), jadi
+        # memoryview lama tetap sah dan tidak memicu BufferError.
+        extra = max(self._chunk, self._capacity)
+        padding = array('d', bytes(8 * extra))
+        self._columns = [array('d', column) + padding for column in self._columns]
+        self._capacity += extra
+
+    def append(self, x0, x1, x2, fx, error):
+        if self._size == self._capacity:
+            self._grow()
+        i = self._size
+        for column, value in zip(self._columns, (x0, x1, x2, fx, error)):
+            column[i] = value
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("indeks riwayat di luar jangkauan")
+        return (index + 1,) + tuple(column[index] for column in self._columns)
+
+    def __iter__(self):
+        columns = [self.column(name) for name in COLUMNS]
+        for step, row in enumerate(zip(*columns), 1):
+            yield (step,) + row
+
+    @property
+    def steps(self):
+        return range(1, self._size + 1)
+
+    def column(self, name):
+        """View (memoryview, tanpa salinan) atas kolom `name` sepanjang riwayat."""
+        return memoryview(self._columns[COLUMNS.index(name)])[:self._size]
+
+    def x_values(self):
+        """Barisan x0, x1, x2, ... (tebakan awal diikuti setiap iterate baru)."""
+        values = array('d', [v for v in self.start if v is not None])
+        values.extend(self.column('x2'))
+        return values
+
+    def concat(self, other):
+        """Riwayat baru: baris-baris riwayat ini diikuti baris `other`."""
+        history = IterationHistory(*self.start, chunk=self._chunk)
+        n, m = self._size, other._size
+        history._columns = [array('d', a[:n]) + array('d', b[:m])
+                            for a, b in zip(self._columns, other._columns)]
+        history._size = history._capacity = n + m
+        return history
+
+    def tobytes(self):
+        """Data kolom (x0, x1, x2, fx, error berurutan) sebagai bytes float64."""
+        return b''.join(column[:self._size].tobytes() for column in self._columns)
+
+    @classmethod
+    def frombytes(cls, data, x0=None, x1=None):
+        """Kebalikan `tobytes`: bangun riwayat dari data kolom."""
+        values = array('d')
+        values.frombytes(data)
+        size = len(values) // len(COLUMNS)
+        history = cls(x0, x1)
+        history._columns = [values[i * size:(i + 1) * size] for i in range(len(COLUMNS))]
+        history._size = history._capacity = size
+        return history
+
+    def nbytes(self):
+        """Memori yang dipakai data kolom (termasuk kapasitas cadangan)."""
+        return sum(column.itemsize * len(column) for column in self._columns)
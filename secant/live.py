@@ -0,0 +1,93 @@
+"""
+Solve ulang cepat untuk mode hitung otomatis di GUI.
+
+`LiveSolver` mengingat hasil terakhir. Jika masukan berikutnya hanya
+memperketat toleransi (fungsi, tebakan awal, metode, dan iterasi maksimum
+sama, dan hasil sebelumnya konvergen), iterasi dilanjutkan dari dua
+iterate terakhir alih-alih diulang dari x0/x1; riwayatnya disambung ke
+riwayat sebelumnya. Untuk secant dan newton/halley root, status, dan
+baris riwayatnya sama dengan menjalankan ulang dari awal (keadaan loop
+hanyalah pasangan iterate terakhir); hanya jumlah evaluasi yang lebih
+besar dua, karena pasangan itu dievaluasi ulang. Jika iterate terakhir
+sudah memenuhi toleransi baru, hasil sebelumnya dikembalikan apa adanya.
+`hybrid` dilanjutkan dari bracket terakhirnya, jadi hasilnya bisa berbeda
+dari run ulang.
+Masukan yang sama persis langsung mengembalikan hasil sebelumnya, dan
+fungsi hasil kompilasi selalu diambil dari cache fungsi.
+
+Selain string ekspresi, `func` boleh berupa fungsi Python biasa (dipakai
+apa adanya dengan engine `method`).
+"""
+
+from . import profiling
+from .engine import SecantResult, get_engine, prepare
+from .expression import canonicalize
+
+
+class LiveSolver:
+    """Solver dengan warm start dari hasil terakhir (lihat docstring modul)."""
+
+    def __init__(self, module="math"):
+        self.module = module
+        self._last = None
+
+    def clear(self):
+        self._last = None
+
+    def solve(self, func, x0, x1, tol=1e-6, max_iter=100, method="secant",
+              ftol=None, divisor_tol=0.0, callback=None):
+        """Seperti `secant.solve`, tetapi memakai ulang hasil terakhir bila bisa."""
+        if isinstance(func, str):
+            engine, f = prepare(func, method, self.module)
+            func = canonicalize(func)
+        else:
+            engine, f = get_engine(method), func
+        key = (func, float(x0), float(x1), max_iter, method)
+        criteria = (tol, ftol, divisor_tol)
+
+        last = self._last
+        if last is not None and last[0] == key:
+            _, last_criteria, previous = last
+            if criteria == last_criteria:
+                return previous
+            if self._can_resume(previous, last_criteria, criteria, max_iter):
+                result = self._resume(engine, f, method, previous, tol, max_iter,
+                                      ftol, divisor_tol, callback)
+                self._last = (key, criteria, result)
+                return result
+
+        result = engine(f, x0, x1, tol, max_iter, ftol=ftol, divisor_tol=divisor_tol,
+                        callback=callback)
+        self._last = (key, criteria, result)
+        return result
+
+    @staticmethod
+    def _can_resume(previous, old, new, max_iter):
+        (old_tol, old_ftol, old_divisor), (tol, ftol, divisor_tol) = old, new
+        # Setiap kriteria harus sama atau lebih ketat, agar run lama pasti
+        # belum berhenti lebih awal daripada run baru
+        stricter = (tol <= old_tol
+                    and (ftol == old_ftol or (ftol is not None and old_ftol is not None
+                                              and ftol <= old_ftol))
+                    and divisor_tol <= old_divisor)
+        return (stricter and previous.converged and len(previous.history)
+                and previous.iterations < max_iter)
+
+    def _resume(self, engine, f, method, previous, tol, max_iter, ftol, divisor_tol,
+                callback):
+        _, a, b, c, fc, error = previous.history[-1]
+        if method != 'hybrid' and (error < tol or (ftol is not None and abs(fc) < ftol)):
+            # Run ulang dari awal juga berhenti tepat di iterate ini
+            return previous
+        profiling.count('warm_start')
+        start = (a, c) if method == 'hybrid' else (b, c)
+        offset = previous.iterations
+
+        def shifted(step, *progress):
+            callback(step + offset, *progress)
+
+        tail = engine(f, *start, tol, max_iter - offset, ftol=ftol, divisor_tol=divisor_tol,
+                      callback=shifted if callback is not None else None)
+        return SecantResult(tail.root, tail.fx, offset + tail.iterations,
+                            previous.evaluations + tail.evaluations, tail.status,
+                            previous.history.concat(tail.history))
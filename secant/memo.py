@@ -0,0 +1,184 @@
+"""
+Cache hasil solve yang dialamatkan dengan isi (content-addressed).
+
+Kunci hasil adalah hash SHA-256 dari ekspresi kanonik, tebakan awal,
+toleransi, batas iterasi, metode, backend, dan `ENGINE_VERSION`, sehingga
+solve yang identik (termasuk yang hanya berbeda format ekspresi) memakai
+hasil yang sama, dan hasil dari versi engine lama tidak pernah dipakai.
+
+`ResultStore` punya dua tingkat:
+
+- memori: LRU berbatas (`FunctionCache`); hit mengembalikan objek
+  SecantResult yang sama dalam hitungan mikrodetik. Hasil bersama ini
+  harus diperlakukan sebagai read-only.
+- disk (opsional, `path`): tabel sqlite berisi root, status, dan riwayat
+  iterasi sebagai blob float64. Ukurannya dibatasi `max_bytes`; jika
+  terlampaui, entri yang paling lama tidak diakses dihapus lebih dulu.
+  Baris dari versi engine lain dihapus saat store dibuka.
+"""
+
+import hashlib
+import math
+import sqlite3
+import struct
+import threading
+import time
+
+from .engine import ENGINE_VERSION, SecantResult, prepare
+from .expression import FunctionCache, canonicalize
+from .history import IterationHistory
+
+# root, fx, iterations, evaluations, status, x0 awal, x1 awal
+_HEADER = struct.Struct('<ddqqqdd')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    data BLOB NOT NULL
+)
+"""
+
+
+def result_key(func_str, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+               module="math", method="secant"):
+    """Kunci isi (hex SHA-256) untuk satu solve."""
+    parts = (ENGINE_VERSION, canonicalize(func_str), float(x0), float(x1), float(tol),
+             int(max_iter), None if ftol is None else float(ftol), float(divisor_tol),
+             module, method)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def _encode(result):
+    x0, x1 = (math.nan if v is None else float(v) for v in result.history.start)
+    header = _HEADER.pack(float(result.root), float(result.fx), result.iterations,
+                          result.evaluations, result.status, x0, x1)
+    return header + result.history.tobytes()
+
+
+def _decode(data):
+    root, fx, iterations, evaluations, status, x0, x1 = _HEADER.unpack_from(data)
+    history = IterationHistory.frombytes(data[_HEADER.size:], x0, x1)
+    return SecantResult(root, fx, iterations, evaluations, status, history)
+
+
+class ResultStore:
+    """Cache hasil dua tingkat (memori LRU + sqlite opsional)."""
+
+    def __init__(self, maxsize=256, path=None, max_bytes=64 * 2**20):
+        self._memory = FunctionCache(maxsize)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.disk_hits = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            try:
+                self._open(path)
+            except sqlite3.Error as e:
+                raise OSError(f"Cache hasil {path!r} tidak bisa dibuka: {e}") from e
+
+    def _open(self, path):
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        self._db.execute("DELETE FROM results WHERE version != ?", (ENGINE_VERSION,))
+        self._disk_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def solve(self, func_str, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+              module="math", method="secant"):
+        """
+        Seperti `secant.solve` (tanpa callback), tetapi hasil diambil dari
+        cache jika solve yang sama pernah dijalankan.
+        """
+        key = result_key(func_str, x0, x1, tol, max_iter, ftol, divisor_tol, module, method)
+
+        def compute():
+            result = self._load(key)
+            if result is None:
+                engine, f = prepare(func_str, method, module)
+                result = engine(f, x0, x1, tol, max_iter, ftol=ftol, divisor_tol=divisor_tol)
+                self._store(key, result)
+            return result
+
+        return self._memory.get(key, compute)
+
+    def _load(self, key):
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.disk_hits += 1
+        return _decode(row[0])
+
+    def _store(self, key, result):
+        if self._db is None:
+            return
+        data = _encode(result)
+        with self._lock:
+            # Kunci yang sudah ada diganti; ukuran lamanya tidak dihitung dua kali
+            old = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                             (key, ENGINE_VERSION, len(data), time.time(), data))
+            self._disk_bytes += len(data) - (old[0] if old else 0)
+            if self._disk_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Hitung ulang (proses lain mungkin ikut menulis), lalu buang entri
+        # terlama sampai ukuran turun ke 90% batas agar tidak evict setiap insert
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        target = 0.9 * self.max_bytes
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self._disk_bytes = total
+
+    def info(self):
+        """Statistik tingkat memori ditambah jumlah entri dan ukuran tingkat disk."""
+        info = self._memory.info()
+        info['disk_hits'] = self.disk_hits
+        if self._db is not None:
+            with self._lock:
+                entries, size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+            info.update(disk_entries=entries, disk_bytes=size, disk_max_bytes=self.max_bytes)
+        return info
+
+    def clear(self):
+        """Kosongkan kedua tingkat."""
+        self._memory.clear()
+        self.disk_hits = 0
+        if self._db is not None:
+            with self._lock:
+                self._db.execute("DELETE FROM results")
+                self._disk_bytes = 0
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+_stores = {}
+
+
+def get_store(path=None):
+    """Store bersama per `path` (None = hanya memori) untuk proses ini."""
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = ResultStore(path=path)
+    return store
@@ -0,0 +1,55 @@
+"""
+Eksekusi paralel job secant dengan process pool.
+
+Job dikirim per chunk ke proses worker agar overhead pickling dan IPC
+dibagi ke banyak job. Setiap worker memakai cache fungsi modul
+`secant.expression` miliknya sendiri, yang tetap hidup selama proses
+worker hidup, sehingga ekspresi yang sama hanya dikompilasi sekali per
+worker. Cache hasil di disk (`result_cache`) juga dibuka sekali per
+worker. Jumlah chunk yang sedang diproses dibatasi, dan hasil
+dikembalikan sesuai urutan input.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .pipeline import solve_jobs
+
+
+def _solve_chunk(start, rows, module, method, result_cache):
+    return list(solve_jobs(rows, module, start=start, method=method, result_cache=result_cache))
+
+
+def _chunks(jobs, size):
+    jobs = iter(jobs)
+    while True:
+        chunk = list(islice(jobs, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_parallel(jobs, workers=None, chunksize=256, module='math', max_pending=None,
+                   method='secant', result_cache=None):
+    """
+    Generator baris hasil (seperti `solve_jobs`) yang dihitung di `workers` proses.
+
+    `workers` default ke jumlah CPU. Paling banyak `max_pending` chunk
+    (default 2 x workers) berada di antrean sekaligus, sehingga memori
+    tetap terbatas untuk input streaming.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    pending = deque()
+    start = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _chunks(jobs, chunksize):
+            pending.append(pool.submit(_solve_chunk, start, chunk, module, method,
+                                       result_cache))
+            start += len(chunk)
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,194 @@
+"""
+Pipeline batch berbasis generator untuk file job berukuran besar.
+
+Job (function, x0, x1, tol, max_iter, dan opsional method) dibaca baris demi baris dari CSV
+atau JSONL, diselesaikan satu per satu, dan hasilnya langsung ditulis
+ke keluaran. Tidak ada tahap yang menyimpan seluruh file di memori,
+sehingga ukuran input tidak dibatasi oleh RAM.
+"""
+
+import csv
+import json
+import math
+import sys
+
+from .engine import prepare
+
+RESULT_FIELDS = ['index', 'function', 'x0', 'x1', 'tol', 'max_iter',
+                 'root', 'fx', 'iterations', 'evaluations', 'status', 'message']
+
+DEFAULT_TOL = 1e-6
+DEFAULT_MAX_ITER = 100
+
+
+def detect_format(path, default='jsonl'):
+    """Tebak format ('csv' atau 'jsonl') dari ekstensi file."""
+    if path.lower().endswith('.csv'):
+        return 'csv'
+    if path.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    return default
+
+
+def json_safe(value):
+    """Salinan `value` dengan float NaN/Infinity diganti None (null di JSON)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    return value
+
+
+def dumps_json(value):
+    """
+    json.dumps yang selalu menghasilkan JSON valid: NaN/Infinity (mis.
+    root/fx dari solve yang divergen) ditulis sebagai null.
+    """
+    return json.dumps(json_safe(value), allow_nan=False)
+
+
+def _open(path, mode):
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return open(path, mode, newline='' if path.lower().endswith('.csv') else None)
+
+
+def read_jobs(file, fmt='jsonl'):
+    """
+    Generator job (dict) dari objek file CSV atau JSONL yang sudah terbuka.
+
+    Baris JSONL yang bukan JSON valid atau bukan objek tidak menghentikan
+    stream: sebagai gantinya dihasilkan ValueError berisi nomor barisnya,
+    yang oleh `solve_jobs` ditulis sebagai baris berstatus 'error'.
+    """
+    if fmt == 'csv':
+        yield from csv.DictReader(file)
+        return
+    for lineno, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield ValueError(f"Baris {lineno}: JSON tidak valid: {e}")
+            continue
+        if not isinstance(row, dict):
+            yield ValueError(f"Baris {lineno}: job harus berupa objek JSON")
+            continue
+        yield row
+
+
+def _parse_job(row):
+    func_str = row.get('function') or row.get('expression')
+    if not func_str:
+        raise ValueError("Kolom 'function' kosong")
+    tol = row.get('tol')
+    max_iter = row.get('max_iter')
+    tol = DEFAULT_TOL if tol in (None, '') else float(tol)
+    max_iter = DEFAULT_MAX_ITER if max_iter in (None, '') else int(max_iter)
+    if tol <= 0:
+        raise ValueError("Toleransi harus lebih besar dari 0!")
+    if max_iter <= 0:
+        raise ValueError("Iterasi maksimum harus lebih besar dari 0!")
+    return func_str, float(row['x0']), float(row['x1']), tol, max_iter
+
+
+def solve_jobs(jobs, module='math', start=0, method='secant', result_cache=None):
+    """
+    Generator baris hasil untuk setiap job.
+
+    Kolom 'method' pada job (jika ada) menimpa `method` default. Jika
+    `result_cache` (path file sqlite) diberikan, hasil diambil dari dan
+    disimpan ke cache hasil `secant.memo`, sehingga job yang sama pada
+    run berikutnya tidak dihitung ulang.
+
+    Job yang tidak valid atau gagal dihitung tidak menghentikan stream;
+    barisnya diberi status 'error' dan pesan kesalahannya.
+    """
+    store = None
+    if result_cache is not None:
+        from .memo import get_store
+
+        store = get_store(result_cache)
+    for index, row in enumerate(jobs, start):
+        fields = row if isinstance(row, dict) else {}
+        out = {'index': index, 'function': fields.get('function') or fields.get('expression'),
+               'x0': fields.get('x0'), 'x1': fields.get('x1'),
+               'tol': fields.get('tol'), 'max_iter': fields.get('max_iter')}
+        try:
+            if not isinstance(row, dict):
+                # Baris input yang tidak bisa dibaca (lihat `read_jobs`)
+                raise row if isinstance(row, ValueError) else ValueError(
+                    "Job harus berupa objek JSON")
+            func_str, x0, x1, tol, max_iter = _parse_job(row)
+            out.update(x0=x0, x1=x1, tol=tol, max_iter=max_iter)
+            row_method = row.get('method') or method
+            if store is not None:
+                result = store.solve(func_str, x0, x1, tol, max_iter, module=module,
+                                     method=row_method)
+            else:
+                engine, f = prepare(func_str, row_method, module)
+                result = engine(f, x0, x1, tol, max_iter)
+            out.update(root=float(result.root), fx=float(result.fx),
+                       iterations=result.iterations, evaluations=result.evaluations,
+                       status=result.status_name, message='')
+        except (ValueError, KeyError, TypeError, ArithmeticError, NameError) as e:
+            out.update(root=None, fx=None, iterations=0, evaluations=0,
+                       status='error', message=str(e))
+        yield out
+
+
+def write_results(rows, file, fmt='jsonl', flush_every=1000):
+    """
+    Tulis baris hasil secara bertahap dan flush setiap `flush_every` baris.
+
+    Mengembalikan jumlah baris yang ditulis.
+    """
+    if fmt == 'csv':
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(row):
+            file.write(dumps_json(row))
+            file.write('\n')
+
+    count = 0
+    for row in rows:
+        write(row)
+        count += 1
+        if flush_every and count % flush_every == 0:
+            file.flush()
+    file.flush()
+    return count
+
+
+def run_pipeline(src, dst='-', in_fmt=None, out_fmt=None, flush_every=1000, module='math',
+                 workers=1, chunksize=256, method='secant', result_cache=None):
+    """
+    Baca job dari `src`, selesaikan, dan tulis hasil ke `dst` ('-' = stdin/stdout).
+
+    Dengan `workers` > 1 (atau None = semua CPU) job diselesaikan di
+    process pool lewat `secant.parallel.solve_parallel`.
+    """
+    in_fmt = in_fmt or detect_format(src)
+    out_fmt = out_fmt or detect_format(dst, default=in_fmt)
+    source = _open(src, 'r')
+    target = _open(dst, 'w')
+    jobs = read_jobs(source, in_fmt)
+    if workers == 1:
+        results = solve_jobs(jobs, module, method=method, result_cache=result_cache)
+    else:
+        from .parallel import solve_parallel
+
+        results = solve_parallel(jobs, workers, chunksize, module, method=method,
+                                 result_cache=result_cache)
+    try:
+        return write_results(results, target, out_fmt, flush_every)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
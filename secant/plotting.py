@@ -0,0 +1,222 @@
+"""
+Grafik konvergensi yang dibuat sekali dan diperbarui di tempat.
+
+`ConvergencePlot` membuat Figure, Axes, Line2D, dan FigureCanvasTkAgg
+satu kali saja. Setiap perhitungan baru hanya mengganti data Line2D lalu
+menggambar ulang, sehingga tidak ada figure baru yang menumpuk di memori
+dan axes tidak perlu dibangun dari awal.
+
+Line2D ditandai `animated`: selama batas sumbu tidak berubah, hanya garis
+yang digambar di atas latar belakang yang disimpan (blitting). Jika batas
+sumbu berubah, seluruh figure digambar ulang lewat `draw_idle` dan latar
+belakangnya disimpan lagi.
+
+Figure dibuat lewat `matplotlib.figure.Figure` (bukan pyplot) agar tidak
+terdaftar di state global pyplot dan ikut dibebaskan bersama widget-nya.
+
+Riwayat yang panjang didesimasi min/max per kolom piksel (`decimate`):
+setiap kolom piksel sumbu x hanya menyumbang nilai minimum dan
+maksimumnya, jadi garis yang digambar sama secara visual tetapi jumlah
+titiknya dibatasi 2 x lebar axes dalam piksel, berapa pun panjang
+riwayatnya. Data asli disimpan dan didesimasi ulang saat canvas berubah
+ukuran. Marker disembunyikan bila titik terlalu rapat untuk dibedakan.
+
+Panel bisa memakai skala log (`set_yscale`; nilai <= 0 tidak digambar)
+agar ekor error yang konvergen superlinear tetap terlihat, dan bisa
+punya garis 'overlay' kedua, mis. kurva f(x) pada interval pencarian
+dari satu evaluasi tervektorisasi (`plot_function`).
+
+matplotlib baru diimpor saat `ConvergencePlot` pertama dibuat, sehingga
+mengimpor modul ini tidak memperlambat tampilnya jendela aplikasi (lihat
+`secant.widgets.prewarm`).
+"""
+
+from . import profiling
+
+
+def decimate(x, y, width):
+    """
+    Desimasi min/max: bagi titik (x, y) menjadi `width` kelompok berurutan
+    dan ambil nilai y minimum dan maksimum setiap kelompok (NaN diabaikan).
+
+    Mengembalikan paling banyak 2 x `width` titik; data yang sudah cukup
+    pendek dikembalikan apa adanya (sebagai array NumPy).
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) <= 2 * width:
+        return x, y
+    starts = np.linspace(0, len(x), width, endpoint=False).astype(np.intp)
+    with np.errstate(invalid='ignore'):
+        low = np.fmin.reduceat(y, starts)
+        high = np.fmax.reduceat(y, starts)
+    # Kelompok yang menurun digambar max -> min agar garis tidak zig-zag
+    falling = y[starts] > y[np.append(starts[1:], len(y)) - 1]
+    first = np.where(falling, high, low)
+    second = np.where(falling, low, high)
+    return np.repeat(x[starts], 2), np.column_stack((first, second)).ravel()
+
+
+class ConvergencePlot:
+    """
+    Sekumpulan panel (satu Line2D per panel) di dalam satu canvas Tk.
+
+    Setiap panel adalah dict dengan kunci opsional: 'title', 'xlabel',
+    'ylabel', 'line' (kwargs untuk Axes.plot), 'overlay' (kwargs untuk
+    garis kedua, lihat `set_overlay`), 'yscale' ('linear' atau 'log'),
+    'decimate' (bool, default True; matikan untuk titik yang tidak urut
+    menurut x, mis. scatter), 'grid' (kwargs untuk Axes.grid) dan
+    'legend' (bool).
+    """
+
+    def __init__(self, master, panels, nrows=None, ncols=1, figsize=(8, 6),
+                 facecolor=None, suptitle=None, text_color=None):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        nrows = nrows or len(panels)
+        text = {'color': text_color} if text_color else {}
+        self.figure = Figure(figsize=figsize, facecolor=facecolor)
+        if suptitle:
+            self.figure.suptitle(suptitle, **text)
+
+        self.axes = []
+        self.lines = []
+        self.overlays = []
+        for i, panel in enumerate(panels):
+            ax = self.figure.add_subplot(nrows, ncols, i + 1)
+            (line,) = ax.plot([], [], animated=True, **panel.get('line', {}))
+            overlay = None
+            if 'overlay' in panel:
+                (overlay,) = ax.plot([], [], animated=True, **panel['overlay'])
+            ax.set_yscale(panel.get('yscale', 'linear'))
+            ax.set_title(panel.get('title', ''), **text)
+            ax.set_xlabel(panel.get('xlabel', ''), **text)
+            ax.set_ylabel(panel.get('ylabel', ''), **text)
+            ax.grid(True, **panel.get('grid', {}))
+            if panel.get('legend'):
+                ax.legend()
+            self.axes.append(ax)
+            self.lines.append(line)
+            self.overlays.append(overlay)
+        self.figure.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        # Render penuh (juga yang dijadwalkan draw_idle) terukur sebagai 'plot.draw'
+        self.canvas.draw = profiling.timed('plot.draw')(self.canvas.draw)
+        self.widget = self.canvas.get_tk_widget()
+
+        self._dynamic = self.lines + [overlay for overlay in self.overlays if overlay]
+        self._markers = [line.get_marker() for line in self.lines]
+        self._decimate = [panel.get('decimate', True) for panel in panels]
+        self._data = [None] * len(self.lines)
+        self._background = None
+        self._limits = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+
+    def pack(self, **kwargs):
+        self.widget.pack(**kwargs)
+
+    def set_data(self, index, x, y):
+        """
+        Ganti data panel ke-`index` dan sesuaikan batas sumbunya. Data
+        yang lebih panjang dari 2 x lebar panel (piksel) didesimasi.
+        """
+        self._data[index] = (x, y)
+        self._show(index)
+        self._autoscale(index)
+
+    def set_overlay(self, index, x, y):
+        """Ganti data garis overlay panel ke-`index` (tanpa desimasi)."""
+        self.overlays[index].set_data(x, y)
+        self._autoscale(index)
+
+    def plot_function(self, index, f, a, b, samples=None):
+        """
+        Gambar f pada [a, b] sebagai overlay panel ke-`index`.
+
+        `f` harus menerima array NumPy (mis. `make_function(..., 'numpy')`)
+        dan dievaluasi satu kali pada `samples` titik (default: satu per
+        kolom piksel panel).
+        """
+        import numpy as np
+
+        x = np.linspace(a, b, samples or self._width(index))
+        with np.errstate(all='ignore'):
+            y = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+        self.set_overlay(index, x, y)
+
+    def set_yscale(self, index, scale):
+        """Ganti skala sumbu y panel ke-`index` ('linear' atau 'log')."""
+        self.axes[index].set_yscale(scale)
+        if self._data[index] is not None:
+            self._show(index)
+        self._autoscale(index)
+
+    def _width(self, index):
+        return max(1, int(self.axes[index].bbox.width))
+
+    def _show(self, index):
+        import numpy as np
+
+        x, y = (np.asarray(values, dtype=float) for values in self._data[index])
+        line = self.lines[index]
+        if self._decimate[index]:
+            width = self._width(index)
+            x, y = decimate(x, y, width)
+            # Lebih dari satu titik per 4 piksel: marker hanya menutupi garis
+            line.set_marker(self._markers[index] if len(x) * 4 <= width else '')
+        if self.axes[index].get_yscale() == 'log':
+            # Nilai <= 0 (mis. error tepat nol) tidak punya tempat di sumbu log
+            y = np.where(y > 0, y, np.nan)
+        line.set_data(x, y)
+
+    def _autoscale(self, index):
+        ax = self.axes[index]
+        ax.relim()
+        ax.autoscale_view()
+
+    def _on_resize(self, event):
+        # Lebar piksel berubah: desimasi ulang dari data asli
+        for index, data in enumerate(self._data):
+            if data is not None:
+                self._show(index)
+
+    def animate(self, artist):
+        """Daftarkan artist lain (mis. anotasi) yang ikut digambar lewat blitting."""
+        artist.set_animated(True)
+        self._dynamic.append(artist)
+
+    def _current_limits(self):
+        return [tuple(ax.viewLim.bounds) for ax in self.axes]
+
+    def _on_draw(self, event):
+        # Simpan latar belakang tanpa artist dinamis, lalu gambar artist di atasnya
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._limits = self._current_limits()
+        self._blit()
+
+    def _blit(self):
+        for artist in self._dynamic:
+            artist.axes.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def draw(self):
+        if self._background is not None and self._limits == self._current_limits():
+            with profiling.stage('plot.blit'):
+                self.canvas.restore_region(self._background)
+                self._blit()
+        else:
+            # draw_idle menggabungkan beberapa permintaan gambar menjadi satu
+            profiling.count('plot.full_redraw')
+            self.canvas.draw_idle()
+
+    def clear(self):
+        for index, overlay in enumerate(self.overlays):
+            self.set_data(index, [], [])
+            if overlay is not None:
+                self.set_overlay(index, [], [])
+        self.draw()
@@ -0,0 +1,111 @@
+"""
+Solve presisi tinggi dengan eskalasi presisi adaptif.
+
+float64 hanya punya ~16 digit signifikan, sehingga toleransi di bawah
+~1e-15 tidak pernah tercapai dan iterasi float berputar sampai
+`max_iter`. `solve_precise` tetap memulai dengan engine float64 biasa
+(cepat, dan sudah cukup untuk hampir semua iterasi), lalu hanya
+iterasi-iterasi terakhir yang dilanjutkan dengan backend mpmath dari dua
+iterate terakhir.
+
+Presisi mpmath dipilih dari toleransi (relatif terhadap besar akar)
+ditambah digit cadangan. Karena secant/newton konvergen superlinear,
+jumlah digit benar kira-kira berlipat setiap iterasi: dari ~16 digit
+float64, beberapa iterasi mpmath sudah cukup untuk ratusan digit. Untuk
+toleransi yang bisa ditulis sebagai float (>= 1e-308) satu lompatan
+langsung ke presisi akhir lebih murah daripada menaikkan presisi
+bertahap, karena setiap tahap baru mengulang dua evaluasi awal.
+
+Tahap mpmath untuk metode 'hybrid' memakai secant biasa: kriteria
+bracket Brent memakai epsilon float64, sedangkan di dekat akar pengaman
+bracket tidak lagi dibutuhkan. Presisi mpmath diatur lewat konteks global
+`mpmath.mp`, jadi solve presisi tinggi tidak boleh berjalan bersamaan di
+beberapa thread.
+"""
+
+import math
+
+from . import profiling
+from .engine import SecantResult, prepare
+from .status import CONVERGED, MAX_ITER, ZERO_DIVISOR
+
+# Toleransi terkecil yang masih dikejar dalam float64
+FLOAT_TOL = 1e-12
+# Digit tambahan di atas digit yang diminta toleransi
+GUARD_DIGITS = 10
+
+
+def needs_escalation(tol, ftol=None):
+    """True jika `tol` (atau `ftol`) lebih ketat daripada yang bisa dicapai float64."""
+    return tol < FLOAT_TOL or (ftol is not None and ftol < FLOAT_TOL)
+
+
+def required_dps(tol, scale=1.0):
+    """Digit desimal yang dibutuhkan untuk toleransi absolut `tol` pada akar sebesar `scale`."""
+    return math.ceil(math.log10(max(1.0, abs(float(scale))) / tol)) + GUARD_DIGITS
+
+
+def format_precise(value, tol):
+    """Tulis `value` (mpf atau float) dengan digit sebanyak yang dijamin `tol`."""
+    import mpmath
+
+    return mpmath.nstr(value, max(15, required_dps(tol, value) - GUARD_DIGITS + 1))
+
+
+def solve_precise(func_str, x0, x1, tol=1e-6, max_iter=100, ftol=None, divisor_tol=0.0,
+                  module="math", callback=None, method="secant"):
+    """
+    Seperti `secant.solve`, tetapi toleransi di bawah batas float64 dicapai
+    dengan melanjutkan iterasi di mpmath (lihat docstring modul).
+
+    Jika toleransi bisa dicapai float64, hasilnya sama dengan `solve`.
+    Selain itu `root` dan `fx` di hasil adalah mpf dengan presisi tahap
+    terakhir; riwayat iterasi tetap disimpan sebagai float64. `callback`
+    selalu menerima float.
+    """
+    engine, f = prepare(func_str, method, module)
+    escalate = needs_escalation(tol, ftol)
+    with profiling.stage('iterate'):
+        result = engine(f, x0, x1, max(tol, FLOAT_TOL) if escalate else tol, max_iter,
+                        ftol=max(ftol, FLOAT_TOL) if escalate and ftol is not None else ftol,
+                        divisor_tol=divisor_tol, callback=callback)
+        # Lanjut hanya jika float64 sudah sampai di dekat akar (konvergen,
+        # atau berhenti karena resolusi float habis)
+        if (escalate and result.status in (CONVERGED, ZERO_DIVISOR, MAX_ITER)
+                and len(result.history)
+                and result.history[-1][5] <= 1e-6 * max(1.0, abs(result.root))):
+            result = _escalate(func_str, method, result, tol, max_iter, ftol, divisor_tol,
+                               callback)
+    profiling.count('evaluations', result.evaluations)
+    return result
+
+
+def _escalate(func_str, method, result, tol, max_iter, ftol, divisor_tol, callback):
+    import mpmath
+
+    remaining = max_iter - result.iterations
+    if remaining <= 0:
+        return result
+    profiling.count('precision_escalation')
+    engine, f = prepare(func_str, 'secant' if method == 'hybrid' else method, 'mpmath')
+    _, _, b, c, _, _ = result.history[-1]
+    scale = max(1.0, abs(c))
+    dps = required_dps(tol, scale)
+    if ftol is not None:
+        dps = max(dps, required_dps(ftol))
+    offset = result.iterations
+
+    def shifted(step, x, fx, error):
+        callback(step + offset, float(x), float(fx), float(error))
+
+    with mpmath.mp.workdps(dps):
+        a, b = mpmath.mpf(b), mpmath.mpf(c)
+        if a == b:
+            # Langkah float terakhir di bawah resolusi float64; langkah
+            # secant pertama butuh dua titik yang berbeda
+            a = b + mpmath.mpf(2) ** -26 * scale
+        tail = engine(f, a, b, tol, remaining, ftol=ftol, divisor_tol=divisor_tol,
+                      callback=shifted if callback is not None else None)
+    return SecantResult(tail.root, tail.fx, offset + tail.iterations,
+                        result.evaluations + tail.evaluations, tail.status,
+                        result.history.concat(tail.history))
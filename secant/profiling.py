@@ -0,0 +1,166 @@
+"""
+Instrumentasi ringan untuk tahap-tahap solver dan render.
+
+Tahap (parse, compile, iterate, table, plot, ...) diukur dengan
+
+    with profiling.stage('iterate'):
+        ...
+
+dan kejadian dihitung dengan `profiling.count('evaluations', n)`. Selama
+profiling nonaktif (default), `stage` hanya mengembalikan context manager
+kosong yang sama dan `count` langsung kembali, sehingga biayanya hampir
+nol. Profiling diaktifkan saat runtime dengan `enable()` atau dengan
+variabel lingkungan SECANT_PROFILE=1.
+
+Statistik tersedia lewat `stats()`/`format_stats()` (untuk panel statistik
+di GUI) dan `write_trace(path)` menulis file trace JSON format Chrome
+(buka di chrome://tracing atau Perfetto).
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_enabled = os.environ.get('SECANT_PROFILE', '') not in ('', '0')
+_origin = time.perf_counter()
+
+# nama -> [jumlah, total detik, minimum, maksimum]
+_timers = {}
+# nama -> total
+_counters = {}
+# Kejadian untuk file trace; dibatasi agar sesi panjang tidak menumpuk memori
+_events = deque(maxlen=100_000)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Hapus semua timer, counter, dan kejadian trace."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+        _events.clear()
+
+
+class _Stage:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        elapsed = end - self.start
+        with _lock:
+            timer = _timers.get(self.name)
+            if timer is None:
+                _timers[self.name] = [1, elapsed, elapsed, elapsed]
+            else:
+                timer[0] += 1
+                timer[1] += elapsed
+                timer[2] = min(timer[2], elapsed)
+                timer[3] = max(timer[3], elapsed)
+            _events.append(('X', self.name, self.start, elapsed, threading.get_ident()))
+        return False
+
+
+def stage(name):
+    """Context manager yang mengukur durasi tahap `name` bila profiling aktif."""
+    if not _enabled:
+        return _NULL
+    return _Stage(name)
+
+
+def timed(name):
+    """Dekorator: setiap panggilan fungsi diukur sebagai tahap `name`."""
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Stage(name):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    """Tambahkan `n` ke counter `name` bila profiling aktif."""
+    if not _enabled:
+        return
+    with _lock:
+        total = _counters[name] = _counters.get(name, 0) + n
+        _events.append(('C', name, time.perf_counter(), total, threading.get_ident()))
+
+
+def stats():
+    """
+    Ringkasan saat ini: {'timers': [...], 'counters': {...}}.
+
+    Setiap timer berupa dict dengan name, count, total_ms, mean_ms, min_ms
+    dan max_ms, diurutkan dari total waktu terbesar.
+    """
+    with _lock:
+        timers = [
+            {'name': name, 'count': n, 'total_ms': total * 1e3, 'mean_ms': total / n * 1e3,
+             'min_ms': low * 1e3, 'max_ms': high * 1e3}
+            for name, (n, total, low, high) in _timers.items()
+        ]
+        counters = dict(_counters)
+    timers.sort(key=lambda t: t['total_ms'], reverse=True)
+    return {'timers': timers, 'counters': counters}
+
+
+def format_stats():
+    """Teks tabel statistik untuk ditampilkan di panel atau terminal."""
+    data = stats()
+    lines = [f"{'tahap':<16}{'n':>7}{'total ms':>11}{'rata2 ms':>11}{'maks ms':>10}"]
+    for t in data['timers']:
+        lines.append(f"{t['name']:<16}{t['count']:>7}{t['total_ms']:>11.3f}"
+                     f"{t['mean_ms']:>11.3f}{t['max_ms']:>10.3f}")
+    if data['counters']:
+        lines.append("")
+        lines.extend(f"{name:<16}{value:>7}" for name, value in sorted(data['counters'].items()))
+    return "\n".join(lines)
+
+
+def write_trace(path):
+    """Tulis kejadian yang tercatat sebagai file trace JSON (format Chrome)."""
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+    trace = []
+    for kind, name, start, value, tid in events:
+        event = {'name': name, 'ph': kind, 'pid': pid, 'tid': tid,
+                 'ts': (start - _origin) * 1e6}
+        if kind == 'X':
+            event['dur'] = value * 1e6
+        else:
+            event['args'] = {name: value}
+        trace.append(event)
+    with open(path, 'w') as file:
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms',
+                   'otherData': {'stats': stats()}}, file)
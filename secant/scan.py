@@ -0,0 +1,126 @@
+"""
+Pencarian semua akar pada interval [a, b] secara tervektorisasi.
+
+f dievaluasi sekali pada grid NumPy yang rapat untuk menemukan perubahan
+tanda. Semua bracket yang ditemukan lalu diperhalus bersamaan (lockstep)
+dengan metode Illinois (regula falsi termodifikasi), yang selalu tetap di
+dalam bracket dan konvergen superlinear. Akar yang berdekatan digabung.
+
+Akar dengan multiplisitas genap (mis. x**2) tidak mengubah tanda f dan
+tidak akan ditemukan kecuali kebetulan tepat berada di titik grid.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import _evaluate
+
+
+class ScanResult(NamedTuple):
+    roots: np.ndarray        # akar terurut naik
+    fvals: np.ndarray        # f(root)
+    brackets: np.ndarray     # bracket asal berbentuk (k, 2)
+    iterations: np.ndarray   # iterasi penghalusan per akar
+    evaluations: int         # total evaluasi f (grid + penghalusan)
+
+
+def refine_brackets(f, lo, hi, tol=1e-12, max_iter=100):
+    """
+    Perhalus semua bracket [lo[i], hi[i]] (f berbeda tanda di ujungnya)
+    sekaligus. Mengembalikan (roots, fvals, iterations, evaluations).
+    """
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    n = lo.size
+    roots = 0.5 * (lo + hi)
+    fvals = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+
+    with np.errstate(all='ignore'):
+        flo = _evaluate(f, lo)
+        fhi = _evaluate(f, hi)
+        evaluations = 2 * n
+        lanes = np.arange(n)
+        side = np.zeros(n, dtype=np.int8)   # ujung yang terakhir dipertahankan
+
+        for step in range(1, max_iter + 1):
+            if lanes.size == 0:
+                break
+            x = hi - fhi * (hi - lo) / (fhi - flo)
+            # Jaga agar tetap di dalam bracket (mis. saat pembagi nol)
+            outside = ~((x > np.minimum(lo, hi)) & (x < np.maximum(lo, hi)))
+            x = np.where(outside, 0.5 * (lo + hi), x)
+            fx = _evaluate(f, x)
+            evaluations += x.size
+
+            roots[lanes] = x
+            fvals[lanes] = fx
+            iterations[lanes] = step
+
+            # Ujung yang berlawanan tanda dengan fx dipertahankan; jika ujung
+            # yang sama bertahan dua kali, nilai f-nya dibagi dua (Illinois).
+            keep_lo = np.sign(fx) == np.sign(fhi)
+            halve_lo = keep_lo & (side == -1)
+            halve_hi = ~keep_lo & (side == 1)
+            flo = np.where(halve_lo, 0.5 * flo, flo)
+            fhi = np.where(halve_hi, 0.5 * fhi, fhi)
+            side = np.where(keep_lo, -1, 1).astype(np.int8)
+            hi, fhi = np.where(keep_lo, x, hi), np.where(keep_lo, fx, fhi)
+            lo, flo = np.where(keep_lo, lo, x), np.where(keep_lo, flo, fx)
+
+            done = (np.abs(hi - lo) < tol) | (fx == 0)
+            keep = ~done
+            lanes, lo, hi, flo, fhi, side = (
+                lanes[keep], lo[keep], hi[keep], flo[keep], fhi[keep], side[keep])
+
+    return roots, fvals, iterations, evaluations
+
+
+def find_roots(f, a, b, samples=2001, tol=1e-12, max_iter=100, dedup_tol=None):
+    """
+    Cari semua akar f di [a, b] dalam satu panggilan.
+
+    `f` harus menerima array NumPy. Perubahan tanda pada grid `samples`
+    titik dijadikan bracket lalu diperhalus sampai lebar bracket < tol.
+    Bracket yang ternyata kutub (|f| di akar hasil tidak lebih kecil dari
+    di ujung bracket, mis. tan(x) di pi/2) dibuang. Akar yang berjarak
+    kurang dari `dedup_tol` (default 10 * tol) digabung.
+    """
+    if not a < b:
+        raise ValueError("Interval tidak valid: harus a < b")
+    grid = np.linspace(a, b, samples)
+    with np.errstate(all='ignore'):
+        y = _evaluate(f, grid)
+    evaluations = samples
+
+    finite = np.isfinite(y)
+    exact = np.flatnonzero(finite & (y == 0))
+    sign = np.sign(y)
+    change = np.flatnonzero(finite[:-1] & finite[1:] & (sign[:-1] * sign[1:] < 0))
+
+    lo, hi = grid[change], grid[change + 1]
+    roots, fvals, iterations, refine_evals = refine_brackets(f, lo, hi, tol, max_iter)
+    evaluations += refine_evals
+
+    # Buang kutub: di akar sejati |f| jauh lebih kecil daripada di ujung grid
+    genuine = np.abs(fvals) <= np.minimum(np.abs(y[change]), np.abs(y[change + 1]))
+    roots, fvals, iterations = roots[genuine], fvals[genuine], iterations[genuine]
+    brackets = np.column_stack((lo[genuine], hi[genuine]))
+
+    roots = np.concatenate((roots, grid[exact]))
+    fvals = np.concatenate((fvals, y[exact]))
+    iterations = np.concatenate((iterations, np.zeros(exact.size, dtype=np.int64)))
+    brackets = np.concatenate((brackets, np.column_stack((grid[exact], grid[exact]))))
+
+    order = np.argsort(roots)
+    roots, fvals, iterations, brackets = (
+        roots[order], fvals[order], iterations[order], brackets[order])
+
+    dedup_tol = 10 * tol if dedup_tol is None else dedup_tol
+    if roots.size > 1:
+        unique = np.concatenate(([True], np.diff(roots) > dedup_tol))
+        roots, fvals, iterations, brackets = (
+            roots[unique], fvals[unique], iterations[unique], brackets[unique])
+
+    return ScanResult(roots, fvals, brackets, iterations, evaluations)
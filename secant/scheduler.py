@@ -0,0 +1,167 @@
+"""
+Penjadwal solve di latar belakang untuk aplikasi Tk.
+
+`SolveScheduler` menjalankan paling banyak satu job sekaligus di satu
+thread pekerja. Job baru yang dikirim saat job lain masih berjalan
+membatalkan job lama ("permintaan terakhir yang menang"): job yang masih
+menunggu diganti, dan job yang sedang berjalan diberi tanda batal lalu
+berhenti di iterasi berikutnya lewat `CancelToken.callback` yang dipasang
+sebagai callback engine. Hasil job yang sudah digantikan dibuang.
+
+Thread pekerja tidak pernah menyentuh widget: hasil, error, dan progres
+diambil oleh thread Tk lewat polling `after()`.
+
+    def job(token):
+        return secant(f, x0, x1, tol, max_iter, callback=token.callback)
+
+    scheduler.submit(job, on_done=show_result, on_error=show_error,
+                     on_progress=lambda step, x, fx, error: ...)
+"""
+
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Dilempar di dalam job saat job tersebut dibatalkan."""
+
+
+class CancelToken:
+    """Tanda batal dan progres terakhir untuk satu job."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.progress = None
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """Lempar `Cancelled` jika job sudah dibatalkan."""
+        if self._event.is_set():
+            raise Cancelled()
+
+    def callback(self, *progress):
+        """
+        Callback engine: memeriksa pembatalan lalu menyimpan argumen
+        progres terakhir (step, x, f(x), error). Progres tidak diantrekan;
+        thread Tk hanya membaca nilai terbaru saat polling.
+        """
+        if self._event.is_set():
+            raise Cancelled()
+        self.progress = progress
+
+
+class _Job:
+    __slots__ = ('token', 'func', 'on_done', 'on_error', 'on_progress', 'shown')
+
+    def __init__(self, func, on_done, on_error, on_progress):
+        self.token = CancelToken()
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.shown = None
+
+
+class SolveScheduler:
+    """
+    Satu job solve di latar belakang per jendela, dengan pembatalan
+    kooperatif dan penggabungan permintaan.
+
+    `widget` dipakai untuk menjadwalkan polling dengan `after(interval)`;
+    polling hanya berjalan selama ada job yang aktif.
+    """
+
+    def __init__(self, widget, interval=30):
+        self.widget = widget
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._pending = None
+        self._thread = None
+        self._results = queue.Queue()
+        # Hanya diakses dari thread Tk
+        self._latest = None
+        self._after_id = None
+
+    @property
+    def busy(self):
+        return self._latest is not None
+
+    def submit(self, func, on_done, on_error=None, on_progress=None):
+        """
+        Jadwalkan `func(token)` dan batalkan job sebelumnya.
+
+        `on_done(result)`, `on_error(exception)` dan `on_progress(*args)`
+        (argumen terakhir yang diberikan ke `token.callback`) dipanggil di
+        thread Tk. Mengembalikan CancelToken job baru.
+        """
+        job = _Job(func, on_done, on_error, on_progress)
+        if self._latest is not None:
+            self._latest.token.cancel()
+        self._latest = job
+
+        with self._cond:
+            self._pending = job
+            self._cond.notify()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name='secant-solver', daemon=True)
+            self._thread.start()
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval, self._poll)
+        return job.token
+
+    def cancel(self):
+        """Batalkan job yang aktif (jika ada); callback-nya tidak dipanggil."""
+        if self._latest is not None:
+            self._latest.token.cancel()
+            self._latest = None
+        with self._cond:
+            self._pending = None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                job, self._pending = self._pending, None
+            if job.token.cancelled:
+                continue
+            try:
+                result = ('done', job.func(job.token))
+            except Cancelled:
+                continue
+            except Exception as e:
+                result = ('error', e)
+            self._results.put((job, result))
+
+    def _poll(self):
+        self._after_id = None
+        while True:
+            try:
+                job, (kind, value) = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Hasil job yang sudah digantikan atau dibatalkan dibuang
+            if job is not self._latest or job.token.cancelled:
+                continue
+            self._latest = None
+            if kind == 'done':
+                job.on_done(value)
+            elif job.on_error is not None:
+                job.on_error(value)
+
+        job = self._latest
+        if job is None:
+            return
+        progress = job.token.progress
+        if job.on_progress is not None and progress is not None and progress is not job.shown:
+            job.shown = progress
+            job.on_progress(*progress)
+        # on_done bisa saja sudah mengirim job baru (dan menjadwalkan polling)
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval, self._poll)
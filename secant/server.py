@@ -0,0 +1,357 @@
+"""
+Server solver lokal berbasis asyncio dengan micro-batching.
+
+Satu proses yang hidup lama menyimpan cache fungsi hasil kompilasi dan
+cache hasil (`secant.memo`) tetap hangat, dan menerima permintaan solve
+JSON lewat socket localhost. Dua protokol dilayani pada port yang sama:
+
+- HTTP/1.1: `POST /solve` dengan satu objek job atau list job,
+  `GET /stats` untuk statistik latensi dan batching, `GET /health`.
+- JSON per baris: setiap baris adalah satu objek job, jawabannya satu
+  baris JSON dengan urutan yang sama (boleh dikirim beruntun tanpa
+  menunggu jawaban).
+
+Field job sama dengan mode --batch (function, x0, x1, tol, max_iter,
+method), ditambah `ftol` opsional. Permintaan secant untuk ekspresi dan
+kriteria henti yang sama yang tiba dalam jendela `window` detik
+digabung menjadi satu panggilan `secant_batch`, sehingga f dievaluasi
+sekali per iterasi untuk semua permintaan sekaligus. Permintaan secant
+yang tiba sendirian juga lewat `secant_batch` (dengan satu lane), sehingga
+hasil satu job tidak bergantung pada ada tidaknya permintaan lain di
+jendela yang sama. Metode lain dan permintaan dengan `history`
+diselesaikan secara skalar lewat cache hasil. Perhitungan berjalan di
+thread pool agar event loop tetap melayani koneksi lain.
+
+Nilai float yang tidak finite (root/fx dari solve yang divergen) ditulis
+sebagai `null`, karena NaN/Infinity bukan JSON yang valid.
+
+    python -m secant.server --port 8765 --warm "2*x**3 - x - exp(-x)"
+    curl -s localhost:8765/solve -d '{"function": "x**2 - 2", "x0": 1, "x1": 2}'
+    curl -s localhost:8765/stats
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import deque
+
+from .expression import cache_info, canonicalize, make_function
+from .pipeline import _parse_job, dumps_json
+from .status import status_name
+
+DEFAULT_PORT = 8765
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large'}
+
+# Batas ukuran body HTTP dan baris JSON
+MAX_BODY = 16 * 2**20
+
+
+class LatencyStats:
+    """Latensi per permintaan untuk `window` sampel terakhir."""
+
+    def __init__(self, window=10000):
+        self._samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def summary(self):
+        samples = sorted(self._samples)
+        if not samples:
+            return {'count': self.count, 'p50_ms': None, 'p99_ms': None, 'max_ms': None}
+
+        def percentile(p):
+            return samples[max(0, math.ceil(p * len(samples)) - 1)] * 1000
+
+        return {'count': self.count, 'p50_ms': percentile(0.50), 'p99_ms': percentile(0.99),
+                'max_ms': samples[-1] * 1000}
+
+
+class SolveServer:
+    """Pengumpul permintaan solve dan micro-batcher (lihat docstring modul)."""
+
+    def __init__(self, window=0.002, max_batch=1024, module='math', result_cache=None):
+        from .memo import get_store
+
+        self.window = window
+        self.max_batch = max_batch
+        self.module = module
+        self.store = get_store(result_cache)
+        self.latency = LatencyStats()
+        self.batches = 0
+        self.batched = 0
+        self.errors = 0
+        self._pending = {}
+
+    def warm(self, func_str):
+        """Kompilasi `func_str` untuk jalur skalar dan jalur batch sebelum permintaan pertama."""
+        make_function(func_str, self.module)
+        make_function(func_str, 'numpy')
+
+    async def solve(self, row):
+        """Selesaikan satu job (dict); mengembalikan dict hasil atau melempar ValueError."""
+        if not isinstance(row, dict):
+            raise ValueError("Job harus berupa objek JSON")
+        func_str, x0, x1, tol, max_iter = _parse_job(row)
+        method = row.get('method') or 'secant'
+        ftol = row.get('ftol')
+        ftol = None if ftol in (None, '') else float(ftol)
+        if method == 'secant' and not row.get('history'):
+            # Ekspresi kanonik: "x**2-2" dan "x**2 - 2" masuk batch yang sama
+            return await self._enqueue((canonicalize(func_str), tol, max_iter, ftol), x0, x1)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._solve_one, func_str, x0, x1, tol,
+                                          max_iter, ftol, method, bool(row.get('history')))
+
+    def _solve_one(self, func_str, x0, x1, tol, max_iter, ftol, method='secant', history=False):
+        result = self.store.solve(func_str, x0, x1, tol, max_iter, ftol, module=self.module,
+                                  method=method)
+        out = {'root': float(result.root), 'fx': float(result.fx),
+               'iterations': result.iterations, 'evaluations': result.evaluations,
+               'status': result.status_name, 'batch': 1}
+        if history:
+            out['history'] = [list(row) for row in result.history]
+        return out
+
+    async def _enqueue(self, key, x0, x1):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        lanes = self._pending.get(key)
+        if lanes is None:
+            lanes = self._pending[key] = []
+            loop.call_later(self.window, self._flush, key, lanes)
+        lanes.append((x0, x1, future))
+        if len(lanes) >= self.max_batch:
+            self._flush(key, lanes)
+        return await future
+
+    def _flush(self, key, lanes):
+        # Jadwal call_later untuk batch yang sudah dikirim karena penuh diabaikan
+        if self._pending.get(key) is not lanes:
+            return
+        del self._pending[key]
+        asyncio.ensure_future(self._run_batch(key, lanes))
+
+    async def _run_batch(self, key, lanes):
+        loop = asyncio.get_running_loop()
+        func_str, tol, max_iter, ftol = key
+        try:
+            # Satu lane pun lewat secant_batch: semantik evaluasi (numpy,
+            # inf/nan alih-alih exception) sama dengan job di dalam batch
+            results = await loop.run_in_executor(None, self._solve_batch, func_str,
+                                                 [lane[0] for lane in lanes],
+                                                 [lane[1] for lane in lanes],
+                                                 tol, max_iter, ftol)
+            if len(lanes) > 1:
+                self.batches += 1
+                self.batched += len(lanes)
+        except Exception as e:
+            for _, _, future in lanes:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(lanes, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _solve_batch(self, func_str, x0, x1, tol, max_iter, ftol):
+        from .batch import secant_batch
+
+        f = make_function(func_str, 'numpy')
+        result = secant_batch(f, x0, x1, tol, max_iter, ftol)
+        size = len(x0)
+        # Secant mengevaluasi f dua kali di awal lalu sekali per iterasi per lane
+        return [{'root': root, 'fx': fx, 'iterations': iterations,
+                 'evaluations': iterations + 2, 'status': status_name(status), 'batch': size}
+                for root, fx, iterations, status in zip(result.roots.tolist(),
+                                                        result.fvals.tolist(),
+                                                        result.iterations.tolist(),
+                                                        result.status.tolist())]
+
+    async def handle_job(self, row):
+        """Seperti `solve`, tetapi kesalahan menjadi hasil berstatus 'error' dan latensi dicatat."""
+        start = time.perf_counter()
+        try:
+            result = await self.solve(row)
+        except (ValueError, KeyError, TypeError, ArithmeticError, NameError) as e:
+            self.errors += 1
+            result = {'status': 'error', 'message': str(e)}
+        self.latency.add(time.perf_counter() - start)
+        return result
+
+    def stats(self):
+        return {
+            'latency': self.latency.summary(),
+            'errors': self.errors,
+            'batches': self.batches,
+            'batched_requests': self.batched,
+            'mean_batch': self.batched / self.batches if self.batches else None,
+            'function_cache': cache_info(),
+            'result_cache': self.store.info(),
+        }
+
+    # Protokol
+
+    async def handle_connection(self, reader, writer):
+        try:
+            first = await reader.readline()
+            if first.lstrip().startswith(b'{'):
+                await self._serve_lines(first, reader, writer)
+            elif first:
+                await self._serve_http(first, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_lines(self, line, reader, writer):
+        answers = asyncio.Queue()
+
+        async def respond():
+            while True:
+                task = await answers.get()
+                if task is None:
+                    return
+                writer.write(dumps_json(await task).encode() + b'\n')
+                await writer.drain()
+
+        responder = asyncio.ensure_future(respond())
+        while line:
+            if line.strip():
+                answers.put_nowait(asyncio.ensure_future(self._handle_line(line)))
+            line = await reader.readline()
+        answers.put_nowait(None)
+        await responder
+
+    async def _handle_line(self, line):
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            self.errors += 1
+            return {'status': 'error', 'message': f"JSON tidak valid: {e}"}
+        return await self.handle_job(row)
+
+    async def _serve_http(self, request_line, reader, writer):
+        while request_line:
+            parts = request_line.decode('latin-1').split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # Batas body tidak diketahui, koneksi tidak bisa dipakai lagi
+                await self._send(writer, 400, {'status': 'error',
+                                               'message': "Content-Length tidak valid"}, True)
+                return
+            if length > MAX_BODY:
+                await self._send(writer, 413, {'status': 'error', 'message': "Body terlalu besar"})
+                return
+            body = await reader.readexactly(length) if length else b''
+
+            if len(parts) != 3:
+                status, payload = 400, {'status': 'error', 'message': "Request HTTP tidak valid"}
+            else:
+                status, payload = await self._route(parts[0], parts[1], body)
+            close = (headers.get('connection', '').lower() == 'close'
+                     or parts[-1:] == ['HTTP/1.0'])
+            await self._send(writer, status, payload, close)
+            if close:
+                return
+            request_line = await reader.readline()
+
+    async def _route(self, method, path, body):
+        path = path.split('?', 1)[0]
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/stats':
+            return 200, self.stats()
+        if path != '/solve':
+            return 404, {'status': 'error', 'message': f"Path tidak dikenal: {path}"}
+        if method != 'POST':
+            return 405, {'status': 'error', 'message': "Gunakan POST untuk /solve"}
+        try:
+            jobs = json.loads(body)
+        except ValueError as e:
+            self.errors += 1
+            return 400, {'status': 'error', 'message': f"JSON tidak valid: {e}"}
+        if isinstance(jobs, list):
+            # Semua job dalam satu request ikut micro-batch bersama
+            return 200, await asyncio.gather(*(self.handle_job(job) for job in jobs))
+        result = await self.handle_job(jobs)
+        return (400 if result.get('status') == 'error' else 200), result
+
+    @staticmethod
+    async def _send(writer, status, payload, close=False):
+        body = dumps_json(payload).encode()
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, ready=None, **options):
+    """Jalankan server sampai dibatalkan. `ready(server)` dipanggil setelah socket terbuka."""
+    warm = options.pop('warm', ())
+    solver = SolveServer(**options)
+    for func_str in warm:
+        solver.warm(func_str)
+    server = await asyncio.start_server(solver.handle_connection, host, port, limit=MAX_BODY)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="secant.server",
+                                     description="Server solver secant lokal (HTTP / JSON per baris).")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="alamat yang didengarkan (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"port (default {DEFAULT_PORT})")
+    parser.add_argument("--window-ms", type=float, default=2.0,
+                        help="jendela micro-batching dalam milidetik (default 2)")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="jumlah permintaan maksimum per batch (default 1024)")
+    parser.add_argument("--backend", default="math",
+                        help="backend jalur skalar (default math)")
+    parser.add_argument("--result-cache", metavar="FILE",
+                        help="cache hasil sqlite untuk jalur skalar")
+    parser.add_argument("--warm", action="append", default=[], metavar="EKSPRESI",
+                        help="kompilasi ekspresi ini saat start; boleh diulang")
+    args = parser.parse_args(argv)
+
+    def ready(server):
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"secant.server: mendengarkan di http://{host}:{port}", file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, ready, window=args.window_ms / 1000,
+                          max_batch=args.max_batch, module=args.backend,
+                          result_cache=args.result_cache, warm=args.warm))
+    except (ValueError, OSError) as e:
+        print(f"secant.server: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
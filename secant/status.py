@@ -0,0 +1,18 @@
+"""Kode status hasil solver secant (dipakai bersama oleh semua engine)."""
+
+CONVERGED = 0
+ZERO_DIVISOR = 1
+MAX_ITER = 2
+DIVERGED = 3
+
+STATUS_NAMES = {
+    CONVERGED: "converged",
+    ZERO_DIVISOR: "zero_divisor",
+    MAX_ITER: "max_iter",
+    DIVERGED: "diverged",
+}
+
+
+def status_name(code):
+    """Nama status yang mudah dibaca untuk sebuah kode status."""
+    return STATUS_NAMES.get(int(code), "unknown")
@@ -0,0 +1,112 @@
+"""
+Sapuan parameter: akar f(x; p) untuk setiap titik pada grid parameter.
+
+Ekspresi dikompilasi sekali dengan simbol parameter tambahan
+(`make_parametric_function`), lalu semua titik grid diselesaikan sebagai
+lane NumPy lewat `secant_batch`.
+
+Dengan kontinuasi (default), grid ditelusuri sepanjang sumbu parameter
+terakhir: semua lane menyelesaikan titik ke-j bersamaan, dan setiap lane
+memulai dari akar titik sebelumnya pada sumbu itu, dengan tebakan kedua
+hasil ekstrapolasi linear dari dua akar sebelumnya. Karena akar berubah
+mulus terhadap parameter, tebakan awal sudah sangat dekat dan jumlah
+iterasi per titik turun drastis. Jika lane terlalu sedikit dibanding
+panjang sumbu (mis. grid 1-D), sumbu dipotong menjadi beberapa rantai
+kontinuasi yang berjalan paralel agar tetap tervektorisasi. Lane yang
+gagal konvergen mulai lagi dari (x0, x1) pada titik berikutnya.
+
+Untuk keluarga fungsi dengan beberapa akar, kontinuasi mengikuti cabang
+akar yang sama sepanjang sumbu (permukaan yang mulus), sedangkan tanpa
+kontinuasi setiap titik bisa konvergen ke akar yang berbeda.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import secant_batch
+from .expression import make_parametric_function
+from .status import CONVERGED
+
+
+class SweepResult(NamedTuple):
+    params: dict             # nama -> array grid (bentuk = bentuk permukaan akar)
+    roots: np.ndarray        # permukaan akar
+    fvals: np.ndarray        # f(root) per titik
+    iterations: np.ndarray   # iterasi per titik
+    status: np.ndarray       # kode status per titik (lihat secant.status)
+    evaluations: int         # total evaluasi f
+
+
+def _predict(prev, prev2, x0, x1):
+    # Tebakan pertama = akar sebelumnya, tebakan kedua = ekstrapolasi linear
+    h = 1e-4 * (np.abs(prev) + 1)
+    a = prev.copy()
+    b = prev + h if prev2 is None else 2 * prev - prev2
+    b = np.where(np.isfinite(b) & (np.abs(b - a) >= h), b, a + h)
+    lost = ~np.isfinite(prev)
+    a[lost] = x0
+    b[lost] = x1
+    return a, b
+
+
+def sweep(func_str, params, x0, x1, tol=1e-10, max_iter=100, ftol=None, continuation=True,
+          module="numpy"):
+    """
+    Selesaikan f(x; p) = 0 untuk setiap titik grid `params`.
+
+    `params` adalah dict nama -> nilai (1-D); grid dibentuk dari semua
+    kombinasi (indexing 'ij'), sehingga permukaan akar berbentuk
+    (len(p1), len(p2), ...). (x0, x1) adalah tebakan awal untuk titik
+    pertama setiap rantai kontinuasi, atau untuk semua titik jika
+    `continuation=False`.
+    """
+    names = tuple(params)
+    if not names:
+        raise ValueError("Minimal satu parameter dibutuhkan untuk sweep")
+    axes = [np.asarray(params[name], dtype=float).ravel() for name in names]
+    if any(axis.size == 0 for axis in axes):
+        raise ValueError("Setiap parameter harus punya minimal satu nilai")
+
+    f = make_parametric_function(func_str, names, module)
+    grid = np.meshgrid(*axes, indexing='ij')
+    shape = grid[0].shape
+
+    if not continuation:
+        result = secant_batch(f, np.full(shape, float(x0)), float(x1), tol, max_iter, ftol,
+                              args=grid)
+        return SweepResult(dict(zip(names, grid)), *result)
+
+    # Baris = lane, kolom = langkah kontinuasi sepanjang sumbu terakhir
+    steps = shape[-1]
+    lanes = grid[0].size // steps
+    chains = math.ceil(math.sqrt(steps / lanes)) if lanes < steps else 1
+    length = math.ceil(steps / chains)
+    pad = chains * length - steps
+    columns = [np.pad(g.reshape(lanes, steps), ((0, 0), (0, pad)), mode='edge')
+               .reshape(lanes * chains, length) for g in grid]
+
+    rows = lanes * chains
+    roots = np.empty((rows, length))
+    fvals = np.empty((rows, length))
+    iterations = np.empty((rows, length), dtype=np.int64)
+    status = np.empty((rows, length), dtype=np.int8)
+    evaluations = 0
+    prev = prev2 = None
+    for j in range(length):
+        if prev is None:
+            a, b = np.full(rows, float(x0)), np.full(rows, float(x1))
+        else:
+            a, b = _predict(prev, prev2, x0, x1)
+        result = secant_batch(f, a, b, tol, max_iter, ftol, args=[c[:, j] for c in columns])
+        roots[:, j], fvals[:, j] = result.roots, result.fvals
+        iterations[:, j], status[:, j] = result.iterations, result.status
+        evaluations += result.evaluations
+        prev2, prev = prev, np.where(result.status == CONVERGED, result.roots, np.nan)
+
+    def surface(array):
+        return array.reshape(lanes, chains * length)[:, :steps].reshape(shape)
+
+    return SweepResult(dict(zip(names, grid)), surface(roots), surface(fvals),
+                       surface(iterations), surface(status), evaluations)
@@ -0,0 +1,327 @@
+"""
+Widget Tk yang dipakai bersama oleh aplikasi GUI.
+
+`VirtualTable` adalah Treeview tervirtualisasi: hanya baris yang terlihat
+yang dibuat sebagai item Treeview, dan isinya diganti saat tabel
+di-scroll. Menampilkan 100 ribu iterasi sama murahnya dengan 100 iterasi.
+
+`insert_text_rows` mengisi widget Text secara bertahap lewat `after_idle`
+agar jendela tetap responsif saat baris yang ditulis sangat banyak.
+
+`Debouncer` menunda pemanggilan fungsi sampai masukan berhenti berubah
+selama beberapa milidetik (dipakai mode hitung otomatis).
+
+`show_stats_panel` membuka jendela statistik profiling (lihat
+secant.profiling) yang bisa mengaktifkan profiling dan menyimpan trace.
+
+`prewarm` mengimpor modul berat (sympy, backend matplotlib) di thread
+latar setelah jendela pertama tampil, dan `report_startup` mengukur waktu
+sampai frame interaktif pertama untuk `python -m secant.bench startup`.
+"""
+
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from . import profiling
+
+
+class VirtualTable(ttk.Frame):
+    """Treeview dengan scrollbar sendiri yang hanya membuat baris yang terlihat."""
+
+    def __init__(self, master, columns, headings=None, widths=None, anchor='center',
+                 xscroll=False, **kwargs):
+        super().__init__(master, **kwargs)
+        headings = headings or columns
+        widths = widths or [100] * len(columns)
+
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', selectmode='browse')
+        for col, text, width in zip(columns, headings, widths):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, anchor=anchor)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        if xscroll:
+            xbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+            self.tree.configure(xscrollcommand=xbar.set)
+            xbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._count = 0
+        self._row = None
+        self._first = 0
+        self._items = []
+
+        self.tree.bind('<Configure>', lambda e: self.refresh())
+        self.tree.bind('<MouseWheel>', self._on_wheel)
+        self.tree.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units'))
+        self.tree.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units'))
+
+    def __len__(self):
+        return self._count
+
+    def set_rows(self, count, row):
+        """Tampilkan `count` baris; `row(i)` mengembalikan nilai kolom baris ke-i."""
+        self._count = count
+        self._row = row
+        self._first = 0
+        self.refresh()
+
+    def clear(self):
+        self.set_rows(0, None)
+
+    def _visible_rows(self):
+        style = ttk.Style(self)
+        rowheight = int(style.lookup('Treeview', 'rowheight') or 20)
+        # Tinggi heading kira-kira satu baris
+        return max(1, self.tree.winfo_height() // rowheight - 1)
+
+    @profiling.timed('table.refresh')
+    def refresh(self):
+        """Sinkronkan item Treeview dengan jendela baris yang sedang terlihat."""
+        visible = min(self._visible_rows(), self._count)
+        self._first = max(0, min(self._first, self._count - visible))
+
+        while len(self._items) < visible:
+            self._items.append(self.tree.insert('', tk.END))
+        while len(self._items) > visible:
+            self.tree.delete(self._items.pop())
+
+        for offset, item in enumerate(self._items):
+            self.tree.item(item, values=self._row(self._first + offset))
+
+        if self._count:
+            self.scrollbar.set(self._first / self._count,
+                               (self._first + visible) / self._count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def yview(self, *args):
+        visible = max(1, len(self._items))
+        if args[0] == 'moveto':
+            self._first = int(float(args[1]) * self._count)
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (visible if args[2] == 'pages' else 1)
+            self._first += step
+        self.tree.selection_set(())
+        self.refresh()
+
+    def _on_wheel(self, event):
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
+
+
+def insert_text_rows(widget, rows, tags=('even', 'odd'), batch=500, done=None):
+    """
+    Sisipkan baris teks ke widget Text dalam batch yang dijadwalkan dengan
+    `after_idle`. Baris diberi tag bergantian dari `tags` (tidak membuat tag
+    baru per baris). Mengembalikan fungsi untuk membatalkan sisa penyisipan.
+    """
+    rows = iter(rows)
+    state = {'index': 0, 'job': None}
+
+    def step():
+        chunk = []
+        for line in rows:
+            chunk.append(line)
+            if len(chunk) >= batch:
+                break
+        if not chunk:
+            state['job'] = None
+            if done is not None:
+                done()
+            return
+        with profiling.stage('table.insert'):
+            widget.config(state=tk.NORMAL)
+            for line in chunk:
+                widget.insert(tk.END, line, tags[state['index'] % len(tags)])
+                state['index'] += 1
+            widget.config(state=tk.DISABLED)
+        state['job'] = widget.after_idle(step)
+
+    def cancel():
+        if state['job'] is not None:
+            widget.after_cancel(state['job'])
+            state['job'] = None
+
+    step()
+    return cancel
+
+
+class Debouncer:
+    """
+    Panggil `func` sekali, `delay` ms setelah pemicu terakhir.
+
+    Setiap pemanggilan objek ini menjadwalkan ulang `func` dengan
+    `after`, sehingga rentetan ketikan hanya menghasilkan satu panggilan.
+    """
+
+    def __init__(self, widget, delay, func):
+        self.widget = widget
+        self.delay = delay
+        self.func = func
+        self._job = None
+
+    def __call__(self, *args):
+        self.cancel()
+        self._job = self.widget.after(self.delay, self._fire)
+
+    def _fire(self):
+        self._job = None
+        self.func()
+
+    def cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def bind(self, *widgets, sequence='<KeyRelease>'):
+        """Picu debouncer dari event `sequence` pada setiap widget."""
+        for widget in widgets:
+            widget.bind(sequence, self, add='+')
+
+
+# Modul yang sengaja tidak diimpor sebelum jendela pertama tampil
+DEFERRED_MODULES = ('sympy', 'matplotlib.figure', 'matplotlib.backends.backend_tkagg')
+
+STARTUP_ENV = 'SECANT_STARTUP_T0'
+
+
+def prewarm(widget, modules=DEFERRED_MODULES, delay=100, done=None, interval=50):
+    """
+    Impor `modules` di thread latar, `delay` ms setelah mainloop berjalan.
+
+    Jendela sudah tampil dan bisa dipakai selama impor berlangsung; klik
+    pertama yang butuh modul tersebut tinggal memakai modul yang sudah
+    dimuat (impor bersamaan dari thread lain aman, Python menunggu impor
+    yang sedang berjalan). `done()` dipanggil di thread Tk setelah semua
+    modul dimuat. Modul yang gagal diimpor dilewati; kesalahannya muncul
+    lagi saat modul itu benar-benar dipakai.
+    """
+    finished = threading.Event()
+
+    def work():
+        for name in modules:
+            try:
+                with profiling.stage(f'prewarm.{name}'):
+                    importlib.import_module(name)
+            except Exception:
+                pass
+        finished.set()
+
+    def poll():
+        if finished.is_set():
+            done()
+        else:
+            widget.after(interval, poll)
+
+    def start():
+        threading.Thread(target=work, name='secant-prewarm', daemon=True).start()
+        if done is not None:
+            widget.after(interval, poll)
+
+    widget.after(delay, start)
+
+
+def report_startup(master):
+    """
+    Mode benchmark startup: jika `SECANT_STARTUP_T0` (time.time() saat
+    proses diluncurkan) di-set, tulis waktu sampai frame interaktif pertama
+    sebagai JSON ke stdout lalu tutup jendela. Tanpa variabel itu tidak
+    melakukan apa-apa.
+
+    Frame dianggap interaktif setelah event Expose pertama dan semua
+    pekerjaan idle (geometri, gambar widget) yang mengantre sebelumnya
+    selesai, yaitu saat mainloop siap memproses masukan.
+    """
+    t0 = os.environ.get(STARTUP_ENV)
+    if t0 is None:
+        return
+    state = {'exposed': False}
+
+    def finish():
+        elapsed = (time.time() - float(t0)) * 1000
+        print(json.dumps({
+            'first_frame_ms': elapsed,
+            'loaded': [name for name in DEFERRED_MODULES if name in sys.modules],
+        }), flush=True)
+        master.destroy()
+
+    def exposed(event):
+        if not state['exposed']:
+            state['exposed'] = True
+            master.after_idle(finish)
+
+    master.bind('<Expose>', exposed, add='+')
+
+
+class StatsPanel(tk.Toplevel):
+    """Jendela yang menampilkan statistik profiling dan diperbarui berkala."""
+
+    def __init__(self, master, interval=500):
+        super().__init__(master)
+        self.title("Statistik Profiling")
+        self.interval = interval
+
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, padx=5, pady=5)
+        self.enabled = tk.BooleanVar(value=profiling.is_enabled())
+        ttk.Checkbutton(bar, text="Profiling aktif", variable=self.enabled,
+                        command=self._toggle).pack(side=tk.LEFT)
+        ttk.Button(bar, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(bar, text="Simpan Trace...", command=self._save_trace).pack(side=tk.LEFT)
+
+        self.text = tk.Text(self, width=56, height=16, font=('Courier', 9), state=tk.DISABLED)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+        self._job = None
+        self._update()
+
+    def _toggle(self):
+        if self.enabled.get():
+            profiling.enable()
+        else:
+            profiling.disable()
+
+    def _reset(self):
+        profiling.reset()
+        self._update()
+
+    def _save_trace(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json",
+                                            filetypes=[("Trace JSON", "*.json")],
+                                            title="Simpan Trace")
+        if path:
+            profiling.write_trace(path)
+
+    def _update(self):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        self.text.insert(tk.END, profiling.format_stats())
+        self.text.config(state=tk.DISABLED)
+        self._job = self.after(self.interval, self._update)
+
+    def destroy(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        super().destroy()
+
+
+def show_stats_panel(master):
+    """
+    Tampilkan panel statistik profiling untuk `master` (satu panel per
+    jendela; panel yang sudah terbuka dimunculkan kembali). Profiling
+    langsung diaktifkan.
+    """
+    panel = getattr(master, '_stats_panel', None)
+    if panel is not None and panel.winfo_exists():
+        panel.lift()
+        return panel
+    profiling.enable()
+    panel = master._stats_panel = StatsPanel(master)
+    return panel
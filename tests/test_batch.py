@@ -0,0 +1,50 @@
+import math
+
+import numpy as np
+
+from secant.batch import secant_batch
+from secant.engine import secant
+from secant.expression import make_function
+from secant.status import CONVERGED
+
+
+def _agree(expression, x0, x1, tol=1e-10, max_iter=100):
+    vector = make_function(expression, 'numpy')
+    scalar = make_function(expression, 'math')
+    batch = secant_batch(vector, x0, x1, tol, max_iter)
+    for i, (a, b) in enumerate(zip(x0, x1)):
+        expected = secant(scalar, a, b, tol, max_iter)
+        assert batch.status[i] == expected.status, (expression, a, b)
+        assert batch.iterations[i] == expected.iterations, (expression, a, b)
+        if math.isfinite(expected.root):
+            assert math.isclose(batch.roots[i], expected.root, rel_tol=1e-12, abs_tol=1e-15)
+            assert math.isclose(batch.fvals[i], expected.fx, rel_tol=1e-9, abs_tol=1e-15)
+
+
+def test_batch_matches_scalar():
+    _agree("x**3 + x**2 - 3*x - 3", [1.0, -3.0, 0.0, 5.0], [2.0, -2.0, 0.5, 6.0])
+    _agree("cos(x) - x", np.linspace(-2, 2, 7), np.linspace(-1, 3, 7))
+
+
+def test_batch_zero_divisor_reports_last_iterate():
+    # tanh mendatar: secant macet (pembagi nol) jauh dari x1 awal
+    vector = make_function("tanh(x)", 'numpy')
+    batch = secant_batch(vector, [3.0], [4.0])
+    expected = secant(make_function("tanh(x)", 'math'), 3.0, 4.0)
+    assert expected.status_name == 'zero_divisor'
+    assert batch.roots[0] == expected.root != 4.0
+    assert batch.fvals[0] == expected.fx
+    _agree("tanh(x)", [3.0, 0.5], [4.0, 1.0], tol=1e-6)
+
+
+def test_batch_broadcasts_lanes_and_parameters():
+    from secant.expression import make_parametric_function
+
+    f = make_parametric_function("x**2 - a", ("a",), 'numpy')
+    a = np.array([[1.0, 2.0], [4.0, 9.0]])
+    result = secant_batch(f, 1.0, 3.0, 1e-12, 100, args=[a])
+    assert result.roots.shape == a.shape
+    assert np.allclose(result.roots, np.sqrt(a), atol=1e-10)
+    assert (result.status == CONVERGED).all()
+    # Dua evaluasi awal per lane ditambah satu per iterasi per lane
+    assert result.evaluations == 2 * a.size + int(result.iterations.sum())
@@ -0,0 +1,21 @@
+from secant.bench import CORPUS, compare, run_benchmarks
+
+
+def _case(name):
+    return [case for case in CORPUS if case[0] == name]
+
+
+def test_false_convergence_is_not_counted():
+    report = run_benchmarks(['secant', 'hybrid'], _case('flat_power'), repeat=1)
+    status = {row['engine']: row['status'] for row in report['results']}
+    assert status == {'secant': 'false_root', 'hybrid': 'converged'}
+
+
+def test_compare_flags_status_and_evaluations():
+    base = run_benchmarks(['secant'], _case('quadratic'), repeat=1)
+    current = run_benchmarks(['secant'], _case('quadratic'), repeat=1)
+    assert compare(base, current, threshold=1e9) == []
+    current['results'][0].update(status='false_root', evaluations=99)
+    regressions = compare(base, current, threshold=1e9)
+    assert any('status' in line for line in regressions)
+    assert any('evaluations' in line for line in regressions)
@@ -0,0 +1,11 @@
+import json
+
+import pytest
+
+from secant.cli import main
+
+
+def test_diverged_output_is_valid_json(capsys):
+    assert main(["exp(x) - 1", "--x0", "-30", "--x1", "-29"]) == 1
+    data = json.loads(capsys.readouterr().out, parse_constant=lambda name: pytest.fail(name))
+    assert data['status'] == 'diverged' and data['fx'] is None
@@ -0,0 +1,50 @@
+import math
+
+from secant.engine import hybrid, solve
+
+
+def test_hybrid_numpy_backend():
+    # Backend numpy mengembalikan numpy.float64 dan perbandingannya numpy.bool_
+    result = solve("exp(x) - 2", 0.0, 1.0, 1e-10, method="hybrid", module="numpy")
+    assert result.converged
+    assert math.isclose(result.root, math.log(2), abs_tol=1e-9)
+
+
+def test_hybrid_numpy_bool_sign():
+    import numpy as np
+
+    result = hybrid(lambda x: np.float64(x) ** 2 - 2, 1.0, 2.0, 1e-12)
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), abs_tol=1e-11)
+
+
+def test_hybrid_stops_only_on_a_narrow_bracket():
+    # Langkah minimum Brent (~tol/2) tidak boleh dianggap konvergen
+    # selama bracket perubahan tanda masih lebar
+    for expression, x0, x1, root in (("(x - 1)**9", -3.0, 1.9, 1.0),
+                                     ("x**9", -1.0, 3.0, 0.0),
+                                     ("(x - 1)**3", 0.0, 3.0, 1.0)):
+        result = solve(expression, x0, x1, 1e-6, 500, method="hybrid")
+        assert result.converged, expression
+        assert abs(result.root - root) <= 1e-6, expression
+
+
+def test_math_backend_overflow_and_domain_diverge():
+    # Backend 'math' melempar OverflowError/ValueError di tempat numpy memberi inf/nan
+    for method in ("secant", "hybrid", "newton", "halley"):
+        result = solve("exp(x) - 1", -30.0, -29.0, method=method, module="math")
+        assert result.status_name == "diverged", method
+    result = solve("log(x) - 1", 0.1, 10.0, module="math")
+    assert result.status_name == "diverged"
+    assert math.isnan(result.fx)
+
+
+def test_fractional_power_of_negative_diverges():
+    # x**0.5 pada float negatif adalah complex di Python; backend 'math'
+    # memperlakukannya sebagai domain error seperti sqrt(x)
+    for expression in ("x**0.5 - 1", "x**(1/3) - besselj(0, x)", "sqrt(x) - 1"):
+        for method in ("secant", "hybrid", "newton"):
+            result = solve(expression, -3.0, -2.0, method=method, module="math")
+            assert result.status_name == "diverged", (expression, method)
+    result = solve("x**0.5 - 1", 0.5, 3.0, 1e-10, module="math")
+    assert result.converged and math.isclose(result.root, 1.0, abs_tol=1e-9)
@@ -0,0 +1,53 @@
+import csv
+
+import numpy as np
+import pytest
+
+from secant.engine import solve
+from secant.export import export_history
+from secant.history import COLUMNS
+
+
+def _history():
+    return solve("2*x**3 - x - exp(-x)", 0.1, 2.0, 1e-12).history
+
+
+def test_csv_round_trips_every_value(tmp_path):
+    history = _history()
+    path = tmp_path / "riwayat.csv"
+    export_history(history, path, chunk=3)
+    with open(path, newline='') as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ['step', *COLUMNS]
+    # Nilai ditulis dengan repr, jadi float-nya kembali persis
+    assert [(int(r[0]), *map(float, r[1:])) for r in rows[1:]] == list(history)
+
+
+def test_npy_structured_array(tmp_path):
+    history = _history()
+    path = tmp_path / "riwayat.npy"
+    export_history(history, path)
+    table = np.load(path)
+    assert table.dtype.names == ('step', *COLUMNS)
+    assert table['step'].tolist() == list(history.steps)
+    for name in COLUMNS:
+        assert table[name].tolist() == history.column(name).tolist()
+
+
+def test_npz_columns_subset_and_start(tmp_path):
+    history = _history()
+    path = tmp_path / "riwayat.npz"
+    export_history(history, path, columns=('x2', 'fx'), compress=True)
+    with np.load(path) as data:
+        assert sorted(data.files) == ['fx', 'start', 'step', 'x2']
+        assert data['start'].tolist() == [0.1, 2.0]
+        assert data['x2'].tolist() == history.column('x2').tolist()
+        assert data['fx'].tolist() == history.column('fx').tolist()
+
+
+def test_unknown_format_and_column(tmp_path):
+    history = _history()
+    with pytest.raises(ValueError):
+        export_history(history, tmp_path / "riwayat.xlsx")
+    with pytest.raises(ValueError):
+        export_history(history, tmp_path / "riwayat.csv", columns=('x3',))
@@ -0,0 +1,47 @@
+import pytest
+
+from secant.history import COLUMNS, IterationHistory
+
+
+def _history(rows=150):
+    # Lebih dari satu chunk (64) agar pertumbuhan kolom ikut teruji
+    history = IterationHistory(0.5, 1.5)
+    for i in range(rows):
+        history.append(i, i + 0.25, i + 0.5, -i, 1.0 / (i + 1))
+    return history
+
+
+def test_rows_and_columns():
+    history = _history()
+    assert len(history) == 150
+    assert history[0] == (1, 0.0, 0.25, 0.5, 0.0, 1.0)
+    assert history[-1] == (150, 149.0, 149.25, 149.5, -149.0, 1.0 / 150)
+    assert list(history)[3] == history[3]
+    assert list(history.steps) == list(range(1, 151))
+    assert history.column('x2').tolist() == [i + 0.5 for i in range(150)]
+    assert history.x_values().tolist()[:3] == [0.5, 1.5, 0.5]
+    with pytest.raises(IndexError):
+        history[150]
+
+
+def test_column_view_survives_growth():
+    history = IterationHistory()
+    history.append(1, 2, 3, 4, 5)
+    view = history.column('fx')
+    for _ in range(200):
+        history.append(0, 0, 0, 0, 0)
+    assert view.tolist() == [4.0]
+    assert len(history.column('fx')) == 201
+
+
+def test_bytes_round_trip_and_concat():
+    history = _history()
+    copy = IterationHistory.frombytes(history.tobytes(), *history.start)
+    assert copy.start == (0.5, 1.5)
+    assert list(copy) == list(history)
+    assert all(copy.column(name).tolist() == history.column(name).tolist() for name in COLUMNS)
+
+    joined = history.concat(_history(3))
+    assert len(joined) == 153
+    assert joined[150] == (151, 0.0, 0.25, 0.5, 0.0, 1.0)
+    assert joined.start == history.start
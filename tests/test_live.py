@@ -0,0 +1,37 @@
+from secant.engine import solve
+from secant.live import LiveSolver
+
+FUNCTION = "2*x**3 - x - exp(-x)"
+
+
+def test_tighter_tolerance_matches_a_fresh_run():
+    for method in ("secant", "newton"):
+        solver = LiveSolver()
+        solver.solve(FUNCTION, 0.1, 2.0, 1e-3, 100, method)
+        warm = solver.solve(FUNCTION, 0.1, 2.0, 1e-13, 100, method)
+        cold = solve(FUNCTION, 0.1, 2.0, 1e-13, 100, method=method)
+        assert warm.root == cold.root, method
+        assert warm.status == cold.status
+        assert warm.iterations == cold.iterations
+        assert list(warm.history) == list(cold.history)
+        # Pasangan iterate terakhir dievaluasi ulang saat melanjutkan
+        assert warm.evaluations == cold.evaluations + 2
+
+
+def test_cached_result_reused_when_it_already_meets_the_tolerance():
+    solver = LiveSolver()
+    first = solver.solve(FUNCTION, 0.1, 2.0, 1e-6)
+    error = first.history[-1][5]
+    # Toleransi lebih ketat tetapi masih di atas error langkah terakhir
+    tighter = (error + 1e-6) / 2
+    assert solver.solve(FUNCTION, 0.1, 2.0, tighter) is first
+    assert solver.solve(FUNCTION, 0.1, 2.0, tighter) is first
+
+
+def test_other_inputs_solve_from_scratch():
+    solver = LiveSolver()
+    solver.solve(FUNCTION, 0.1, 2.0, 1e-3)
+    result = solver.solve(FUNCTION, 0.2, 2.0, 1e-10)
+    cold = solve(FUNCTION, 0.2, 2.0, 1e-10)
+    assert result.evaluations == cold.evaluations
+    assert list(result.history) == list(cold.history)
@@ -0,0 +1,45 @@
+from secant.engine import solve
+from secant.memo import ResultStore
+
+
+def test_memory_hits_and_misses():
+    store = ResultStore()
+    first = store.solve("x**2 - 2", 1.0, 2.0, 1e-10)
+    # Format ekspresi berbeda, kunci kanonik sama
+    assert store.solve("x ** 2 - 2", 1, 2, 1e-10) is first
+    store.solve("x**2 - 3", 1.0, 2.0, 1e-10)
+    info = store.info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 2, 2)
+    assert first.root == solve("x**2 - 2", 1.0, 2.0, 1e-10).root
+
+
+def test_disk_tier_is_shared_between_stores(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    store = ResultStore(path=path)
+    first = store.solve("x**2 - 2", 1.0, 2.0, 1e-10)
+    info = store.info()
+    store.close()
+
+    for _ in range(3):
+        again = ResultStore(path=path)
+        result = again.solve("x**2 - 2", 1.0, 2.0, 1e-10)
+        assert (result.root, result.iterations, result.status) == \
+            (first.root, first.iterations, first.status)
+        assert list(result.history) == list(first.history)
+        # Hit dari disk tidak menulis ulang maupun menambah ukuran
+        assert again.info()['disk_hits'] == 1
+        assert again.info()['disk_entries'] == info['disk_entries'] == 1
+        assert again.info()['disk_bytes'] == info['disk_bytes']
+        again.close()
+
+
+def test_disk_size_limit(tmp_path):
+    store = ResultStore(path=str(tmp_path / 'cache.db'), max_bytes=2000)
+    for a in range(2, 30):
+        store.solve(f"x**2 - {a}", 1.0, 6.0, 1e-12)
+    info = store.info()
+    assert 0 < info['disk_bytes'] <= info['disk_max_bytes'] == 2000
+    assert info['disk_entries'] < 28
+    store.clear()
+    assert store.info()['disk_entries'] == store.info()['disk_bytes'] == 0
+    store.close()
@@ -0,0 +1,28 @@
+import io
+import json
+
+import pytest
+
+from secant.pipeline import dumps_json, read_jobs, solve_jobs, write_results
+
+
+def test_malformed_jsonl_lines_become_error_rows():
+    text = '{"function": "x**2 - 2", "x0": 1, "x1": 2}\n{bad json\n[1, 2]\n\n' \
+           '{"function": "x - 1", "x0": 0, "x1": 2}\n'
+    rows = list(solve_jobs(read_jobs(io.StringIO(text), 'jsonl')))
+    assert [row['status'] for row in rows] == ['converged', 'error', 'error', 'converged']
+    assert rows[1]['message'].startswith('Baris 2:')
+    assert rows[2]['message'].startswith('Baris 3:')
+
+
+def test_non_finite_values_serialize_as_null():
+    payload = json.loads(dumps_json({'root': float('nan'), 'history': [[1.0, float('inf')]]}))
+    assert payload == {'root': None, 'history': [[1.0, None]]}
+
+
+def test_diverged_rows_are_valid_jsonl():
+    jobs = read_jobs(io.StringIO('{"function": "exp(x) - 1", "x0": -30, "x1": -29}\n'), 'jsonl')
+    out = io.StringIO()
+    write_results(solve_jobs(jobs), out, 'jsonl')
+    row = json.loads(out.getvalue(), parse_constant=lambda name: pytest.fail(name))
+    assert row['status'] == 'diverged' and row['fx'] is None
@@ -0,0 +1,32 @@
+import mpmath
+
+from secant.engine import solve
+from secant.precision import FLOAT_TOL, format_precise, needs_escalation, solve_precise
+from secant.status import CONVERGED
+
+
+def test_escalation_trigger():
+    assert needs_escalation(1e-13)
+    assert needs_escalation(1e-6, ftol=1e-20)
+    assert not needs_escalation(1e-6)
+    assert not needs_escalation(FLOAT_TOL)
+
+
+def test_float_tolerance_matches_solve():
+    precise = solve_precise("x**2 - 2", 1, 2, 1e-10)
+    plain = solve("x**2 - 2", 1, 2, 1e-10)
+    assert isinstance(precise.root, float)
+    fields = ('root', 'fx', 'iterations', 'evaluations', 'status')
+    assert [getattr(precise, n) for n in fields] == [getattr(plain, n) for n in fields]
+    assert list(precise.history) == list(plain.history)
+
+
+def test_tolerance_below_float64_reaches_mpmath_accuracy():
+    result = solve_precise("x**2 - 2", 1, 2, 1e-30)
+    assert result.status == CONVERGED
+    assert isinstance(result.root, mpmath.mpf)
+    with mpmath.mp.workdps(40):
+        assert abs(result.root - mpmath.sqrt(2)) < mpmath.mpf('1e-30')
+    # Riwayat mencakup langkah float64 dan langkah mpmath
+    assert result.iterations == len(result.history)
+    assert format_precise(result.root, 1e-30).startswith('1.41421356237309504880168872')
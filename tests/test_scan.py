@@ -0,0 +1,29 @@
+import math
+
+import numpy as np
+import pytest
+
+from secant.expression import make_function
+from secant.scan import find_roots
+
+
+def test_sin_roots():
+    result = find_roots(make_function("sin(x)", 'numpy'), -1.0, 10.0)
+    assert np.allclose(result.roots, [0.0, math.pi, 2 * math.pi, 3 * math.pi], atol=1e-10)
+    assert np.all(np.abs(result.fvals) < 1e-10)
+    # Satu bracket per akar, akar berada di dalam bracket-nya
+    assert result.brackets.shape == (4, 2)
+    assert np.all((result.brackets[:, 0] <= result.roots) & (result.roots <= result.brackets[:, 1]))
+
+
+def test_tan_poles_are_discarded():
+    # tan berganti tanda di kutub pi/2 + k*pi; hanya k*pi yang akar
+    result = find_roots(make_function("tan(x)", 'numpy'), -1.0, 7.0)
+    assert np.allclose(result.roots, [0.0, math.pi, 2 * math.pi], atol=1e-10)
+
+
+def test_no_roots_and_invalid_interval():
+    f = make_function("x**2 + 1", 'numpy')
+    assert find_roots(f, -5.0, 5.0).roots.size == 0
+    with pytest.raises(ValueError):
+        find_roots(f, 1.0, 1.0)
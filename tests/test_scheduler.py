@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+from secant.scheduler import CancelToken, Cancelled, SolveScheduler
+
+
+class FakeWidget:
+    """Pengganti widget Tk: `after` hanya mengantrekan callback."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay, func):
+        self.pending.append(func)
+        return len(self.pending)
+
+    def after_cancel(self, job):
+        pass
+
+    def pump(self, until, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            pending, self.pending = self.pending, []
+            for func in pending:
+                func()
+            time.sleep(0.001)
+        assert until()
+
+
+def test_latest_submit_wins_and_cancels_running_job():
+    widget = FakeWidget()
+    scheduler = SolveScheduler(widget, interval=1)
+    started = threading.Event()
+    stopped = threading.Event()
+    done, errors = [], []
+
+    def slow(token):
+        started.set()
+        try:
+            while True:
+                token.callback(1, 0.0, 0.0, 0.0)
+                time.sleep(0.001)
+        finally:
+            stopped.set()
+
+    scheduler.submit(slow, done.append, errors.append)
+    assert started.wait(5)
+    scheduler.submit(lambda token: 'second', done.append, errors.append)
+    widget.pump(lambda: done)
+
+    assert stopped.wait(5)
+    assert done == ['second'] and errors == []
+    assert not scheduler.busy
+
+
+def test_errors_and_progress_reach_the_tk_thread():
+    widget = FakeWidget()
+    scheduler = SolveScheduler(widget, interval=1)
+    release = threading.Event()
+    progress, errors = [], []
+
+    def failing(token):
+        token.callback(3, 1.5, 0.25, 0.01)
+        release.wait(5)
+        raise ValueError("gagal")
+
+    scheduler.submit(failing, lambda result: None, errors.append,
+                     lambda *args: progress.append(args))
+    widget.pump(lambda: progress)
+    release.set()
+    widget.pump(lambda: errors)
+    assert progress[0] == (3, 1.5, 0.25, 0.01)
+    assert str(errors[0]) == "gagal"
+
+
+def test_cancel_drops_the_result():
+    widget = FakeWidget()
+    scheduler = SolveScheduler(widget, interval=1)
+    release = threading.Event()
+    done = []
+    scheduler.submit(lambda token: release.wait(5) and 'late', done.append)
+    scheduler.cancel()
+    release.set()
+    time.sleep(0.05)
+    for func in widget.pending:
+        func()
+    assert done == [] and not scheduler.busy
+
+
+def test_cancel_token():
+    token = CancelToken()
+    token.callback(1, 2.0, 3.0, 4.0)
+    assert token.progress == (1, 2.0, 3.0, 4.0)
+    token.cancel()
+    with pytest.raises(Cancelled):
+        token.callback(2, 0.0, 0.0, 0.0)
@@ -0,0 +1,44 @@
+import asyncio
+import math
+
+from secant.pipeline import dumps_json
+from secant.server import SolveServer
+
+
+def test_lone_and_batched_jobs_agree():
+    async def run():
+        server = SolveServer()
+        job = {"function": "exp(x) - 1", "x0": -30, "x1": -29}
+        alone = await server.handle_job(dict(job))
+        batched = await asyncio.gather(*(server.handle_job(dict(job)) for _ in range(4)))
+        return alone, batched[0]
+
+    alone, batched = asyncio.run(run())
+    batched['batch'] = alone['batch']
+    assert dumps_json(alone) == dumps_json(batched)
+    assert alone['status'] == 'diverged'
+
+
+def test_batch_and_history_paths_agree():
+    async def run():
+        server = SolveServer()
+        job = {"function": "tanh(x)", "x0": 3, "x1": 4}
+        plain = await server.handle_job(dict(job))
+        detailed = await server.handle_job(dict(job, history=True))
+        return plain, detailed
+
+    plain, detailed = asyncio.run(run())
+    assert plain['status'] == detailed['status'] == 'zero_divisor'
+    assert plain['iterations'] == detailed['iterations']
+    assert math.isclose(plain['root'], detailed['root'], rel_tol=1e-12)
+
+
+def test_equivalent_expressions_share_a_batch():
+    async def run():
+        server = SolveServer()
+        return await asyncio.gather(
+            server.handle_job({"function": "x**2 - 2", "x0": 1, "x1": 2}),
+            server.handle_job({"function": "x**2-2", "x0": 1, "x1": 2}))
+
+    first, second = asyncio.run(run())
+    assert first['batch'] == second['batch'] == 2
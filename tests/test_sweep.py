@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from secant.status import CONVERGED
+from secant.sweep import sweep
+
+FUNCTION = "x**3 + x - a*b"
+
+
+def _params():
+    return {'a': np.linspace(1.0, 3.0, 4), 'b': np.linspace(0.5, 4.0, 200)}
+
+
+def test_continuation_matches_independent_solves():
+    warm = sweep(FUNCTION, _params(), 0.0, 1.0, tol=1e-12)
+    cold = sweep(FUNCTION, _params(), 0.0, 1.0, tol=1e-12, continuation=False)
+    assert warm.roots.shape == cold.roots.shape == (4, 200)
+    assert (warm.status == CONVERGED).all() and (cold.status == CONVERGED).all()
+    np.testing.assert_allclose(warm.roots, cold.roots, rtol=0, atol=1e-10)
+    product = warm.params['a'] * warm.params['b']
+    np.testing.assert_allclose(warm.roots**3 + warm.roots, product, rtol=1e-10)
+    # Tebakan dari titik sebelumnya memangkas jumlah iterasi
+    assert warm.iterations.sum() < cold.iterations.sum()
+
+
+def test_one_dimensional_grid_is_split_into_chains():
+    params = {'a': np.linspace(1.0, 10.0, 500)}
+    warm = sweep("x**2 - a", params, 1.0, 2.0, tol=1e-12)
+    np.testing.assert_allclose(warm.roots, np.sqrt(params['a']), rtol=1e-12)
+    assert warm.roots.shape == (500,)
+
+
+def test_invalid_params():
+    with pytest.raises(ValueError):
+        sweep(FUNCTION, {}, 0.0, 1.0)
+    with pytest.raises(ValueError):
+        sweep(FUNCTION, {'a': [], 'b': [1.0]}, 0.0, 1.0)